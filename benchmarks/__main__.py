@@ -0,0 +1,121 @@
+"""Run all the benchmarks and save the results, or compare the results of two
+commits.
+
+    python -m benchmarks run -o .benchmarks/before.json
+    python -m benchmarks run -b "Surrogate|Archive" -o .benchmarks/after.json
+    python -m benchmarks compare .benchmarks/before.json .benchmarks/after.json
+
+By default, the results are saved in ``.benchmarks/<commit>.json``. compare exits
+with status 1 if any benchmark regressed by more than the given factor. Timings
+are only comparable between runs on the same machine.
+
+"""
+
+import argparse
+import importlib
+import inspect
+import os
+import pkgutil
+import sys
+
+from benchmarks.common import (
+    _PREFIXES,
+    compare_results,
+    environment,
+    load_results,
+    print_comparison,
+    run_benchmarks,
+    save_results,
+)
+
+
+def discover_benchmarks(module_pattern: str = None) -> list:
+    """Import the ``bench_*`` modules of this package and collect the benchmark
+    classes defined in them.
+
+    Args:
+        module_pattern (str, optional): Only import the modules whose name contains
+            this string. Defaults to None, which imports all of them.
+
+    Returns:
+        list: The benchmark classes, ordered by module and name.
+
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    bench_classes = []
+    for module_info in sorted(pkgutil.iter_modules([directory]), key=lambda m: m.name):
+        if not module_info.name.startswith("bench_"):
+            continue
+        if module_pattern is not None and module_pattern not in module_info.name:
+            continue
+        module = importlib.import_module(f"benchmarks.{module_info.name}")
+        for _, member in inspect.getmembers(module, inspect.isclass):
+            if member.__module__ != module.__name__:
+                continue
+            if any(name.startswith(_PREFIXES) for name in dir(member)):
+                bench_classes.append(member)
+    return bench_classes
+
+
+def _run(args) -> int:
+    bench_classes = discover_benchmarks(args.module)
+    results = run_benchmarks(*bench_classes, repeat=args.repeat, pattern=args.bench)
+    output = args.output
+    if output is None:
+        commit = environment()["commit"] or "results"
+        output = os.path.join(".benchmarks", f"{commit[:12]}.json")
+    save_results(results, output)
+    print(f"Saved the results in {output}")
+    return 0
+
+
+def _compare(args) -> int:
+    old, new = load_results(args.old), load_results(args.new)
+    if old["environment"].get("node") != new["environment"].get("node"):
+        print("Warning: the results were measured on different machines")
+    comparison = compare_results(old, new, factor=args.factor)
+    print_comparison(comparison, only_changed=not args.all)
+    regressions = [entry for entry in comparison if entry["status"] == "regression"]
+    print(f"{len(comparison)} benchmarks compared, {len(regressions)} regressions")
+    return 1 if regressions else 0
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    run = subparsers.add_parser("run", help="run the benchmarks and save the results")
+    run.add_argument(
+        "-m", "--module", help="only run the modules whose name contains this"
+    )
+    run.add_argument(
+        "-b", "--bench", help="only run the methods matching this regular expression"
+    )
+    run.add_argument(
+        "-r", "--repeat", type=int, help="number of runs of each time_ method"
+    )
+    run.add_argument("-o", "--output", help="the JSON file to save the results in")
+    run.set_defaults(func=_run)
+
+    compare = subparsers.add_parser("compare", help="compare two saved results")
+    compare.add_argument("old", help="the JSON file of the baseline")
+    compare.add_argument("new", help="the JSON file to compare to the baseline")
+    compare.add_argument(
+        "-f",
+        "--factor",
+        type=float,
+        default=1.1,
+        help="smallest ratio reported as a change (default 1.1)",
+    )
+    compare.add_argument(
+        "-a", "--all", action="store_true", help="also list the unchanged benchmarks"
+    )
+    compare.set_defaults(func=_compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
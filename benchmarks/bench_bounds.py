@@ -0,0 +1,49 @@
+"""Per-call overhead of MOProblem.evaluate versus the number of variables, for a
+single decision vector and a cheap objective. The bounds used to be rebuilt from
+the Variable objects on every call; time_bounds_from_variables measures that
+reference cost.
+
+Run with ``python -m benchmarks.bench_bounds``.
+
+"""
+
+import numpy as np
+
+from desdeo_problem.Objective import _ScalarObjective
+from desdeo_problem.Problem import MOProblem
+from desdeo_problem.Variable import variable_builder
+
+
+def sum_of_squares(x: np.ndarray) -> np.ndarray:
+    return np.sum(x ** 2, axis=1)
+
+
+class EvaluateOverhead:
+    params = ([10, 100, 1000, 10000],)
+    param_names = ["n_of_variables"]
+
+    def setup(self, n_of_variables):
+        names = [f"x{i}" for i in range(n_of_variables)]
+        variables = variable_builder(
+            names,
+            np.zeros(n_of_variables),
+            -np.ones(n_of_variables),
+            np.ones(n_of_variables),
+        )
+        self.problem = MOProblem([_ScalarObjective("f1", sum_of_squares)], variables)
+        self.decision_vector = np.zeros(n_of_variables)
+
+    def time_evaluate(self, n_of_variables):
+        for _ in range(100):
+            self.problem.evaluate(self.decision_vector)
+
+    def time_bounds_from_variables(self, n_of_variables):
+        for _ in range(100):
+            np.array([var.get_bounds()[0] for var in self.problem.variables])
+            np.array([var.get_bounds()[1] for var in self.problem.variables])
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+
+    run_benchmarks(EvaluateOverhead)
@@ -0,0 +1,63 @@
+"""Constraint evaluation versus the number of constraints made with
+constraint_function_factory, for a population of decision vectors.
+time_block evaluates them with a ConstraintBlock, as MOProblem.evaluate does.
+time_one_by_one measures the reference cost of evaluating the constraints one by
+one with ScalarConstraint.evaluate.
+
+Run with ``python -m benchmarks.bench_constraints``.
+
+"""
+
+import numpy as np
+
+from desdeo_problem.Constraint import (
+    ConstraintBlock,
+    ScalarConstraint,
+    constraint_function_factory,
+)
+
+
+def weighted_sum(weights: np.ndarray):
+    def lhs(decision_vectors: np.ndarray, objective_vectors: np.ndarray):
+        return decision_vectors @ weights
+
+    return lhs
+
+
+class ConstraintEvaluation:
+    params = ([10, 100, 1000], [100, 10000])
+    param_names = ["n_of_constraints", "n_of_rows"]
+
+    def setup(self, n_of_constraints, n_of_rows):
+        operators = ["<", ">", "=="]
+        rng = np.random.default_rng(0)
+        self.constraints = [
+            ScalarConstraint(
+                f"c{i}",
+                10,
+                2,
+                constraint_function_factory(
+                    weighted_sum(rng.random(10)), i / 10, operators[i % 3]
+                ),
+            )
+            for i in range(n_of_constraints)
+        ]
+        self.block = ConstraintBlock(self.constraints)
+        self.decision_vectors = rng.random((n_of_rows, 10))
+        self.objective_vectors = rng.random((n_of_rows, 2))
+
+    def time_block(self, n_of_constraints, n_of_rows):
+        self.block.evaluate(self.decision_vectors, self.objective_vectors)
+
+    def time_one_by_one(self, n_of_constraints, n_of_rows):
+        constraint_values = np.ndarray((n_of_rows, n_of_constraints), dtype=float)
+        for (col_i, constraint) in enumerate(self.constraints):
+            constraint_values[:, col_i] = np.array(
+                constraint.evaluate(self.decision_vectors, self.objective_vectors)
+            )
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+
+    run_benchmarks(ConstraintEvaluation)
@@ -0,0 +1,59 @@
+"""Wall-clock scaling of MOProblem.evaluate with the number of workers. Each
+objective sleeps to mimic an external simulator.
+
+Run with ``python -m benchmarks.bench_executor``.
+
+"""
+
+import time
+
+import numpy as np
+
+from desdeo_problem.Executor import ProcessExecutor, SerialExecutor, ThreadExecutor
+from desdeo_problem.Objective import _ScalarObjective
+from desdeo_problem.Problem import MOProblem
+from desdeo_problem.Variable import variable_builder
+
+SIMULATOR_DELAY = 0.01  # seconds per call
+
+
+def slow_sum(x: np.ndarray) -> np.ndarray:
+    time.sleep(SIMULATOR_DELAY)
+    return np.sum(x, axis=1)
+
+
+def build_problem(executor) -> MOProblem:
+    variables = variable_builder(
+        ["x1", "x2", "x3"], [0.5] * 3, lower_bounds=[0] * 3, upper_bounds=[1] * 3
+    )
+    objectives = [_ScalarObjective(f"f{i + 1}", slow_sum) for i in range(5)]
+    return MOProblem(objectives, variables, executor=executor)
+
+
+class EvaluateExecutor:
+    params = (["serial", "thread", "process"], [1, 2, 4, 8])
+    param_names = ["executor", "n_workers"]
+    executors = {
+        "serial": SerialExecutor,
+        "thread": ThreadExecutor,
+        "process": ProcessExecutor,
+    }
+
+    def setup(self, executor, n_workers):
+        self.executor = self.executors[executor](n_workers=n_workers, chunk_size=10)
+        self.problem = build_problem(self.executor)
+        self.population = np.random.rand(100, 3)
+        # Warm up the pool so that starting the workers is not measured
+        self.problem.evaluate(self.population)
+
+    def teardown(self, executor, n_workers):
+        self.executor.shutdown()
+
+    def time_evaluate(self, executor, n_workers):
+        self.problem.evaluate(self.population)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+
+    run_benchmarks(EvaluateExecutor)
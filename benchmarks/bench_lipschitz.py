@@ -0,0 +1,44 @@
+"""Runtime and peak memory of fitting and predicting with the LipschitzianRegressor
+versus the number of training samples. The distances are computed in blocks that
+fit in memory_budget, so the peak memory grows linearly with the number of
+samples. The peak memory is the peak resident set size of a process forked after
+the setup, so it includes the interpreter and the samples themselves.
+
+Run with ``python -m benchmarks.bench_lipschitz``.
+
+"""
+
+import numpy as np
+
+from desdeo_problem.surrogatemodels.lipschitzian import LipschitzianRegressor
+
+
+class LipschitzScaling:
+    params = ([1000, 5000, 20000],)
+    param_names = ["n_of_samples"]
+
+    def setup(self, n_of_samples):
+        rng = np.random.default_rng(0)
+        self.X = rng.random((n_of_samples, 10))
+        self.y = np.sum(np.sin(3 * self.X), axis=1)
+        self.X_new = rng.random((1000, 10))
+        self.model = LipschitzianRegressor(memory_budget=64 * 2 ** 20)
+        self.model.fit(self.X, self.y)
+
+    def time_fit(self, n_of_samples):
+        LipschitzianRegressor(memory_budget=64 * 2 ** 20).fit(self.X, self.y)
+
+    def peakmem_fit(self, n_of_samples):
+        LipschitzianRegressor(memory_budget=64 * 2 ** 20).fit(self.X, self.y)
+
+    def time_predict(self, n_of_samples):
+        self.model.predict(self.X_new)
+
+    def peakmem_predict(self, n_of_samples):
+        self.model.predict(self.X_new)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+
+    run_benchmarks(LipschitzScaling, repeat=1)
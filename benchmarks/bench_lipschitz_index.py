@@ -0,0 +1,48 @@
+"""Prediction time of the LipschitzianRegressor with and without the index of
+KD-trees, versus the number of training samples. The Lipschitz constant is
+estimated once on a subset of the samples and fixed in the models, so that fitting
+the larger models only builds the index. The predictions of both modes are the
+same.
+
+Run with ``python -m benchmarks.bench_lipschitz_index``.
+
+"""
+
+import numpy as np
+
+from desdeo_problem.surrogatemodels.lipschitzian import LipschitzianRegressor
+
+
+def response(X: np.ndarray) -> np.ndarray:
+    return np.sum(np.sin(3 * X), axis=1)
+
+
+class IndexedPredict:
+    params = ([10000, 100000, 1000000], [2, 4])
+    param_names = ["n_of_samples", "n_of_variables"]
+
+    def setup(self, n_of_samples, n_of_variables):
+        rng = np.random.default_rng(0)
+        X = rng.random((n_of_samples, n_of_variables))
+        y = response(X)
+        estimate = LipschitzianRegressor()
+        estimate.fit(X[:2000], y[:2000])
+        self.brute_force = LipschitzianRegressor(L=estimate.L, fixed_L=True)
+        self.brute_force.fit(X, y)
+        self.indexed = LipschitzianRegressor(
+            L=estimate.L, fixed_L=True, use_index=True
+        )
+        self.indexed.fit(X, y)
+        self.X_new = rng.random((1000, n_of_variables))
+
+    def time_brute_force(self, n_of_samples, n_of_variables):
+        self.brute_force.predict(self.X_new)
+
+    def time_indexed(self, n_of_samples, n_of_variables):
+        self.indexed.predict(self.X_new)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+
+    run_benchmarks(IndexedPredict, repeat=1)
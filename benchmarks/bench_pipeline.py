@@ -0,0 +1,180 @@
+"""The evaluation pipeline of the problem classes across population sizes, variable
+counts and objective counts. These are the figures to track between releases with
+``python -m benchmarks run`` and ``python -m benchmarks compare``:
+
+- AnalyticEvaluate: MOProblem.evaluate of the vectorized DTLZ2.
+- ConstrainedEvaluate: MOProblem.evaluate of DTLZ2 with linear constraints on the
+  decision and objective vectors, without and with EvaluationStats attached.
+- SurrogateFitPredict: DataProblem.train and surrogate evaluation with one
+  LipschitzianRegressor for each objective.
+- ArchiveGrowth: true evaluations of a VectorDataObjective in batches, each of
+  which is appended to its training samples.
+
+Run with ``python -m benchmarks.bench_pipeline``.
+
+"""
+
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from desdeo_problem.Constraint import ScalarConstraint, constraint_function_factory
+from desdeo_problem.Objective import VectorDataObjective, VectorObjective
+from desdeo_problem.Problem import DataProblem, MOProblem
+from desdeo_problem.Stats import EvaluationStats
+from desdeo_problem.surrogatemodels.lipschitzian import LipschitzianRegressor
+from desdeo_problem.testproblems.DTLZ import dtlz2
+from desdeo_problem.Variable import VariableSet
+
+
+def dtlz2_problem(
+    n_of_variables: int, n_of_objectives: int, constraints: list = None
+) -> MOProblem:
+    objective = VectorObjective(
+        [f"f{i}" for i in range(n_of_objectives)],
+        partial(dtlz2, n_of_objectives=n_of_objectives),
+    )
+    variables = VariableSet(
+        [f"x{i}" for i in range(n_of_variables)],
+        lower_bounds=np.zeros(n_of_variables),
+        upper_bounds=np.ones(n_of_variables),
+    )
+    return MOProblem([objective], variables, constraints)
+
+
+def linear_constraint(weights: np.ndarray, objective_weights: np.ndarray):
+    def lhs(decision_vectors: np.ndarray, objective_vectors: np.ndarray):
+        return decision_vectors @ weights + objective_vectors @ objective_weights
+
+    return lhs
+
+
+class AnalyticEvaluate:
+    params = ([10, 1000, 100000], [10, 100], [2, 5])
+    param_names = ["n_of_rows", "n_of_variables", "n_of_objectives"]
+
+    def setup(self, n_of_rows, n_of_variables, n_of_objectives):
+        self.problem = dtlz2_problem(n_of_variables, n_of_objectives)
+        rng = np.random.default_rng(0)
+        self.decision_vectors = rng.random((n_of_rows, n_of_variables))
+
+    def time_evaluate(self, n_of_rows, n_of_variables, n_of_objectives):
+        self.problem.evaluate(self.decision_vectors)
+
+    def peakmem_evaluate(self, n_of_rows, n_of_variables, n_of_objectives):
+        self.problem.evaluate(self.decision_vectors)
+
+
+class ConstrainedEvaluate:
+    params = ([10, 1000, 100000], [1, 10, 100])
+    param_names = ["n_of_rows", "n_of_constraints"]
+
+    def setup(self, n_of_rows, n_of_constraints):
+        n_of_variables, n_of_objectives = 10, 3
+        rng = np.random.default_rng(0)
+        operators = ["<", ">", "=="]
+        constraints = [
+            ScalarConstraint(
+                f"c{i}",
+                n_of_variables,
+                n_of_objectives,
+                constraint_function_factory(
+                    linear_constraint(
+                        rng.random(n_of_variables), rng.random(n_of_objectives)
+                    ),
+                    1.0,
+                    operators[i % 3],
+                ),
+            )
+            for i in range(n_of_constraints)
+        ]
+        self.problem = dtlz2_problem(n_of_variables, n_of_objectives, constraints)
+        self.instrumented = dtlz2_problem(n_of_variables, n_of_objectives, constraints)
+        self.instrumented.stats = EvaluationStats()
+        self.decision_vectors = rng.random((n_of_rows, n_of_variables))
+
+    def time_evaluate(self, n_of_rows, n_of_constraints):
+        self.problem.evaluate(self.decision_vectors)
+
+    def time_evaluate_with_stats(self, n_of_rows, n_of_constraints):
+        self.instrumented.evaluate(self.decision_vectors)
+
+
+class SurrogateFitPredict:
+    params = ([100, 1000, 4000], [5, 20], [2, 5])
+    param_names = ["n_of_samples", "n_of_variables", "n_of_objectives"]
+    repeat = 1
+
+    def setup(self, n_of_samples, n_of_variables, n_of_objectives):
+        rng = np.random.default_rng(0)
+        X = rng.random((n_of_samples, n_of_variables))
+        y = dtlz2(X, n_of_objectives)
+        variable_names = [f"x{i}" for i in range(n_of_variables)]
+        objective_names = [f"f{i}" for i in range(n_of_objectives)]
+        data = pd.DataFrame(np.hstack((X, y)), columns=variable_names + objective_names)
+        maximize = pd.DataFrame([[False] * n_of_objectives], columns=objective_names)
+        self.problem = DataProblem(
+            data, variable_names, objective_names, maximize=maximize
+        )
+        self.trained = DataProblem(
+            data, variable_names, objective_names, maximize=maximize
+        )
+        self.trained.train(LipschitzianRegressor)
+        self.decision_vectors = rng.uniform(0.1, 0.9, (1000, n_of_variables))
+
+    def time_train(self, n_of_samples, n_of_variables, n_of_objectives):
+        self.problem.train(LipschitzianRegressor)
+
+    def time_predict(self, n_of_samples, n_of_variables, n_of_objectives):
+        self.trained.evaluate(self.decision_vectors, use_surrogate=True)
+
+
+class ArchiveGrowth:
+    params = ([1, 100], [100, 1000])
+    param_names = ["batch_size", "n_of_batches"]
+    repeat = 1
+
+    def setup(self, batch_size, n_of_batches):
+        n_of_variables, n_of_objectives = 10, 3
+        rng = np.random.default_rng(0)
+        X = rng.random((100, n_of_variables))
+        self.variable_names = [f"x{i}" for i in range(n_of_variables)]
+        self.objective_names = [f"f{i}" for i in range(n_of_objectives)]
+        self.data = pd.DataFrame(
+            np.hstack((X, dtlz2(X, n_of_objectives))),
+            columns=self.variable_names + self.objective_names,
+        )
+        self.evaluator = partial(dtlz2, n_of_objectives=n_of_objectives)
+        self.batches = rng.random((n_of_batches, batch_size, n_of_variables))
+
+    def _problem(self) -> MOProblem:
+        objective = VectorDataObjective(
+            self.objective_names, self.data, evaluator=self.evaluator
+        )
+        n_of_variables = len(self.variable_names)
+        variables = VariableSet(
+            self.variable_names,
+            lower_bounds=np.zeros(n_of_variables),
+            upper_bounds=np.ones(n_of_variables),
+        )
+        return MOProblem([objective], variables)
+
+    def time_true_evaluations(self, batch_size, n_of_batches):
+        problem = self._problem()
+        for batch in self.batches:
+            problem.evaluate(batch)
+
+    def track_n_of_samples(self, batch_size, n_of_batches):
+        problem = self._problem()
+        for batch in self.batches:
+            problem.evaluate(batch)
+        return len(problem.objectives[0].samples)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+
+    run_benchmarks(
+        AnalyticEvaluate, ConstrainedEvaluate, SurrogateFitPredict, ArchiveGrowth
+    )
@@ -0,0 +1,41 @@
+"""Sequential appends to the training data of a data objective: growing the arrays
+with np.vstack on every append versus the capacity-doubling SampleArchive.
+
+Run with ``python -m benchmarks.bench_sample_archive``.
+
+"""
+
+import numpy as np
+
+from desdeo_problem.Archive import SampleArchive
+
+N_OF_VARIABLES = 5
+
+
+class SequentialAppends:
+    params = ([1000, 10000, 100000],)
+    param_names = ["n_appends"]
+    repeat = 1
+    timeout = 600
+
+    def setup(self, n_appends):
+        self.rows = np.random.rand(n_appends, N_OF_VARIABLES)
+        self.values = np.random.rand(n_appends)
+
+    def time_vstack(self, n_appends):
+        X = np.empty((0, N_OF_VARIABLES))
+        y = np.empty((0, 1))
+        for row, value in zip(self.rows, self.values):
+            X = np.vstack((X, row))
+            y = np.vstack((y, value))
+
+    def time_sample_archive(self, n_appends):
+        archive = SampleArchive(np.empty((0, N_OF_VARIABLES)), np.empty(0))
+        for row, value in zip(self.rows, self.values):
+            archive.append(row, value)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+
+    run_benchmarks(SequentialAppends, repeat=1)
@@ -0,0 +1,60 @@
+"""Nearest neighbour lookup of ScalarDataProblem.evaluate versus the number of
+samples, for a batch of decision vectors. time_linear_scan measures the reference
+cost of scanning all the samples for each decision vector, which evaluate used to
+do. Interpolation measures evaluate after build_model, which interpolates
+between the closest samples.
+
+Run with ``python -m benchmarks.bench_scalar_data``.
+
+"""
+
+import numpy as np
+
+from desdeo_problem.Problem import ScalarDataProblem
+
+
+class NearestNeighbourLookup:
+    params = ([1000, 10000, 100000], [100, 1000])
+    param_names = ["n_of_samples", "n_of_queries"]
+
+    def setup(self, n_of_samples, n_of_queries):
+        rng = np.random.default_rng(0)
+        decision_vectors = rng.random((n_of_samples, 5))
+        objective_vectors = np.column_stack(
+            (decision_vectors.sum(axis=1), (decision_vectors ** 2).sum(axis=1))
+        )
+        self.problem = ScalarDataProblem(decision_vectors, objective_vectors)
+        self.queries = rng.random((n_of_queries, 5))
+
+    def time_evaluate(self, n_of_samples, n_of_queries):
+        self.problem.evaluate(self.queries)
+
+    def time_linear_scan(self, n_of_samples, n_of_queries):
+        for query in self.queries:
+            np.argmin(
+                np.linalg.norm(self.problem.decision_vectors - query, axis=1)
+            )
+
+
+class Interpolation:
+    params = ([10000, 100000], [1, 8, 32])
+    param_names = ["n_of_samples", "n_neighbors"]
+
+    def setup(self, n_of_samples, n_neighbors):
+        rng = np.random.default_rng(0)
+        decision_vectors = rng.random((n_of_samples, 5))
+        objective_vectors = np.column_stack(
+            (decision_vectors.sum(axis=1), (decision_vectors ** 2).sum(axis=1))
+        )
+        self.problem = ScalarDataProblem(decision_vectors, objective_vectors)
+        self.problem.build_model(n_neighbors)
+        self.queries = rng.random((1000, 5))
+
+    def time_evaluate(self, n_of_samples, n_neighbors):
+        self.problem.evaluate(self.queries)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+
+    run_benchmarks(NearestNeighbourLookup, Interpolation)
@@ -0,0 +1,68 @@
+"""Fit time, prediction time and accuracy of the sparse Gaussian process regressor
+versus the exact GaussianProcessRegressor, for increasing numbers of samples. The
+exact regressor is skipped beyond 5000 samples, as it needs O(n ** 2) memory and
+O(n ** 3) time. The accuracy is the root mean squared error on noise free test
+data.
+
+Run with ``python -m benchmarks.bench_sparse_gp``.
+
+"""
+
+import warnings
+
+import numpy as np
+from sklearn.gaussian_process.kernels import RBF, ConstantKernel, WhiteKernel
+
+from desdeo_problem.surrogatemodels.sparse_gp import SparseGaussianProcessRegressor
+from desdeo_problem.surrogatemodels.SurrogateModels import GaussianProcessRegressor
+
+
+def response(X: np.ndarray) -> np.ndarray:
+    return np.sum(np.sin(3 * X), axis=1) + X[:, 0] ** 2
+
+
+class _GaussianProcesses:
+    params = ([1000, 10000, 100000],)
+    param_names = ["n_of_samples"]
+    exact = False
+
+    def setup(self, n_of_samples):
+        if self.exact and n_of_samples > 5000:
+            raise NotImplementedError
+        warnings.simplefilter("ignore")
+        rng = np.random.default_rng(0)
+        self.X = rng.random((n_of_samples, 4))
+        self.y = response(self.X) + 0.05 * rng.standard_normal(n_of_samples)
+        self.X_test = rng.random((1000, 4))
+        self.model = self.new_model()
+        self.model.fit(self.X, self.y)
+
+    def new_model(self):
+        if self.exact:
+            kernel = ConstantKernel() * RBF() + WhiteKernel()
+            return GaussianProcessRegressor(kernel=kernel, normalize_y=True)
+        return SparseGaussianProcessRegressor(random_state=0)
+
+    def time_fit(self, n_of_samples):
+        self.new_model().fit(self.X, self.y)
+
+    def time_predict(self, n_of_samples):
+        self.model.predict(self.X_test)
+
+    def track_rmse(self, n_of_samples):
+        mean, _ = self.model.predict(self.X_test)
+        return np.sqrt(np.mean((mean - response(self.X_test)) ** 2))
+
+
+class SparseGaussianProcess(_GaussianProcesses):
+    exact = False
+
+
+class ExactGaussianProcess(_GaussianProcesses):
+    exact = True
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+
+    run_benchmarks(SparseGaussianProcess, ExactGaussianProcess, repeat=1)
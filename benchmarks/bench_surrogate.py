@@ -0,0 +1,115 @@
+"""Surrogate evaluation of a DataProblem, with one model for each objective versus a
+single joint multi-output model predicting all the objectives at once.
+
+VectorSurrogateOutput measures the cost of collecting the predictions of a
+VectorDataObjective in float arrays, as DataFrames, and in the object dtype
+DataFrames filled column by column which were used before. A cheap linear model
+is used so that the collection of the predictions dominates.
+
+Run with ``python -m benchmarks.bench_surrogate``.
+
+"""
+
+import numpy as np
+import pandas as pd
+
+from desdeo_problem.Objective import VectorDataObjective
+from desdeo_problem.Problem import DataProblem, MOProblem
+from desdeo_problem.surrogatemodels.lipschitzian import LipschitzianRegressor
+from desdeo_problem.surrogatemodels.SurrogateModels import BaseRegressor
+from desdeo_problem.Variable import VariableSet
+
+
+class LinearModel(BaseRegressor):
+    def fit(self, X, y):
+        X = np.column_stack((np.asarray(X), np.ones(len(X))))
+        self.coefficients = np.linalg.lstsq(X, np.asarray(y), rcond=None)[0]
+
+    def predict(self, X):
+        prediction = X @ self.coefficients[:-1] + self.coefficients[-1]
+        return prediction, np.zeros(len(X))
+
+
+class SurrogateEvaluate:
+    params = ([2, 5], [100, 1000])
+    param_names = ["n_of_objectives", "n_of_rows"]
+
+    def setup(self, n_of_objectives, n_of_rows):
+        rng = np.random.default_rng(0)
+        n_of_variables = 5
+        X = rng.random((500, n_of_variables))
+        y = np.column_stack(
+            [np.sum(X ** (i + 1), axis=1) for i in range(n_of_objectives)]
+        )
+        variable_names = [f"x{i}" for i in range(n_of_variables)]
+        objective_names = [f"f{i}" for i in range(n_of_objectives)]
+        data = pd.DataFrame(np.hstack((X, y)), columns=variable_names + objective_names)
+        maximize = pd.DataFrame([[False] * n_of_objectives], columns=objective_names)
+        self.separate = DataProblem(
+            data, variable_names, objective_names, maximize=maximize
+        )
+        self.separate.train(LipschitzianRegressor)
+        self.joint = DataProblem(
+            data, variable_names, objective_names, maximize=maximize
+        )
+        self.joint.train_joint(LipschitzianRegressor)
+        self.decision_vectors = rng.uniform(0.1, 0.9, (n_of_rows, n_of_variables))
+
+    def time_separate_models(self, n_of_objectives, n_of_rows):
+        self.separate.evaluate(self.decision_vectors, use_surrogate=True)
+
+    def time_joint_model(self, n_of_objectives, n_of_rows):
+        self.joint.evaluate(self.decision_vectors, use_surrogate=True)
+
+
+class VectorSurrogateOutput:
+    params = ([10, 100000],)
+    param_names = ["n_of_rows"]
+
+    def setup(self, n_of_rows):
+        rng = np.random.default_rng(0)
+        n_of_variables, n_of_objectives = 5, 4
+        X = rng.random((200, n_of_variables))
+        y = np.column_stack(
+            [X @ rng.random(n_of_variables) for _ in range(n_of_objectives)]
+        )
+        variable_names = [f"x{i}" for i in range(n_of_variables)]
+        objective_names = [f"f{i}" for i in range(n_of_objectives)]
+        data = pd.DataFrame(
+            np.hstack((X, y)), columns=variable_names + objective_names
+        )
+        self.objective = VectorDataObjective(objective_names, data)
+        self.objective.train(LinearModel)
+        variables = VariableSet(
+            variable_names,
+            lower_bounds=np.zeros(n_of_variables),
+            upper_bounds=np.ones(n_of_variables),
+        )
+        self.problem = MOProblem([self.objective], variables)
+        self.decision_vectors = rng.random((n_of_rows, n_of_variables))
+
+    def time_problem_evaluate(self, n_of_rows):
+        self.problem.evaluate(self.decision_vectors, use_surrogate=True)
+
+    def time_arrays(self, n_of_rows):
+        self.objective.evaluate(self.decision_vectors, use_surrogate=True)
+
+    def time_dataframes(self, n_of_rows):
+        self.objective.evaluate(
+            self.decision_vectors, use_surrogate=True, as_dataframe=True
+        )
+
+    def time_object_dataframes(self, n_of_rows):
+        index = range(self.decision_vectors.shape[0])
+        result = pd.DataFrame(index=index, columns=self.objective.name)
+        uncertainity = pd.DataFrame(index=index, columns=self.objective.name)
+        for name, model in self.objective._model.items():
+            result[name], uncertainity[name] = model.predict(self.decision_vectors)
+        np.asarray(result, dtype=float)
+        np.asarray(uncertainity, dtype=float)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+
+    run_benchmarks(SurrogateEvaluate, VectorSurrogateOutput)
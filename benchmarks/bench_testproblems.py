@@ -0,0 +1,72 @@
+"""MOProblem.evaluate of the test problems built by test_problem_builder versus
+the population size. time_evaluate uses the vectorized implementations, which
+the builder uses by default. time_evaluate_optproblems evaluates the individuals
+one by one with optproblems, which the builder used to do. LargeScaleEvaluate
+measures the WFG and LSMOP problems with many variables and objectives.
+
+Run with ``python -m benchmarks.bench_testproblems``.
+
+"""
+
+import numpy as np
+
+from desdeo_problem.Problem import ProblemError
+from desdeo_problem.testproblems.TestProblems import test_problem_builder
+
+
+class TestProblemEvaluate:
+    params = (["ZDT1", "ZDT4", "DTLZ1", "DTLZ2", "DTLZ7"], [100, 1000, 10000])
+    param_names = ["name", "n_of_rows"]
+
+    def setup(self, name, n_of_rows):
+        if name.startswith("DTLZ"):
+            n_of_variables, n_of_objectives = 12, 3
+        else:
+            n_of_variables, n_of_objectives = None, None
+        self.problem = test_problem_builder(name, n_of_variables, n_of_objectives)
+        self.reference = test_problem_builder(
+            name, n_of_variables, n_of_objectives, vectorized=False
+        )
+        rng = np.random.default_rng(0)
+        self.decision_vectors = rng.uniform(
+            self.problem.get_variable_lower_bounds(),
+            self.problem.get_variable_upper_bounds(),
+            (n_of_rows, self.problem.n_of_variables),
+        )
+
+    def time_evaluate(self, name, n_of_rows):
+        self.problem.evaluate(self.decision_vectors)
+
+    def time_evaluate_optproblems(self, name, n_of_rows):
+        self.reference.evaluate(self.decision_vectors)
+
+
+class LargeScaleEvaluate:
+    params = (
+        ["WFG1", "WFG4", "WFG9", "LSMOP1", "LSMOP5", "LSMOP9"],
+        [100, 1000, 5000],
+        [3, 10],
+    )
+    param_names = ["name", "n_of_variables", "n_of_objectives"]
+
+    def setup(self, name, n_of_variables, n_of_objectives):
+        try:
+            self.problem = test_problem_builder(name, n_of_variables, n_of_objectives)
+        except ProblemError:
+            # Too few variables for the LSMOP subcomponents
+            raise NotImplementedError
+        rng = np.random.default_rng(0)
+        self.decision_vectors = rng.uniform(
+            self.problem.get_variable_lower_bounds(),
+            self.problem.get_variable_upper_bounds(),
+            (1000, n_of_variables),
+        )
+
+    def time_evaluate(self, name, n_of_variables, n_of_objectives):
+        self.problem.evaluate(self.decision_vectors)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+
+    run_benchmarks(TestProblemEvaluate, LargeScaleEvaluate)
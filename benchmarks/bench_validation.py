@@ -0,0 +1,51 @@
+"""Cost of validating the decision vectors in MOProblem.evaluate for small
+populations evaluated at a high frequency, with and without the trusted mode.
+time_check_decision_vectors isolates the validation from the evaluation.
+
+Run with ``python -m benchmarks.bench_validation``.
+
+"""
+
+import numpy as np
+
+from desdeo_problem.Objective import _ScalarObjective
+from desdeo_problem.Problem import MOProblem
+from desdeo_problem.Variable import VariableSet
+
+
+def sum_of_squares(x: np.ndarray) -> np.ndarray:
+    return np.sum(x ** 2, axis=1)
+
+
+class SmallPopulations:
+    params = ([1, 10, 100], [10, 100])
+    param_names = ["n_of_rows", "n_of_variables"]
+
+    def setup(self, n_of_rows, n_of_variables):
+        variables = VariableSet(
+            [f"x{i}" for i in range(n_of_variables)],
+            lower_bounds=-np.ones(n_of_variables),
+            upper_bounds=np.ones(n_of_variables),
+        )
+        self.problem = MOProblem([_ScalarObjective("f1", sum_of_squares)], variables)
+        self.decision_vectors = np.random.uniform(
+            -1, 1, (n_of_rows, n_of_variables)
+        )
+
+    def time_evaluate(self, n_of_rows, n_of_variables):
+        for _ in range(1000):
+            self.problem.evaluate(self.decision_vectors)
+
+    def time_evaluate_trusted(self, n_of_rows, n_of_variables):
+        for _ in range(1000):
+            self.problem.evaluate(self.decision_vectors, trusted=True)
+
+    def time_check_decision_vectors(self, n_of_rows, n_of_variables):
+        for _ in range(1000):
+            self.problem._check_decision_vectors(self.decision_vectors)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+
+    run_benchmarks(SmallPopulations)
@@ -0,0 +1,310 @@
+"""Helpers for running the benchmarks without asv. The benchmark classes follow the
+conventions of asv (airspeed velocity): optional ``params``, ``param_names``,
+``repeat`` and ``setup`` attributes, and methods prefixed with ``time_``,
+``peakmem_`` or ``track_``. As in asv, raising NotImplementedError in ``setup``
+skips a combination of parameters.
+
+The results can be saved in a JSON file together with the commit they were
+measured on, and the files of two commits compared with compare_results. See
+``python -m benchmarks --help``.
+
+"""
+
+import datetime
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+def _param_grid(bench_class) -> List[tuple]:
+    params = getattr(bench_class, "params", None)
+    if params is None:
+        return [()]
+    if not isinstance(params[0], (list, tuple)):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def _time(bench, name: str, combination: tuple, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        getattr(bench, name)(*combination)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _peakmem_child(bench, name: str, combination: tuple, connection):
+    import resource
+
+    getattr(bench, name)(*combination)
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    connection.send(max_rss if sys.platform == "darwin" else max_rss * 1024)
+
+
+def _peakmem(bench, name: str, combination: tuple) -> Optional[int]:
+    # As in asv, the peak resident set size of a process running the method once.
+    # The method runs in a forked child, which starts with the memory of the set up
+    # benchmark, so that the peak of earlier benchmarks is not included.
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_peakmem_child, args=(bench, name, combination, sender)
+    )
+    process.start()
+    sender.close()
+    try:
+        peak = receiver.recv()
+    except EOFError:
+        msg = f"{name} failed in the child process, exit code {process.exitcode}"
+        raise RuntimeError(msg)
+    finally:
+        process.join()
+    return peak
+
+
+_PREFIXES = ("time_", "peakmem_", "track_")
+
+_UNITS = {"time_": "seconds", "peakmem_": "bytes", "track_": ""}
+
+
+def _unit(name: str) -> str:
+    return next(unit for prefix, unit in _UNITS.items() if name.startswith(prefix))
+
+
+def _format(value: Optional[float], unit: str) -> str:
+    if value is None:
+        return "skipped"
+    if unit == "seconds":
+        return f"{value:.6f} s"
+    if unit == "bytes":
+        return f"{value / 2 ** 20:.2f} MiB"
+    return f"{value:.6g}"
+
+
+def _label(params: Dict) -> str:
+    return ", ".join(f"{p_name}={value}" for p_name, value in params.items())
+
+
+def run_benchmarks(
+    *bench_classes, repeat: int = None, pattern: str = None, verbose: bool = True
+) -> List[Dict]:
+    """Run every ``time_``, ``peakmem_`` and ``track_`` method of the given benchmark
+    classes for every combination of parameters. Measure the best wall-clock time of
+    repeat runs for the ``time_`` methods, the peak resident set size of a process
+    running the ``peakmem_`` methods once, and the returned value for the ``track_``
+    methods. The peak memory is not measured on platforms without fork.
+
+    Args:
+        *bench_classes: The benchmark classes.
+        repeat (int, optional): The number of runs of the ``time_`` methods. Defaults
+            to None, which uses the ``repeat`` attribute of each class, or 3.
+        pattern (str, optional): A regular expression. Only the methods whose
+            qualified name, e.g. ``SequentialAppends.time_vstack``, matches are run.
+            Defaults to None, which runs all the methods.
+        verbose (bool, optional): Print the results as they are measured. Defaults
+            to True.
+
+    Returns:
+        List[Dict]: One result for each method and combination of parameters, with
+            the keys "name", "params", "unit" and "value". The value of the skipped
+            combinations is None.
+
+    """
+    results = []
+    for bench_class in bench_classes:
+        names = [name for name in dir(bench_class) if name.startswith(_PREFIXES)]
+        param_names = getattr(bench_class, "param_names", [])
+        n_of_runs = repeat or getattr(bench_class, "repeat", 3)
+        for name in names:
+            qualified_name = f"{bench_class.__name__}.{name}"
+            if pattern is not None and not re.search(pattern, qualified_name):
+                continue
+            if verbose:
+                print(qualified_name)
+            unit = _unit(name)
+            for combination in _param_grid(bench_class):
+                params = dict(zip(param_names, combination))
+                bench = bench_class()
+                try:
+                    if hasattr(bench, "setup"):
+                        bench.setup(*combination)
+                except NotImplementedError:
+                    value = None
+                else:
+                    if name.startswith("time_"):
+                        value = _time(bench, name, combination, n_of_runs)
+                    elif name.startswith("peakmem_"):
+                        value = _peakmem(bench, name, combination)
+                    else:
+                        value = float(getattr(bench, name)(*combination))
+                    if hasattr(bench, "teardown"):
+                        bench.teardown(*combination)
+                if verbose:
+                    print(f"    {_label(params):<50} {_format(value, unit)}")
+                results.append(
+                    {
+                        "name": qualified_name,
+                        "params": {key: repr(value) for key, value in params.items()},
+                        "unit": unit,
+                        "value": value,
+                    }
+                )
+    return results
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ["git", *args],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.strip()
+
+
+def environment() -> Dict:
+    """Describe the commit and the machine the benchmarks are run on.
+
+    Returns:
+        Dict: The commit hash, whether the working tree has uncommitted changes, the
+            date, and the versions of python and numpy and the machine.
+
+    """
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "node": platform.node(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save_results(results: List[Dict], path: str):
+    """Save benchmark results in a JSON file together with the environment.
+
+    Args:
+        results (List[Dict]): The results returned by run_benchmarks.
+        path (str): The path of the file. Missing directories are created.
+
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=1)
+
+
+def load_results(path: str) -> Dict:
+    """Load benchmark results saved with save_results.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        Dict: The environment and the results, under the keys "environment" and
+            "results".
+
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def _key(result: Dict) -> Tuple:
+    return (result["name"], tuple(sorted(result["params"].items())))
+
+
+def compare_results(old: Dict, new: Dict, factor: float = 1.1) -> List[Dict]:
+    """Compare the results of two runs, as loaded with load_results. A time or a
+    peak memory which grew by more than factor is a regression, and one which
+    shrank by more than factor an improvement. The track values have no preferred
+    direction and are only reported as changed.
+
+    Args:
+        old (Dict): The results of the baseline.
+        new (Dict): The results to compare to the baseline.
+        factor (float, optional): The smallest ratio of the values which is
+            reported. Defaults to 1.1.
+
+    Returns:
+        List[Dict]: One entry for each benchmark measured in both runs, with the keys
+            "name", "params", "unit", "old", "new", "ratio" and "status". The status
+            is one of "regression", "improvement", "changed", "unchanged" or
+            "skipped".
+
+    """
+    old_values = {_key(result): result for result in old["results"]}
+    comparison = []
+    for result in new["results"]:
+        baseline = old_values.get(_key(result))
+        if baseline is None:
+            continue
+        old_value, new_value = baseline["value"], result["value"]
+        if old_value is None or new_value is None:
+            ratio, status = None, "skipped"
+        else:
+            ratio = new_value / old_value if old_value else np.inf
+            if not old_value and not new_value:
+                ratio = 1.0
+            if 1.0 / factor <= ratio <= factor:
+                status = "unchanged"
+            elif result["unit"] == "":
+                status = "changed"
+            elif ratio > factor:
+                status = "regression"
+            else:
+                status = "improvement"
+        comparison.append(
+            {
+                "name": result["name"],
+                "params": result["params"],
+                "unit": result["unit"],
+                "old": old_value,
+                "new": new_value,
+                "ratio": ratio,
+                "status": status,
+            }
+        )
+    return comparison
+
+
+def print_comparison(comparison: List[Dict], only_changed: bool = True):
+    """Print a comparison made with compare_results as a table.
+
+    Args:
+        comparison (List[Dict]): The comparison.
+        only_changed (bool, optional): Leave out the unchanged and skipped
+            benchmarks. Defaults to True.
+
+    """
+    for entry in comparison:
+        if only_changed and entry["status"] in ("unchanged", "skipped"):
+            continue
+        ratio = "" if entry["ratio"] is None else f"{entry['ratio']:.2f}"
+        old = _format(entry["old"], entry["unit"])
+        new = _format(entry["new"], entry["unit"])
+        print(
+            f"{entry['status']:<12} {ratio:>6} {old:>14} {new:>14}  "
+            f"{entry['name']}({_label(entry['params'])})"
+        )
@@ -0,0 +1,511 @@
+"""Defines archives for storing the evaluations of a problem. The EvaluationArchive
+stores every true evaluation on disk so that the evaluation history survives the
+process. The SampleArchive stores the samples of the data objectives in memory.
+
+"""
+
+import json
+import os
+import threading
+from os import path
+from typing import Iterator, List, NamedTuple, Union
+
+import numpy as np
+import pandas as pd
+
+from desdeo_problem.Cache import EvaluationCache
+
+
+class ArchiveError(Exception):
+    """Raised when an error related to the Archive classes is encountered.
+
+    """
+
+
+class ArchiveChunk(NamedTuple):
+    """A chunk of evaluations read from an EvaluationArchive. The arrays are read-only
+    memory-mapped views of the files on disk.
+
+    Attributes:
+        decision_vectors (np.ndarray): The evaluated decision vectors.
+        objectives (np.ndarray): The objective values.
+        uncertainity (np.ndarray): The uncertainity in the objective values.
+        constraints (Union[None, np.ndarray]): The constraint values, None if there
+            are no constraints.
+
+    """
+
+    decision_vectors: np.ndarray
+    objectives: np.ndarray
+    uncertainity: np.ndarray
+    constraints: Union[None, np.ndarray] = None
+
+
+class EvaluationArchive:
+    """An append-only archive of evaluations stored in a directory. Each append is
+    written as a new .npy chunk whose columns are the decision variables, the
+    objectives, the uncertainity in the objectives and the constraints, in that
+    order. A JSON header lists the names of the columns and the chunks. The chunk
+    and the header are written to temporary files first and then moved in place, so
+    that an interrupted append never corrupts the archive.
+
+    The archive has to be initialized with the names of the variables and
+    objectives before it is used. MOProblem and the data objectives do this when
+    the archive is given to them.
+
+    To keep the number of chunks, and the size of the header, logarithmic in the
+    number of rows, the newest chunks are merged after an append whenever they hold
+    at least as many rows as the chunk before them. Each row is then rewritten
+    O(log n) times. The archive can be appended to from several threads.
+
+    Args:
+        directory (str): Path of the directory containing the archive. Created if it
+            does not exist.
+        auto_compact (bool, optional): Whether to merge the newest chunks after an
+            append. Defaults to True. If False, every append stays a chunk of its
+            own until compact is called.
+
+    Raises:
+        ArchiveError: When the header of an existing archive can not be read.
+
+    """
+
+    header_name: str = "header.json"
+
+    def __init__(self, directory: str, auto_compact: bool = True):
+        self.__directory: str = directory
+        self.__header: dict = None
+        self.auto_compact: bool = auto_compact
+        self.__lock: threading.RLock = threading.RLock()
+        os.makedirs(directory, exist_ok=True)
+        header_path = path.join(directory, self.header_name)
+        if path.exists(header_path):
+            try:
+                with open(header_path, "r") as header_file:
+                    self.__header = json.load(header_file)
+            except (OSError, ValueError) as e:
+                msg = f"Could not read the archive header {header_path}: {e}"
+                raise ArchiveError(msg)
+
+    @property
+    def directory(self) -> str:
+        return self.__directory
+
+    @property
+    def variable_names(self) -> List[str]:
+        return self._header["variable_names"]
+
+    @property
+    def objective_names(self) -> List[str]:
+        return self._header["objective_names"]
+
+    @property
+    def n_of_constraints(self) -> int:
+        return self._header["n_of_constraints"]
+
+    @property
+    def initialized(self) -> bool:
+        return self.__header is not None
+
+    @property
+    def _header(self) -> dict:
+        if self.__header is None:
+            msg = "The archive has not been initialized"
+            raise ArchiveError(msg)
+        return self.__header
+
+    def __len__(self) -> int:
+        if self.__header is None:
+            return 0
+        return sum(n_rows for (_, n_rows) in self.__header["chunks"])
+
+    def initialize(
+        self,
+        variable_names: List[str],
+        objective_names: List[str],
+        n_of_constraints: int = 0,
+    ):
+        """Create the header of a new archive, or check that an existing archive
+        stores the given variables, objectives and constraints.
+
+        Args:
+            variable_names (List[str]): Names of the decision variables.
+            objective_names (List[str]): Names of the objectives.
+            n_of_constraints (int, optional): Number of constraints. Defaults to 0.
+
+        Raises:
+            ArchiveError: When an existing archive stores different variables,
+                objectives or constraints.
+
+        """
+        variable_names = [str(name) for name in variable_names]
+        objective_names = [str(name) for name in objective_names]
+        with self.__lock:
+            self._initialize(variable_names, objective_names, n_of_constraints)
+
+    def _initialize(
+        self,
+        variable_names: List[str],
+        objective_names: List[str],
+        n_of_constraints: int,
+    ):
+        if self.__header is None:
+            self.__header = {
+                "variable_names": variable_names,
+                "objective_names": objective_names,
+                "n_of_constraints": int(n_of_constraints),
+                "next_chunk": 0,
+                "chunks": [],
+            }
+            self._write_header()
+            return
+        if (
+            self.variable_names != variable_names
+            or self.objective_names != objective_names
+            or self.n_of_constraints != n_of_constraints
+        ):
+            msg = (
+                f"The archive in {self.directory} stores the variables "
+                f"{self.variable_names}, the objectives {self.objective_names} and "
+                f"{self.n_of_constraints} constraints. Recieved the variables "
+                f"{variable_names}, the objectives {objective_names} and "
+                f"{n_of_constraints} constraints."
+            )
+            raise ArchiveError(msg)
+
+    def append(
+        self,
+        decision_vectors: np.ndarray,
+        objective_vectors: np.ndarray,
+        uncertainity: np.ndarray = None,
+        constraint_values: np.ndarray = None,
+    ):
+        """Append evaluations to the archive as a new chunk.
+
+        Args:
+            decision_vectors (np.ndarray): The evaluated decision vectors.
+            objective_vectors (np.ndarray): The objective values.
+            uncertainity (np.ndarray, optional): The uncertainity in the objective
+                values. Defaults to None, which is stored as nan.
+            constraint_values (np.ndarray, optional): The constraint values.
+                Required if the archive has constraints.
+
+        Raises:
+            ArchiveError: When the arrays are of the wrong shape.
+
+        """
+        n_of_variables = len(self.variable_names)
+        n_of_objectives = len(self.objective_names)
+        if self.n_of_constraints > 0 and constraint_values is None:
+            msg = "The archive stores constraints, but none were given"
+            raise ArchiveError(msg)
+        try:
+            decision_vectors = np.asarray(decision_vectors, dtype=float).reshape(
+                -1, n_of_variables
+            )
+            n_rows = decision_vectors.shape[0]
+            objective_vectors = np.asarray(objective_vectors, dtype=float).reshape(
+                n_rows, n_of_objectives
+            )
+            if uncertainity is None:
+                uncertainity = np.full((n_rows, n_of_objectives), np.nan)
+            uncertainity = np.asarray(uncertainity, dtype=float).reshape(
+                n_rows, n_of_objectives
+            )
+            columns = [decision_vectors, objective_vectors, uncertainity]
+            if self.n_of_constraints > 0:
+                columns.append(
+                    np.asarray(constraint_values, dtype=float).reshape(
+                        n_rows, self.n_of_constraints
+                    )
+                )
+        except ValueError as e:
+            msg = f"Evaluations of the wrong shape given to the archive: {e}"
+            raise ArchiveError(msg)
+        if n_rows == 0:
+            return
+
+        data = np.hstack(columns)
+        with self.__lock:
+            chunk_name = self._next_chunk_name()
+            tmp_path = _tmp_path(path.join(self.directory, chunk_name))
+            with open(tmp_path, "wb") as chunk_file:
+                np.save(chunk_file, data)
+            os.replace(tmp_path, path.join(self.directory, chunk_name))
+            self._header["chunks"].append([chunk_name, n_rows])
+            if self.auto_compact:
+                self._merge(self._merge_start())
+            else:
+                self._write_header()
+
+    def iter_chunks(self) -> Iterator[ArchiveChunk]:
+        """Iterate over the chunks of the archive without loading them into memory.
+
+        Yields:
+            ArchiveChunk: Memory-mapped views of the stored evaluations.
+
+        """
+        if self.__header is None:
+            return
+        n_var = len(self.variable_names)
+        n_obj = len(self.objective_names)
+        with self.__lock:
+            chunk_names = [chunk_name for (chunk_name, _) in self.__header["chunks"]]
+        for chunk_name in chunk_names:
+            data = np.load(path.join(self.directory, chunk_name), mmap_mode="r")
+            constraints = data[:, n_var + 2 * n_obj :]
+            yield ArchiveChunk(
+                data[:, :n_var],
+                data[:, n_var : n_var + n_obj],
+                data[:, n_var + n_obj : n_var + 2 * n_obj],
+                constraints if self.n_of_constraints > 0 else None,
+            )
+
+    def fill_cache(self, cache: EvaluationCache):
+        """Warm-start an evaluation cache with the stored evaluations. The archive is
+        read one chunk at a time.
+
+        Args:
+            cache (EvaluationCache): The cache to be filled.
+
+        """
+        for chunk in self.iter_chunks():
+            keys = cache.keys(chunk.decision_vectors)
+            for row, key in enumerate(keys):
+                constraints = None
+                if chunk.constraints is not None:
+                    constraints = chunk.constraints[row]
+                cache.store(
+                    key, chunk.objectives[row], chunk.uncertainity[row], constraints
+                )
+
+    def compact(self):
+        """Merge all the chunks into a single chunk. The merged chunk is written
+        through a memory map, so the archive is never loaded into memory at once.
+
+        """
+        with self.__lock:
+            self._merge(0)
+
+    def _merge_start(self) -> int:
+        """Return the index of the first of the newest chunks which hold at least as
+        many rows as the chunk before them.
+
+        """
+        chunks = self._header["chunks"]
+        start = len(chunks) - 1
+        n_rows = chunks[start][1]
+        while start > 0 and chunks[start - 1][1] <= n_rows:
+            start -= 1
+            n_rows += chunks[start][1]
+        return start
+
+    def _merge(self, start: int):
+        """Merge the chunks from start onwards into a single chunk and write the
+        header.
+
+        Args:
+            start (int): The index of the first chunk to be merged.
+
+        """
+        chunks = self._header["chunks"]
+        if len(chunks) - start < 2:
+            self._write_header()
+            return
+        merged_chunks = chunks[start:]
+        n_rows = sum(old_rows for (_, old_rows) in merged_chunks)
+        n_columns = (
+            len(self.variable_names)
+            + 2 * len(self.objective_names)
+            + self.n_of_constraints
+        )
+        chunk_name = self._next_chunk_name()
+        tmp_path = _tmp_path(path.join(self.directory, chunk_name))
+        merged = np.lib.format.open_memmap(
+            tmp_path, mode="w+", dtype=float, shape=(n_rows, n_columns)
+        )
+        row = 0
+        for (old_name, old_rows) in merged_chunks:
+            data = np.load(path.join(self.directory, old_name), mmap_mode="r")
+            merged[row : row + old_rows] = data
+            row = row + old_rows
+            del data
+        merged.flush()
+        del merged
+        os.replace(tmp_path, path.join(self.directory, chunk_name))
+        self._header["chunks"] = chunks[:start] + [[chunk_name, n_rows]]
+        self._write_header()
+        for (old_name, _) in merged_chunks:
+            os.remove(path.join(self.directory, old_name))
+
+    def _next_chunk_name(self) -> str:
+        chunk_name = f"chunk_{self._header['next_chunk']:06d}.npy"
+        self._header["next_chunk"] += 1
+        return chunk_name
+
+    def _write_header(self):
+        header_path = path.join(self.directory, self.header_name)
+        tmp_path = _tmp_path(header_path)
+        with open(tmp_path, "w") as header_file:
+            json.dump(self.__header, header_file)
+        os.replace(tmp_path, header_path)
+
+    def __getstate__(self):
+        # Locks can not be pickled
+        state = self.__dict__.copy()
+        del state["_EvaluationArchive__lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.RLock()
+
+
+def _tmp_path(file_path: str) -> str:
+    """The path of a temporary file written before replacing file_path. Unique to
+    the writing process and thread, so that writers never replace each other's
+    partially written files.
+
+    """
+    return f"{file_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+
+
+class SampleArchive:
+    """An in-memory archive of the samples of a data objective. The samples are
+    stored in preallocated buffers whose capacity is doubled when they are full, so
+    that appending a sample takes amortized constant time.
+
+    Args:
+        X (Union[pd.DataFrame, np.ndarray]): The initial decision vectors.
+        y (Union[pd.DataFrame, pd.Series, np.ndarray]): The initial objective values.
+            A 1D y (or a pd.Series) makes a single objective archive whose y is 1D.
+        variable_names (List[str], optional): Names of the variables. Taken from the
+            columns of X if it is a dataframe.
+        objective_names (List[str], optional): Names of the objectives. Taken from
+            the name(s) of y if it is a series or a dataframe.
+
+    Attributes:
+        X (np.ndarray): A view of the stored decision vectors.
+        y (np.ndarray): A view of the stored objective values.
+
+    Note:
+        X and y are views of the buffers and are not copied. A view taken before
+        the buffers grow keeps showing the samples stored at the time.
+
+    Raises:
+        ArchiveError: When X and y have different number of rows.
+
+    """
+
+    def __init__(
+        self,
+        X: Union[pd.DataFrame, np.ndarray],
+        y: Union[pd.DataFrame, pd.Series, np.ndarray],
+        variable_names: List[str] = None,
+        objective_names: List[str] = None,
+    ):
+        if variable_names is None and isinstance(X, pd.DataFrame):
+            variable_names = list(X.columns)
+        if objective_names is None and isinstance(y, pd.Series):
+            objective_names = [y.name]
+        if objective_names is None and isinstance(y, pd.DataFrame):
+            objective_names = list(y.columns)
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        y = np.asarray(y, dtype=float)
+        if X.shape[0] != y.shape[0]:
+            msg = (
+                f"X and y should have the same number of rows. X has {X.shape[0]} "
+                f"rows, y has {y.shape[0]} rows."
+            )
+            raise ArchiveError(msg)
+        self.variable_names: List[str] = variable_names
+        self.objective_names: List[str] = objective_names
+        self.__n_of_samples: int = X.shape[0]
+        capacity = max(X.shape[0], 1)
+        self.__X: np.ndarray = np.empty((capacity,) + X.shape[1:], dtype=float)
+        self.__y: np.ndarray = np.empty((capacity,) + y.shape[1:], dtype=float)
+        self.__X[: X.shape[0]] = X
+        self.__y[: y.shape[0]] = y
+        self.__lock: threading.Lock = threading.Lock()
+
+    @property
+    def X(self) -> np.ndarray:
+        return self.__X[: self.__n_of_samples]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.__y[: self.__n_of_samples]
+
+    @property
+    def capacity(self) -> int:
+        return self.__X.shape[0]
+
+    def __len__(self) -> int:
+        return self.__n_of_samples
+
+    def append(self, X: np.ndarray, y: np.ndarray):
+        """Append samples to the archive, doubling the capacity of the buffers if
+        needed.
+
+        Args:
+            X (np.ndarray): One or more decision vectors.
+            y (np.ndarray): The corresponding objective values.
+
+        Raises:
+            ArchiveError: When the shapes of X and y do not match the archive.
+
+        """
+        try:
+            X = np.reshape(np.asarray(X, dtype=float), (-1,) + self.__X.shape[1:])
+            y = np.reshape(np.asarray(y, dtype=float), (-1,) + self.__y.shape[1:])
+        except ValueError as e:
+            msg = f"Samples of the wrong shape given to the archive: {e}"
+            raise ArchiveError(msg)
+        if X.shape[0] != y.shape[0]:
+            msg = (
+                f"X and y should have the same number of rows. X has {X.shape[0]} "
+                f"rows, y has {y.shape[0]} rows."
+            )
+            raise ArchiveError(msg)
+        with self.__lock:
+            start = self.__n_of_samples
+            stop = start + X.shape[0]
+            if stop > self.capacity:
+                self._grow(stop)
+            self.__X[start:stop] = X
+            self.__y[start:stop] = y
+            self.__n_of_samples = stop
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return a copy of the samples as a dataframe with the variable and objective
+        names as columns.
+
+        """
+        y = self.y.reshape(len(self), -1)
+        return pd.DataFrame(
+            np.hstack((self.X, y)), columns=self.variable_names + self.objective_names
+        )
+
+    def _grow(self, min_capacity: int):
+        # An empty archive may have no capacity, e.g. after unpickling
+        capacity = max(self.capacity, 1)
+        while capacity < min_capacity:
+            capacity = 2 * capacity
+        new_X = np.empty((capacity,) + self.__X.shape[1:], dtype=float)
+        new_y = np.empty((capacity,) + self.__y.shape[1:], dtype=float)
+        new_X[: self.__n_of_samples] = self.X
+        new_y[: self.__n_of_samples] = self.y
+        self.__X = new_X
+        self.__y = new_y
+
+    def __getstate__(self):
+        # Locks can not be pickled. Only the stored samples are kept.
+        state = self.__dict__.copy()
+        del state["_SampleArchive__lock"]
+        state["_SampleArchive__X"] = self.X.copy()
+        state["_SampleArchive__y"] = self.y.copy()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
@@ -0,0 +1,146 @@
+"""Defines a cache for storing the results of evaluating decision vectors, so that
+decision vectors which have already been evaluated are not evaluated again.
+
+"""
+
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Union
+
+import numpy as np
+
+
+class CacheError(Exception):
+    """Raised when an error related to the EvaluationCache class is encountered.
+
+    """
+
+
+class CachedEvaluation(NamedTuple):
+    """The results of evaluating a single decision vector.
+
+    Attributes:
+        objectives (np.ndarray): The objective values.
+        uncertainity (np.ndarray): The uncertainity in the objective values.
+        constraints (Union[None, np.ndarray]): The constraint values, None if the
+            problem has no constraints.
+
+    """
+
+    objectives: np.ndarray
+    uncertainity: np.ndarray
+    constraints: Union[None, np.ndarray] = None
+
+
+class EvaluationCache:
+    """A least recently used cache of evaluation results keyed on decision vectors.
+
+    Args:
+        max_size (int, optional): Maximum number of decision vectors stored. When
+            exceeded, the least recently used entries are evicted. Defaults to 10000.
+            None means no limit.
+        decimals (int, optional): Number of decimals the decision vectors are
+            rounded to before they are used as keys. Decision vectors equal after
+            rounding share the same results. Defaults to None, which uses the exact
+            values.
+
+    Attributes:
+        hits (int): Number of rows found in the cache.
+        misses (int): Number of rows not found in the cache.
+
+    Raises:
+        CacheError: When max_size is not a positive integer.
+
+    """
+
+    def __init__(self, max_size: Optional[int] = 10000, decimals: int = None):
+        if max_size is not None and max_size < 1:
+            msg = f"max_size should be a positive integer. Recieved {max_size}"
+            raise CacheError(msg)
+        self.__max_size: Optional[int] = max_size
+        self.__decimals: int = decimals
+        self.__entries: "OrderedDict[bytes, CachedEvaluation]" = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def max_size(self) -> Optional[int]:
+        return self.__max_size
+
+    @property
+    def decimals(self) -> int:
+        return self.__decimals
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def keys(self, decision_vectors: np.ndarray) -> List[bytes]:
+        """Compute the keys of the rows of decision_vectors.
+
+        Args:
+            decision_vectors (np.ndarray): A 2D array of decision vectors.
+
+        Returns:
+            List[bytes]: One key for each row.
+
+        """
+        decision_vectors = np.asarray(decision_vectors, dtype=float)
+        if self.decimals is not None:
+            decision_vectors = np.round(decision_vectors, self.decimals)
+        # Adding zero turns -0.0 into 0.0, which otherwise have different bytes
+        decision_vectors = np.ascontiguousarray(decision_vectors + 0.0)
+        return [row.tobytes() for row in decision_vectors]
+
+    def get(self, key: bytes) -> Optional[CachedEvaluation]:
+        """Return the cached results of a key and mark them as recently used.
+
+        Args:
+            key (bytes): A key computed with the keys method.
+
+        Returns:
+            Optional[CachedEvaluation]: The cached results, None if not found.
+
+        """
+        entry = self.__entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.__entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def store(
+        self,
+        key: bytes,
+        objectives: np.ndarray,
+        uncertainity: np.ndarray,
+        constraints: Union[None, np.ndarray] = None,
+    ):
+        """Store the results of a key, evicting the least recently used entries if
+        the cache is full.
+
+        Args:
+            key (bytes): A key computed with the keys method.
+            objectives (np.ndarray): The objective values.
+            uncertainity (np.ndarray): The uncertainity in the objective values.
+            constraints (Union[None, np.ndarray], optional): The constraint values.
+
+        """
+        if constraints is not None:
+            constraints = np.array(constraints, dtype=float)
+        self.__entries[key] = CachedEvaluation(
+            np.array(objectives, dtype=float),
+            np.array(uncertainity, dtype=float),
+            constraints,
+        )
+        self.__entries.move_to_end(key)
+        if self.max_size is not None:
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all the entries and reset the counters.
+
+        """
+        self.__entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -2,12 +2,16 @@
 
 """
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from os import path
-from typing import Callable, List
+from typing import Callable, Dict, List, Sequence, Tuple
 
 import numpy as np
 
+from desdeo_problem.Stats import EvaluationStats
+
 
 class ConstraintError(Exception):
     """Raised when an error related to the Constraint class in encountered.
@@ -115,6 +119,61 @@ class ScalarConstraint(ConstraintBase):
             constraint or the objectives and decision vectors are of wrong
             shape.
 
+        """
+        self._check_shapes(decision_vector, objective_vector)
+        try:
+            result = self.__evaluator(decision_vector, objective_vector)
+        except (TypeError, IndexError) as e:
+            msg = ("Bad arguments {} and {} supplied to the evaluator:" " {}").format(
+                str(decision_vector), objective_vector, str(e)
+            )
+            raise ConstraintError(msg)
+
+        return result
+
+    async def evaluate_async(
+        self, decision_vector: np.ndarray, objective_vector: np.ndarray
+    ) -> float:
+        """Asynchronous version of evaluate. Coroutine evaluators are awaited, other
+        evaluators are run in the default executor of the event loop.
+
+        Args:
+            decision_vector (np.ndarray): A decision_vector containing the
+            values of the decision variables.
+            objective_vector (np.ndarray): A decision_vector containing the
+            values of the objective functions.
+
+        Returns:
+            float: A float indicating how the constraint holds.
+
+        Raises:
+            ConstraintError: When something goes wrong evaluating the
+            constraint or the objectives and decision vectors are of wrong
+            shape.
+
+        """
+        if not asyncio.iscoroutinefunction(self.__evaluator):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self.evaluate, decision_vector, objective_vector
+            )
+        self._check_shapes(decision_vector, objective_vector)
+        try:
+            result = await self.__evaluator(decision_vector, objective_vector)
+        except (TypeError, IndexError) as e:
+            msg = ("Bad arguments {} and {} supplied to the evaluator:" " {}").format(
+                str(decision_vector), objective_vector, str(e)
+            )
+            raise ConstraintError(msg)
+
+        return result
+
+    def _check_shapes(self, decision_vector: np.ndarray, objective_vector: np.ndarray):
+        """Check that the decision and objective vectors are of the right length.
+
+        Raises:
+            ConstraintError: The objectives and decision vectors are of wrong shape.
+
         """
         decision_l = (
             len(decision_vector)
@@ -139,15 +198,6 @@ class ScalarConstraint(ConstraintBase):
                 " Should be {}, but is {}"
             ).format(objective_vector, self.__n_objective_funs, objective_l)
             raise ConstraintError(msg)
-        try:
-            result = self.__evaluator(decision_vector, objective_vector)
-        except (TypeError, IndexError) as e:
-            msg = ("Bad arguments {} and {} supplied to the evaluator:" " {}").format(
-                str(decision_vector), objective_vector, str(e)
-            )
-            raise ConstraintError(msg)
-
-        return result
 
 
 supported_operators: List[str] = ["==", "<", ">"]
@@ -155,6 +205,170 @@ supported_operators: List[str] = ["==", "<", ">"]
 constraint_function_factory."""
 
 
+class ConstraintFunction:
+    """An evaluator of a constraint of the form lhs operator rhs, created by
+    constraint_function_factory. Keeps the parts of the constraint, so that
+    ConstraintBlock can evaluate many such constraints together.
+
+    Args:
+       lhs (Callable): The left hand side of the constraint.
+       rhs (float): The right hand side of the constraint.
+       operator (str): The kind of constraint. Can be '==', '<', '>'.
+
+    Raises:
+        ValueError: The supplied operator is not supported.
+
+    """
+
+    def __init__(self, lhs: Callable, rhs: float, operator: str):
+        if operator not in supported_operators:
+            msg = "The operator {} supplied is not supported.".format(operator)
+            raise ValueError(msg)
+        self.__lhs: Callable = lhs
+        self.__rhs: float = rhs
+        self.__operator: str = operator
+
+    @property
+    def lhs(self) -> Callable:
+        return self.__lhs
+
+    @property
+    def rhs(self) -> float:
+        return self.__rhs
+
+    @property
+    def operator(self) -> str:
+        return self.__operator
+
+    def __call__(self, decision_vector: np.ndarray, objective_vector: np.ndarray):
+        if self.__operator == "==":
+            return -abs(self.__lhs(decision_vector, objective_vector) - self.__rhs)
+        elif self.__operator == "<":
+            return self.__rhs - self.__lhs(decision_vector, objective_vector)
+        else:
+            return self.__lhs(decision_vector, objective_vector) - self.__rhs
+
+
+class ConstraintBlock:
+    """Evaluates many ScalarConstraints at once. The constraints with evaluators
+    made by constraint_function_factory are evaluated together: the shapes of
+    the vectors are checked once, a left hand side shared by many constraints is
+    evaluated only once, and the right hand sides and operators are applied in
+    place while writing the constraint values. Other constraints are evaluated
+    one by one with ScalarConstraint.evaluate.
+
+    Args:
+        constraints (Sequence[ScalarConstraint]): The constraints, in the order of
+        the columns of the constraint values.
+
+    """
+
+    def __init__(self, constraints: Sequence[ScalarConstraint]):
+        self.__constraints: Tuple[ScalarConstraint, ...] = tuple(constraints)
+        # The left hand sides by their ids, with the columns of their constraints
+        self.__lhs_columns: Dict[int, Tuple[Callable, List[int]]] = {}
+        self.__other_columns: List[int] = []
+        # One constraint of each shape is enough for checking the shapes
+        self.__shape_checkers: Dict[Tuple[int, int], ScalarConstraint] = {}
+        for (i, con) in enumerate(self.__constraints):
+            if isinstance(con.evaluator, ConstraintFunction):
+                lhs = con.evaluator.lhs
+                self.__lhs_columns.setdefault(id(lhs), (lhs, []))[1].append(i)
+                self.__shape_checkers.setdefault(
+                    (con.n_decision_vars, con.n_objective_funs), con
+                )
+            else:
+                self.__other_columns.append(i)
+
+    @property
+    def constraints(self) -> Tuple[ScalarConstraint, ...]:
+        return self.__constraints
+
+    def __len__(self) -> int:
+        return len(self.__constraints)
+
+    def evaluate(
+        self,
+        decision_vectors: np.ndarray,
+        objective_vectors: np.ndarray,
+        stats: EvaluationStats = None,
+    ) -> np.ndarray:
+        """Evaluate all the constraints.
+
+        Args:
+            decision_vectors (np.ndarray): A 2D array of decision vectors.
+            objective_vectors (np.ndarray): The corresponding objective vectors.
+            stats (EvaluationStats, optional): If given, the time spent on each
+            constraint and on checking the shapes is recorded in it. The
+            constraints sharing a left hand side share its time evenly. Defaults
+            to None.
+
+        Returns:
+            np.ndarray: The constraint values, with a row for each decision vector
+            and a column for each constraint. The array is in column-major
+            order, as the values are written one constraint at a time.
+
+        Raises:
+            ConstraintError: When something goes wrong evaluating the
+            constraints or the objectives and decision vectors are of wrong
+            shape.
+
+        """
+        n_rows = np.atleast_2d(decision_vectors).shape[0]
+        constraint_values = np.empty((len(self.__constraints), n_rows), dtype=float)
+
+        if stats is not None:
+            start = time.perf_counter()
+        for con in self.__shape_checkers.values():
+            con._check_shapes(decision_vectors, objective_vectors)
+        if stats is not None:
+            stats.record(
+                "validation", "constraint shapes", time.perf_counter() - start, n_rows
+            )
+        for (lhs, columns) in self.__lhs_columns.values():
+            if stats is not None:
+                start = time.perf_counter()
+            try:
+                lhs_values = lhs(decision_vectors, objective_vectors)
+            except (TypeError, IndexError) as e:
+                msg = (
+                    "Bad arguments {} and {} supplied to the evaluator:" " {}"
+                ).format(str(decision_vectors), objective_vectors, str(e))
+                raise ConstraintError(msg)
+            for i in columns:
+                function = self.__constraints[i].evaluator
+                values = constraint_values[i]
+                if function.operator == "<":
+                    np.subtract(function.rhs, lhs_values, out=values)
+                else:
+                    np.subtract(lhs_values, function.rhs, out=values)
+                    if function.operator == "==":
+                        np.abs(values, out=values)
+                        np.negative(values, out=values)
+            if stats is not None:
+                seconds = (time.perf_counter() - start) / len(columns)
+                for i in columns:
+                    stats.record(
+                        "constraint", self.__constraints[i].name, seconds, n_rows
+                    )
+
+        for i in self.__other_columns:
+            if stats is not None:
+                start = time.perf_counter()
+            constraint_values[i] = np.array(
+                self.__constraints[i].evaluate(decision_vectors, objective_vectors)
+            )
+            if stats is not None:
+                stats.record(
+                    "constraint",
+                    self.__constraints[i].name,
+                    time.perf_counter() - start,
+                    n_rows,
+                )
+
+        return constraint_values.T
+
+
 def constraint_function_factory(lhs: Callable, rhs: float, operator: str) -> Callable:
     """A function that creates an evaluator to be used with the ScalarConstraint
     class. Constraints should be formulated in a way where all the mathematical
@@ -169,7 +383,7 @@ def constraint_function_factory(lhs: Callable, rhs: float, operator: str) -> Cal
        operator (str): The kind of constraint. Can be '==', '<', '>'.
 
     Returns:
-       Callable: A function that can be called to evaluate the rhs and
+       Callable: A ConstraintFunction that can be called to evaluate the rhs and
        which returns representing how the constraint is obeyed. A negative
        value represent a violation of the constraint and a positive value an
        agreement with the constraint. The absolute value of the float is a
@@ -179,32 +393,4 @@ def constraint_function_factory(lhs: Callable, rhs: float, operator: str) -> Cal
         ValueError: The supplied operator is not supported.
 
     """
-    if operator not in supported_operators:
-        msg = "The operator {} supplied is not supported.".format(operator)
-        raise ValueError(msg)
-
-    if operator == "==":
-
-        def equals(decision_vector: np.ndarray, objective_vector: np.ndarray) -> float:
-            return -abs(lhs(decision_vector, objective_vector) - rhs)
-
-        return equals
-
-    elif operator == "<":
-
-        def lt(decision_vector: np.ndarray, objective_vector: np.ndarray) -> float:
-            return rhs - lhs(decision_vector, objective_vector)
-
-        return lt
-
-    elif operator == ">":
-
-        def gt(decision_vector: np.ndarray, objective_vector: np.ndarray) -> float:
-            return lhs(decision_vector, objective_vector) - rhs
-
-        return gt
-
-    else:
-        # if for some reason a bad operator falls through
-        msg = "Bad operator argument supplied: {}".format(operator)
-        raise ValueError(msg)
+    return ConstraintFunction(lhs, rhs, operator)
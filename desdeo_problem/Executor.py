@@ -0,0 +1,188 @@
+"""Defines executors which can be used to distribute the evaluation of objectives
+over threads or processes.
+
+"""
+
+import atexit
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_EXCEPTION
+from concurrent.futures import ProcessPoolExecutor as _ProcessPool
+from concurrent.futures import ThreadPoolExecutor as _ThreadPool
+from concurrent.futures import wait
+from typing import Callable, Iterable, List
+
+import numpy as np
+
+
+class ExecutorError(Exception):
+    """Raised when an error related to the Executor classes is encountered.
+
+    """
+
+
+class BaseExecutor(ABC):
+    """The abstract base class for executors. An executor maps a function over a set
+    of tasks and returns the results in the order the tasks were given.
+
+    Args:
+        n_workers (int, optional): Number of workers to be used. Defaults to None,
+            which lets the underlying pool decide.
+        chunk_size (int, optional): Number of rows of a population evaluated in a
+            single task. Defaults to None, which evaluates the whole population in
+            one task.
+
+    Raises:
+        ExecutorError: When n_workers or chunk_size is not a positive integer.
+
+    """
+
+    def __init__(self, n_workers: int = None, chunk_size: int = None):
+        if n_workers is not None and n_workers < 1:
+            msg = f"n_workers should be a positive integer. Recieved {n_workers}"
+            raise ExecutorError(msg)
+        if chunk_size is not None and chunk_size < 1:
+            msg = f"chunk_size should be a positive integer. Recieved {chunk_size}"
+            raise ExecutorError(msg)
+        self.n_workers: int = n_workers
+        self.chunk_size: int = chunk_size
+
+    @abstractmethod
+    def map(self, func: Callable, *iterables: Iterable) -> List:
+        """Call func with arguments taken from the iterables.
+
+        Args:
+            func (Callable): The function to be called.
+            iterables (Iterable): Iterables supplying the arguments of func.
+
+        Returns:
+            List: The results of the calls, in the order of the arguments.
+
+        """
+        pass
+
+    def chunks(self, n_rows: int) -> List[slice]:
+        """Split a population of n_rows rows into slices of at most chunk_size rows.
+
+        Args:
+            n_rows (int): Number of rows in the population.
+
+        Returns:
+            List[slice]: Slices covering the rows in order.
+
+        """
+        if self.chunk_size is None or n_rows <= self.chunk_size:
+            return [slice(0, n_rows)]
+        starts = np.arange(0, n_rows, self.chunk_size)
+        return [slice(start, min(start + self.chunk_size, n_rows)) for start in starts]
+
+    def shutdown(self):
+        """Release the resources held by the executor.
+
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+
+class SerialExecutor(BaseExecutor):
+    """Executes the tasks one after another in the calling thread. This is the
+    default behaviour of the problem classes.
+
+    """
+
+    def map(self, func: Callable, *iterables: Iterable) -> List:
+        return [func(*args) for args in zip(*iterables)]
+
+
+class _PoolExecutor(BaseExecutor):
+    """Base class for executors backed by a pool from concurrent.futures. The pool
+    is created when first needed and reused for later calls.
+
+    """
+
+    _pool_class = None
+
+    def __init__(self, n_workers: int = None, chunk_size: int = None):
+        super().__init__(n_workers, chunk_size)
+        self._pool = None
+
+    def map(self, func: Callable, *iterables: Iterable) -> List:
+        """Submit all the tasks to the pool and wait for them to finish. If any of
+        the tasks raises an exception, the tasks not yet started are cancelled and
+        the exception is raised.
+
+        """
+        if self._pool is None:
+            self._pool = self._pool_class(max_workers=self.n_workers)
+        futures = [self._pool.submit(func, *args) for args in zip(*iterables)]
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in not_done:
+            future.cancel()
+        for future in futures:
+            if future in done and future.exception() is not None:
+                raise future.exception()
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __getstate__(self):
+        # Pools can not be pickled. Executors are pickled along with objectives when
+        # they are sent to worker processes.
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+
+class ThreadExecutor(_PoolExecutor):
+    """Executes the tasks in a pool of threads. Useful when the evaluators release
+    the GIL, e.g., when they call external simulators or numpy heavy code.
+
+    """
+
+    _pool_class = _ThreadPool
+
+
+class ProcessExecutor(_PoolExecutor):
+    """Executes the tasks in a pool of processes. The evaluators (and the objectives
+    holding them) must be picklable, i.e., defined at the top level of a module.
+
+    Note:
+        The problem classes only call the evaluators in the worker processes, and
+        store the results, e.g., the samples of the data objectives, in the calling
+        process. Side effects of the evaluators themselves, and of objectives which
+        override _func_evaluate, happen in the workers and are not seen by the
+        caller.
+
+    """
+
+    _pool_class = _ProcessPool
+
+
+_default_process_executor: ProcessExecutor = None
+_default_process_executor_lock = threading.Lock()
+
+
+def default_process_executor() -> ProcessExecutor:
+    """Return the ProcessExecutor shared by the row-wise objectives which are not
+    given an executor. It is created when first needed, and its pool is shut down
+    when the interpreter exits, so that the objectives do not each start a pool
+    which is never released.
+
+    Returns:
+        ProcessExecutor: The shared executor.
+
+    """
+    global _default_process_executor
+    with _default_process_executor_lock:
+        if _default_process_executor is None:
+            _default_process_executor = ProcessExecutor()
+            atexit.register(_default_process_executor.shutdown)
+        return _default_process_executor
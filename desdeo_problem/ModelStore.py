@@ -0,0 +1,162 @@
+"""Defines a store for saving trained surrogate models on disk, so that the models do
+not have to be trained again when the process is restarted.
+
+"""
+
+import hashlib
+import json
+import os
+import time
+from os import path
+from typing import Dict, Optional, Union
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from desdeo_problem.surrogatemodels.SurrogateModels import BaseRegressor
+
+
+class ModelStoreError(Exception):
+    """Raised when an error related to the ModelStore class is encountered.
+
+    """
+
+
+class ModelStore:
+    """A directory of trained surrogate models keyed by fingerprints of their
+    training. A fingerprint is computed from the class of the model, the parameters
+    it is initialized with and the data it is fitted on, so a stored model is reused
+    only when training it again would give the same model.
+
+    Each model is stored with joblib in a file named after its fingerprint, along
+    with a JSON sidecar describing it. The numpy arrays of the models, such as the
+    training matrices of Gaussian processes, are memory-mapped read-only when the
+    models are loaded, so loading large models is fast and their arrays are only
+    read from disk when used.
+
+    Args:
+        directory (str): Path of the directory containing the models. Created if it
+            does not exist.
+
+    """
+
+    def __init__(self, directory: str):
+        self.__directory: str = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        return self.__directory
+
+    def __contains__(self, key: str) -> bool:
+        return path.exists(self._model_path(key))
+
+    @staticmethod
+    def fingerprint(
+        model: type,
+        model_parameters: Optional[Dict],
+        X: Union[np.ndarray, pd.DataFrame],
+        y: Union[np.ndarray, pd.Series],
+    ) -> str:
+        """Compute the fingerprint of fitting a model.
+
+        Args:
+            model (type): The class of the model.
+            model_parameters (Optional[Dict]): The parameters the model is initialized
+                with. They are hashed with joblib.hash, which pickles them, so the
+                fingerprint is the same in every process as long as the pickled
+                parameters are.
+            X (Union[np.ndarray, pd.DataFrame]): The decision vectors the model is
+                fitted on.
+            y (Union[np.ndarray, pd.Series]): The objective values the model is
+                fitted on.
+
+        Returns:
+            str: A hexadecimal SHA-256 digest.
+
+        Raises:
+            ModelStoreError: When the parameters can not be pickled, e.g., lambdas,
+                and so have no fingerprint which is stable across processes.
+
+        """
+        try:
+            parameters_hash = joblib.hash(model_parameters or {})
+        except Exception as e:
+            msg = (
+                f"Could not fingerprint the model parameters {model_parameters}, "
+                f"they should be picklable: {e}"
+            )
+            raise ModelStoreError(msg)
+        digest = hashlib.sha256()
+        digest.update(f"{model.__module__}.{model.__qualname__}".encode())
+        digest.update(parameters_hash.encode())
+        for array in (X, y):
+            array = np.ascontiguousarray(np.asarray(array, dtype=float))
+            digest.update(str(array.shape).encode())
+            digest.update(array.tobytes())
+        return digest.hexdigest()
+
+    def save(self, key: str, model: BaseRegressor, metadata: Dict = None):
+        """Save a fitted model. The model file and its sidecar are written to
+        temporary files first and then moved in place.
+
+        Args:
+            key (str): The fingerprint of the model.
+            model (BaseRegressor): The fitted model.
+            metadata (Dict, optional): Extra information stored in the sidecar.
+
+        """
+        sidecar = {
+            "fingerprint": key,
+            "model": f"{type(model).__module__}.{type(model).__qualname__}",
+            "saved": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        sidecar.update(metadata or {})
+        model_path = self._model_path(key)
+        joblib.dump(model, model_path + ".tmp")
+        os.replace(model_path + ".tmp", model_path)
+        sidecar_path = self._sidecar_path(key)
+        with open(sidecar_path + ".tmp", "w") as sidecar_file:
+            json.dump(sidecar, sidecar_file, indent=2, default=repr)
+        os.replace(sidecar_path + ".tmp", sidecar_path)
+
+    def load(self, key: str) -> Optional[BaseRegressor]:
+        """Load a model with memory-mapped arrays.
+
+        Args:
+            key (str): The fingerprint of the model.
+
+        Returns:
+            Optional[BaseRegressor]: The model, None if no model has been saved with
+            the key.
+
+        Raises:
+            ModelStoreError: When the model file can not be read.
+
+        """
+        model_path = self._model_path(key)
+        if not path.exists(model_path):
+            return None
+        try:
+            return joblib.load(model_path, mmap_mode="r")
+        except Exception as e:
+            msg = f"Could not load the model {model_path}: {e}"
+            raise ModelStoreError(msg)
+
+    def metadata(self, key: str) -> Optional[Dict]:
+        """Return the sidecar of a saved model, None if no model has been saved with
+        the key.
+
+        """
+        sidecar_path = self._sidecar_path(key)
+        if not path.exists(sidecar_path):
+            return None
+        with open(sidecar_path, "r") as sidecar_file:
+            return json.load(sidecar_file)
+
+    def _model_path(self, key: str) -> str:
+        return path.join(self.directory, f"{key}.joblib")
+
+    def _sidecar_path(self, key: str) -> str:
+        return path.join(self.directory, f"{key}.json")
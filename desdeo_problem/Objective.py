@@ -2,6 +2,9 @@
 
 """
 
+import asyncio
+import os
+import threading
 from abc import ABC, abstractmethod
 from os import path
 from typing import Callable, Dict, List, NamedTuple, Tuple, Union
@@ -9,6 +12,13 @@ from typing import Callable, Dict, List, NamedTuple, Tuple, Union
 import numpy as np
 import pandas as pd
 
+from desdeo_problem.Archive import EvaluationArchive, SampleArchive
+from desdeo_problem.Executor import (
+    BaseExecutor,
+    SerialExecutor,
+    default_process_executor,
+)
+from desdeo_problem.ModelStore import ModelStore
 from desdeo_problem.surrogatemodels.SurrogateModels import BaseRegressor, ModelError
 
 
@@ -66,6 +76,37 @@ class ObjectiveBase(ABC):
         else:
             return self._func_evaluate(decision_vector)
 
+    async def evaluate_async(
+        self, decision_vector: np.ndarray, use_surrogate: bool = False
+    ) -> ObjectiveEvaluationResults:
+        """Asynchronous version of evaluate. The surrogate models are run in the
+        default executor of the event loop.
+
+        Args:
+            decision_vector (np.ndarray): A vector of Variables to be used in
+            the evaluation of the objective.
+            use_surrogate (bool) : A boolean which determines whether to use surrogates
+            or true function evaluator. False by default.
+
+        """
+        if use_surrogate:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self._surrogate_evaluate, decision_vector
+            )
+        else:
+            return await self._func_evaluate_async(decision_vector)
+
+    async def _func_evaluate_async(
+        self, decision_vector: np.ndarray
+    ) -> ObjectiveEvaluationResults:
+        """Asynchronous version of _func_evaluate. By default, _func_evaluate is run in
+        the default executor of the event loop.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._func_evaluate, decision_vector)
+
     @abstractmethod
     def _func_evaluate(self, decision_vector: np.ndarray) -> ObjectiveEvaluationResults:
         """Evaluates the true objective value according to a decision variable vector.
@@ -120,6 +161,37 @@ class VectorObjectiveBase(ABC):
         else:
             return self._func_evaluate(decision_vector)
 
+    async def evaluate_async(
+        self, decision_vector: np.ndarray, use_surrogate: bool = False
+    ) -> ObjectiveEvaluationResults:
+        """Asynchronous version of evaluate. The surrogate models are run in the
+        default executor of the event loop.
+
+        Args:
+            decision_vector (np.ndarray): A vector of Variables to be used in
+            the evaluation of the objective.
+            use_surrogate (bool) : A boolean which determines whether to use surrogates
+            or true function evaluator. False by default.
+
+        """
+        if use_surrogate:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self._surrogate_evaluate, decision_vector
+            )
+        else:
+            return await self._func_evaluate_async(decision_vector)
+
+    async def _func_evaluate_async(
+        self, decision_vector: np.ndarray
+    ) -> ObjectiveEvaluationResults:
+        """Asynchronous version of _func_evaluate. By default, _func_evaluate is run in
+        the default executor of the event loop.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._func_evaluate, decision_vector)
+
     @abstractmethod
     def _func_evaluate(self, decision_vector: np.ndarray) -> ObjectiveEvaluationResults:
         """Evaluates the true objective values according to a decision variable vector.
@@ -149,6 +221,167 @@ class VectorObjectiveBase(ABC):
         pass
 
 
+def _call_evaluator(
+    objective: Union["_ScalarObjective", "VectorObjective"], decision_vector: np.ndarray
+):
+    """Call the evaluator of objective, row by row if the objective is row-wise.
+    Defined at the module level so that it can be sent to worker processes.
+
+    Raises:
+        ObjectiveError: When the objective has no evaluator or a bad argument is
+            supplied to the evaluator.
+
+    """
+    if objective.evaluator is None:
+        msg = "No analytical function provided"
+        raise ObjectiveError(msg)
+    try:
+        if objective.row_wise:
+            return _evaluate_row_wise(
+                objective.evaluator, decision_vector, objective.executor
+            )
+        return objective.evaluator(decision_vector)
+    except (TypeError, IndexError) as e:
+        msg = "Bad argument {} supplied to the evaluator: {}".format(
+            str(decision_vector), str(e)
+        )
+        raise ObjectiveError(msg)
+
+
+async def _call_evaluator_async(
+    objective: Union["_ScalarObjective", "VectorObjective"], decision_vector: np.ndarray
+):
+    """Asynchronous version of _call_evaluator. Coroutine evaluators are awaited,
+    other evaluators are run in the default executor of the event loop.
+
+    """
+    if objective.evaluator is None:
+        msg = "No analytical function provided"
+        raise ObjectiveError(msg)
+    if not asyncio.iscoroutinefunction(objective.evaluator):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, _call_evaluator, objective, decision_vector
+        )
+    try:
+        return await objective.evaluator(decision_vector)
+    except (TypeError, IndexError) as e:
+        msg = "Bad argument {} supplied to the evaluator: {}".format(
+            str(decision_vector), str(e)
+        )
+        raise ObjectiveError(msg)
+
+
+def _evaluate_rows(evaluator: Callable, decision_vectors: np.ndarray) -> List:
+    """Call the evaluator on each row of decision_vectors. Defined at the module level
+    so that it can be sent to worker processes.
+
+    """
+    return [evaluator(row) for row in decision_vectors]
+
+
+def _evaluate_row_wise(
+    evaluator: Callable, decision_vector: np.ndarray, executor: BaseExecutor
+) -> np.ndarray:
+    """Evaluate a population with an evaluator that accepts only one row at a time.
+    The population is split into chunks that are evaluated using the executor, and
+    the results are reassembled in the order of the rows.
+
+    Args:
+        evaluator (Callable): The evaluator accepting a single decision vector.
+        decision_vector (np.ndarray): A 1D or 2D array of decision vectors.
+        executor (BaseExecutor): The executor evaluating the chunks.
+
+    Returns:
+        np.ndarray: The results of the evaluator, one row for each decision vector.
+
+    """
+    decision_vector = np.atleast_2d(decision_vector)
+    n_rows = decision_vector.shape[0]
+    if executor.chunk_size is None:
+        # Split the population evenly between the workers
+        n_chunks = min(executor.n_workers or os.cpu_count() or 1, n_rows)
+        bounds = np.linspace(0, n_rows, n_chunks + 1).astype(int)
+        chunks = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+    else:
+        chunks = executor.chunks(n_rows)
+    chunk_results = executor.map(
+        _evaluate_rows,
+        [evaluator] * len(chunks),
+        [decision_vector[chunk] for chunk in chunks],
+    )
+    return np.asarray([result for chunk in chunk_results for result in chunk])
+
+
+def _fit_model(
+    model: BaseRegressor,
+    model_parameters: Dict,
+    X: Union[np.ndarray, pd.DataFrame],
+    y: Union[np.ndarray, pd.Series],
+) -> BaseRegressor:
+    """Initialize a surrogate model with model_parameters and fit it. Defined at the
+    module level so that the tasks submitted to a ProcessExecutor can be pickled.
+
+    """
+    if model_parameters is None:
+        model_parameters = {}
+    fitted_model = model(**model_parameters)
+    fitted_model.fit(X, y)
+    return fitted_model
+
+
+def _fit_models(
+    models: List[BaseRegressor],
+    model_parameters: List[Dict],
+    training_data: List[Tuple],
+    executor: BaseExecutor = None,
+    store: ModelStore = None,
+) -> List[BaseRegressor]:
+    """Fit surrogate models, each on its own training data.
+
+    Args:
+        models (List[BaseRegressor]): The classes of the models.
+        model_parameters (List[Dict]): The parameters of each model.
+        training_data (List[Tuple]): The decision vectors and the objective values
+            each model is fitted on.
+        executor (BaseExecutor, optional): Executor used to fit the models. Defaults
+            to None, which fits the models one after another.
+        store (ModelStore, optional): Models found in the store are loaded instead of
+            fitted, and the fitted models are saved in it. Defaults to None.
+
+    Returns:
+        List[BaseRegressor]: The fitted models.
+
+    """
+    fitted_models = [None] * len(models)
+    if store is not None:
+        keys = [
+            store.fingerprint(model, params, X, y)
+            for (model, params, (X, y)) in zip(models, model_parameters, training_data)
+        ]
+        fitted_models = [store.load(key) for key in keys]
+    missing = [i for (i, model) in enumerate(fitted_models) if model is None]
+    if executor is None:
+        executor = SerialExecutor()
+    new_models = executor.map(
+        _fit_model,
+        [models[i] for i in missing],
+        [model_parameters[i] for i in missing],
+        [training_data[i][0] for i in missing],
+        [training_data[i][1] for i in missing],
+    )
+    for i, model in zip(missing, new_models):
+        fitted_models[i] = model
+        if store is not None:
+            X, _ = training_data[i]
+            metadata = {
+                "model_parameters": model_parameters[i],
+                "n_of_samples": len(X),
+            }
+            store.save(keys[i], model, metadata)
+    return fitted_models
+
+
 # TODO: Depreciate
 class _ScalarObjective(ObjectiveBase):
     """A simple objective function that returns a scalar.
@@ -159,6 +392,12 @@ class _ScalarObjective(ObjectiveBase):
         lower_bound (float): The lower bound of the objective.
         upper_bound (float): The upper bound of the objective.
         maximize (bool): Boolean to determine whether the objective is to be maximized.
+        row_wise (bool): Set to True if the evaluator accepts only one decision
+            vector at a time. The population is then split into chunks which are
+            evaluated row by row using the executor. Defaults to False.
+        executor (BaseExecutor, optional): The executor used in the row-wise mode.
+            Defaults to None, which uses a ProcessExecutor shared by all the
+            objectives.
 
     Attributes:
         name (str): Name of the objective.
@@ -168,6 +407,8 @@ class _ScalarObjective(ObjectiveBase):
         upper_bound (float): The upper bound of the objective.
         maximize (List[bool]): List of boolean to determine whether the objectives are
             to be maximized. All false by default
+        row_wise (bool): Whether the evaluator is called one row at a time.
+        executor (BaseExecutor): The executor used in the row-wise mode.
 
     Raises:
         ObjectiveError: When ill formed bounds are given.
@@ -181,6 +422,8 @@ class _ScalarObjective(ObjectiveBase):
         lower_bound: float = -np.inf,
         upper_bound: float = np.inf,
         maximize: List[bool] = None,
+        row_wise: bool = False,
+        executor: BaseExecutor = None,
     ) -> None:
         # Check that the bounds make sense
         if not (lower_bound < upper_bound):
@@ -197,6 +440,10 @@ class _ScalarObjective(ObjectiveBase):
         if maximize is None:
             maximize = [False]
         self.maximize: bool = maximize  # TODO implement set/getters. Have validation.
+        if row_wise and executor is None:
+            executor = default_process_executor()
+        self.__row_wise: bool = row_wise
+        self.__executor: BaseExecutor = executor
 
     @property
     def name(self) -> str:
@@ -222,6 +469,14 @@ class _ScalarObjective(ObjectiveBase):
     def upper_bound(self) -> float:
         return self.__upper_bound
 
+    @property
+    def row_wise(self) -> bool:
+        return self.__row_wise
+
+    @property
+    def executor(self) -> BaseExecutor:
+        return self.__executor
+
     def _func_evaluate(self, decision_vector: np.ndarray) -> ObjectiveEvaluationResults:
         """Evaluate the objective functions value.
 
@@ -236,14 +491,25 @@ class _ScalarObjective(ObjectiveBase):
             ObjectiveError: When a bad argument is supplied to the evaluator.
 
         """
-        try:
-            result = self.evaluator(decision_vector)
-        except (TypeError, IndexError) as e:
-            msg = "Bad argument {} supplied to the evaluator: {}".format(
-                str(decision_vector), str(e)
-            )
-            raise ObjectiveError(msg)
+        result = _call_evaluator(self, decision_vector)
+        return self._store_results(decision_vector, result)
+
+    async def _func_evaluate_async(
+        self, decision_vector: np.ndarray
+    ) -> ObjectiveEvaluationResults:
+        """Asynchronous version of _func_evaluate. Coroutine evaluators are awaited,
+        other evaluators are run in the default executor of the event loop.
+
+        """
+        result = await _call_evaluator_async(self, decision_vector)
+        return self._store_results(decision_vector, result)
 
+    def _store_results(
+        self, decision_vector: np.ndarray, result: Union[float, np.ndarray]
+    ) -> ObjectiveEvaluationResults:
+        """Store the value returned by the evaluator and build the results.
+
+        """
         # Store the value of the objective
         self.value = result
         uncertainity = np.full_like(result, np.nan, dtype=float)
@@ -268,6 +534,12 @@ class VectorObjective(VectorObjectiveBase):
         objective values. Defaults to None.
         maximize (List[bool]): *List* of boolean to determine whether the objectives are
             to be maximized. All false by default
+        row_wise (bool): Set to True if the evaluator accepts only one decision
+            vector at a time. The population is then split into chunks which are
+            evaluated row by row using the executor. Defaults to False.
+        executor (BaseExecutor, optional): The executor used in the row-wise mode.
+            Defaults to None, which uses a ProcessExecutor shared by all the
+            objectives.
 
     Raises:
         ObjectiveError: When lengths the input arrays are different.
@@ -283,6 +555,8 @@ class VectorObjective(VectorObjectiveBase):
         lower_bounds: Union[List[float], np.ndarray] = None,
         upper_bounds: Union[List[float], np.ndarray] = None,
         maximize: List[bool] = None,
+        row_wise: bool = False,
+        executor: BaseExecutor = None,
     ):
         n_of_objectives = len(name)
         if lower_bounds is None:
@@ -318,6 +592,10 @@ class VectorObjective(VectorObjectiveBase):
             self.maximize = [False] * n_of_objectives
         else:
             self.maximize: bool = maximize
+        if row_wise and executor is None:
+            executor = default_process_executor()
+        self.__row_wise: bool = row_wise
+        self.__executor: BaseExecutor = executor
 
     @property
     def name(self) -> str:
@@ -347,6 +625,14 @@ class VectorObjective(VectorObjectiveBase):
     def upper_bounds(self) -> np.ndarray:
         return self.__upper_bounds
 
+    @property
+    def row_wise(self) -> bool:
+        return self.__row_wise
+
+    @property
+    def executor(self) -> BaseExecutor:
+        return self.__executor
+
     def _func_evaluate(self, decision_vector: np.ndarray) -> ObjectiveEvaluationResults:
         """Evaluate the multiple objective functions value.
 
@@ -362,13 +648,25 @@ class VectorObjective(VectorObjectiveBase):
                 the evaluator returns an unexpected number of outputs.
 
         """
-        try:
-            result = self.evaluator(decision_vector)
-        except (TypeError, IndexError) as e:
-            msg = "Bad argument {} supplied to the evaluator: {}".format(
-                str(decision_vector), str(e)
-            )
-            raise ObjectiveError(msg)
+        result = _call_evaluator(self, decision_vector)
+        return self._store_results(decision_vector, result)
+
+    async def _func_evaluate_async(
+        self, decision_vector: np.ndarray
+    ) -> ObjectiveEvaluationResults:
+        """Asynchronous version of _func_evaluate. Coroutine evaluators are awaited,
+        other evaluators are run in the default executor of the event loop.
+
+        """
+        result = await _call_evaluator_async(self, decision_vector)
+        return self._store_results(decision_vector, result)
+
+    def _store_results(
+        self, decision_vector: np.ndarray, result: Union[List, np.ndarray]
+    ) -> ObjectiveEvaluationResults:
+        """Store the values returned by the evaluator and build the results.
+
+        """
         result = tuple(result)
 
         # Store the value of the objective
@@ -404,6 +702,19 @@ class _ScalarDataObjective(_ScalarObjective):
     maximize : List[bool], optional
         Boolean describing whether the objective is to be maximized or not, by default
         None, which defaults to [False], hence minimizes.
+    archive : EvaluationArchive, optional
+        An on-disk archive to which every true evaluation is appended. The samples
+        already stored in the archive are added to the training data. By default
+        None.
+
+    Attributes
+    ----------
+    samples : SampleArchive
+        The training data, including the samples added by true evaluations.
+    X : np.ndarray
+        A view of the decision vectors in samples.
+    y : np.ndarray
+        A view of the objective values in samples.
 
     Raises
     ------
@@ -420,16 +731,56 @@ class _ScalarDataObjective(_ScalarObjective):
         lower_bound: float = -np.inf,
         upper_bound: float = np.inf,
         maximize: List[bool] = None,
+        archive: EvaluationArchive = None,
     ) -> None:
         if name in data.columns:
             super().__init__(name, evaluator, lower_bound, upper_bound, maximize)
         else:
             msg = f'Name "{name}" not found in the dataframe provided'
             raise ObjectiveError(msg)
-        self.X = data.drop(name, axis=1)
-        self.y = data[name]
-        self.variable_names = self.X.columns
+        self.samples: SampleArchive = SampleArchive(data.drop(name, axis=1), data[name])
+        self.variable_names = data.columns.drop(name)
         self._model = None
+        # Whether the model was trained on all of self.samples, and should be updated
+        # when new samples are added.
+        self._model_on_samples: bool = False
+        # Keeps the samples and the model updated with them consistent
+        self.__samples_lock: threading.Lock = threading.Lock()
+        self.archive: EvaluationArchive = archive
+        if archive is not None:
+            self.load_archive(archive)
+
+    def load_archive(self, archive: EvaluationArchive):
+        """Add the samples stored in an archive to the training data. The archive is
+        read one chunk at a time.
+
+        Parameters
+        ----------
+        archive : EvaluationArchive
+            The archive. Initialized with the variables and the objective of this
+            objective if empty.
+        """
+        archive.initialize(list(self.variable_names), [self.name])
+        for chunk in archive.iter_chunks():
+            self._extend_samples(chunk.decision_vectors, chunk.objectives)
+
+    @property
+    def X(self) -> np.ndarray:
+        return self.samples.X
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.samples.y
+
+    def _extend_samples(self, X: np.ndarray, y: np.ndarray):
+        with self.__samples_lock:
+            self.samples.append(X, y)
+            if self._model_on_samples and hasattr(self._model, "partial_fit"):
+                try:
+                    self._model.partial_fit(X, y)
+                except ModelError as e:
+                    msg = f"Could not update the surrogate model with new samples: {e}"
+                    raise ObjectiveError(msg)
 
     def train(
         self,
@@ -437,6 +788,7 @@ class _ScalarDataObjective(_ScalarObjective):
         model_parameters: Dict = None,
         index: List[int] = None,
         data: pd.DataFrame = None,
+        store: ModelStore = None,
     ):
         """Train surrogate model for the objective.
 
@@ -458,26 +810,51 @@ class _ScalarDataObjective(_ScalarObjective):
         data : pd.DataFrame, optional
             Extra data to be used for training only. This data is not saved. By default
             None, which then uses self.X and self.y for training.
+        store : ModelStore, optional
+            A store of trained models. If a model trained on the same data with the
+            same parameters is found in the store, it is loaded instead of trained.
+            Newly trained models are saved in the store. By default None.
+
+        Notes
+        -----
+        If the model is trained on the entire dataset and it has a partial_fit method,
+        the samples added later by true evaluations are passed to partial_fit.
 
         Raises
         ------
         ObjectiveError
             For unexpected errors
         """
-        if model_parameters is None:
-            model_parameters = {}
-        self._model = model(**model_parameters)
+        (fitted_model,) = _fit_models(
+            [model], [model_parameters], [self._training_data(index, data)], store=store
+        )
+        self._install_model(fitted_model, index is None and data is None)
+
+    def _training_data(
+        self, index: List[int] = None, data: pd.DataFrame = None
+    ) -> Tuple[Union[np.ndarray, pd.DataFrame], Union[np.ndarray, pd.Series]]:
+        """Return the samples used to train the surrogate model, as chosen by the
+        index and data arguments of train.
+
+        """
         if index is None and data is None:
-            self._model.fit(self.X, self.y)
-            return
+            return self.X, self.y
         elif index is not None:
-            self._model.fit(self.X[index], self.y[index])
-            return
-        elif data is not None:
-            self._model.fit(data[self.variable_names], data[self.name])
-            return
-        msg = "I don't know how you got this error"
-        raise ObjectiveError(msg)
+            return self.X[index], self.y[index]
+        return data[self.variable_names], data[self.name]
+
+    def _install_model(self, model: BaseRegressor, on_samples: bool):
+        """Use a fitted model as the surrogate model.
+
+        Parameters
+        ----------
+        model : BaseRegressor
+            The fitted model.
+        on_samples : bool
+            Whether the model was fitted on all of self.samples.
+        """
+        self._model = model
+        self._model_on_samples = on_samples
 
     def _surrogate_evaluate(
         self, decision_vector: np.ndarray
@@ -491,15 +868,27 @@ class _ScalarDataObjective(_ScalarObjective):
             raise ObjectiveError(msg)
         return ObjectiveEvaluationResults(result, uncertainity)
 
-    def _func_evaluate(self, decision_vector: np.ndarray) -> ObjectiveEvaluationResults:
-        if self.evaluator is None:
-            msg = "No analytical function provided"
-            raise ObjectiveError(msg)
-        results = super()._func_evaluate(decision_vector)
-        self.X = np.vstack((self.X, decision_vector))
-        self.y = np.vstack((self.y, results.objectives))
+    def _store_results(
+        self, decision_vector: np.ndarray, result: Union[float, np.ndarray]
+    ) -> ObjectiveEvaluationResults:
+        results = super()._store_results(decision_vector, result)
+        self._extend_samples(decision_vector, results.objectives)
+        if self.archive is not None:
+            self.archive.append(
+                decision_vector, results.objectives, results.uncertainity
+            )
         return results
 
+    def __getstate__(self):
+        # Locks can not be pickled
+        state = self.__dict__.copy()
+        del state["_ScalarDataObjective__samples_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__samples_lock = threading.Lock()
+
 
 class VectorDataObjective(VectorObjective):
     """A Objective class for multi/valued objectives. Use when the an evaluator/
@@ -523,6 +912,19 @@ class VectorDataObjective(VectorObjective):
     maximize : List[bool], optional
         Boolean describing whether the objective is to be maximized or not, by default
         None, which defaults to [False], hence minimizes.
+    archive : EvaluationArchive, optional
+        An on-disk archive to which every true evaluation is appended. The samples
+        already stored in the archive are added to the training data. By default
+        None.
+
+    Attributes
+    ----------
+    samples : SampleArchive
+        The training data, including the samples added by true evaluations.
+    X : np.ndarray
+        A view of the decision vectors in samples.
+    y : np.ndarray
+        A view of the objective values in samples.
 
     Raises
     ------
@@ -538,6 +940,7 @@ class VectorDataObjective(VectorObjective):
         lower_bounds: Union[List[float], np.ndarray] = None,
         upper_bounds: Union[List[float], np.ndarray] = None,
         maximize: List[bool] = None,
+        archive: EvaluationArchive = None,
     ) -> None:
 
         if all(obj in data.columns for obj in name):
@@ -545,11 +948,56 @@ class VectorDataObjective(VectorObjective):
         else:
             msg = f'Name "{name}" not found in the dataframe provided'
             raise ObjectiveError(msg)
-        self.X = data.drop(name, axis=1)
-        self.y = data[name]
-        self.variable_names = self.X.columns
+        self.samples: SampleArchive = SampleArchive(data.drop(name, axis=1), data[name])
+        self.variable_names = data.columns.drop(name)
         self._model = dict.fromkeys(name)  # TODO: Make the set of keys immutable?
         self._model_trained = dict.fromkeys(name, False)
+        # Whether each model was trained on all of self.samples, and should be
+        # updated when new samples are added.
+        self._model_on_samples = dict.fromkeys(name, False)
+        # Keeps the samples and the models updated with them consistent
+        self.__samples_lock: threading.Lock = threading.Lock()
+        self.archive: EvaluationArchive = archive
+        if archive is not None:
+            self.load_archive(archive)
+
+    def load_archive(self, archive: EvaluationArchive):
+        """Add the samples stored in an archive to the training data. The archive is
+        read one chunk at a time.
+
+        Parameters
+        ----------
+        archive : EvaluationArchive
+            The archive. Initialized with the variables and the objectives of this
+            objective if empty.
+        """
+        archive.initialize(list(self.variable_names), list(self.name))
+        for chunk in archive.iter_chunks():
+            self._extend_samples(chunk.decision_vectors, chunk.objectives)
+
+    @property
+    def X(self) -> np.ndarray:
+        return self.samples.X
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.samples.y
+
+    def _extend_samples(self, X: np.ndarray, y: np.ndarray):
+        with self.__samples_lock:
+            self.samples.append(X, y)
+            y = np.reshape(y, (-1, self.n_of_objectives))
+            for column, name in enumerate(self.name):
+                model = self._model[name]
+                if self._model_on_samples[name] and hasattr(model, "partial_fit"):
+                    try:
+                        model.partial_fit(X, y[:, column])
+                    except ModelError as e:
+                        msg = (
+                            f"Could not update the surrogate model of {name} with "
+                            f"new samples: {e}"
+                        )
+                        raise ObjectiveError(msg)
 
     def train(
         self,
@@ -557,6 +1005,8 @@ class VectorDataObjective(VectorObjective):
         model_parameters: Union[Dict, List[Dict]] = None,
         index: List[int] = None,
         data: pd.DataFrame = None,
+        executor: BaseExecutor = None,
+        store: ModelStore = None,
     ):
         """Train surrogate models for the objective.
 
@@ -587,6 +1037,21 @@ class VectorDataObjective(VectorObjective):
         data : pd.DataFrame, optional
             Extra data to be used for training only. This data is not saved. By default
             None, which then uses self.X and self.y for training.
+        executor : BaseExecutor, optional
+            An executor used to fit the models of the objectives in parallel, e.g., a
+            ProcessExecutor. The models and their parameters must then be picklable.
+            If any of the fits raises an exception, the fits not yet started are
+            cancelled and the exception is raised. By default None, which fits the
+            models one after another.
+        store : ModelStore, optional
+            A store of trained models. If a model trained on the same data with the
+            same parameters is found in the store, it is loaded instead of trained.
+            Newly trained models are saved in the store. By default None.
+
+        Notes
+        -----
+        Models trained on the entire dataset which have a partial_fit method are
+        passed the samples added later by true evaluations.
 
         Raises
         ------
@@ -606,11 +1071,16 @@ class VectorDataObjective(VectorObjective):
             model_parameters = [model_parameters] * len(self.name)
         elif not (len(models) == len(model_parameters) == self.n_of_objectives):
             msg = (
-                "The length of lists of models and parameters should be the same as"
+                "The length of lists of models and parameters should be the same as "
                 "the number of objectives in this objective class"
             )
-        for model, model_params, name in zip(models, model_parameters, self.name):
-            self._train_one_objective(name, model, model_params, index, data)
+            raise ObjectiveError(msg)
+        training_data = [self._training_data(name, index, data) for name in self.name]
+        fitted_models = _fit_models(
+            models, model_parameters, training_data, executor, store
+        )
+        for name, model in zip(self.name, fitted_models):
+            self._install_model(name, model, index is None and data is None)
 
     def _train_one_objective(
         self,
@@ -619,6 +1089,7 @@ class VectorDataObjective(VectorObjective):
         model_parameters: Dict,
         index: List[int] = None,
         data: pd.DataFrame = None,
+        store: ModelStore = None,
     ):
         """Train surrogate model for the objective.
 
@@ -642,6 +1113,10 @@ class VectorDataObjective(VectorObjective):
         data : pd.DataFrame, optional
             Extra data to be used for training only. This data is not saved. By default
             None, which then uses self.X and self.y for training.
+        store : ModelStore, optional
+            A store of trained models. If a model trained on the same data with the
+            same parameters is found in the store, it is loaded instead of trained.
+            Newly trained models are saved in the store. By default None.
 
         Raises
         ------
@@ -653,26 +1128,75 @@ class VectorDataObjective(VectorObjective):
                 f'"{name}" not found in the list of'
                 f"original objective names: {self.name}"
             )
-        if model_parameters is None:
-            model_parameters = {}
-        self._model[name] = model(**model_parameters)
+        (fitted_model,) = _fit_models(
+            [model],
+            [model_parameters],
+            [self._training_data(name, index, data)],
+            store=store,
+        )
+        self._install_model(name, fitted_model, index is None and data is None)
+
+    def _training_data(
+        self, name: str, index: List[int] = None, data: pd.DataFrame = None
+    ) -> Tuple[Union[np.ndarray, pd.DataFrame], Union[np.ndarray, pd.Series]]:
+        """Return the samples used to train the surrogate model of the objective
+        name, as chosen by the index and data arguments of train.
+
+        """
+        column = self.name.index(name)
         if index is None and data is None:
-            self._model[name].fit(self.X, self.y[name])
-            self._model_trained[name] = True
-            return
+            return self.X, self.y[:, column]
         elif index is not None:
-            self._model[name].fit(self.X[index], self.y[name][index])
-            self._model_trained[name] = True
-            return
-        elif data is not None:
-            self._model[name].fit(data[self.variable_names], data[name])
-            self._model_trained[name] = True
-            return
-        msg = "I don't know how you got this error"
-        raise ObjectiveError(msg)
+            return self.X[index], self.y[index, column]
+        return data[self.variable_names], data[name]
+
+    def _install_model(self, name: str, model: BaseRegressor, on_samples: bool):
+        """Use a fitted model as the surrogate model of the objective name.
+
+        Parameters
+        ----------
+        name : str
+            Name of the objective.
+        model : BaseRegressor
+            The fitted model.
+        on_samples : bool
+            Whether the model was fitted on all of self.samples.
+        """
+        self._model[name] = model
+        self._model_on_samples[name] = on_samples
+        self._model_trained[name] = True
+
+    def evaluate(
+        self,
+        decision_vector: np.ndarray,
+        use_surrogate: bool = False,
+        as_dataframe: bool = False,
+    ) -> ObjectiveEvaluationResults:
+        """Evaluates the objectives according to a decision variable vector.
+
+        Parameters
+        ----------
+        decision_vector : np.ndarray
+            A 2D array of decision vectors.
+        use_surrogate : bool, optional
+            Whether to use the surrogate models or the true evaluator, by default
+            False.
+        as_dataframe : bool, optional
+            Return the surrogate predictions as pandas DataFrames with one column
+            for each objective, instead of float arrays of shape
+            (n_rows, n_of_objectives). By default False.
+
+        Returns
+        -------
+        ObjectiveEvaluationResults
+            The objective values and the uncertainity in them.
+        """
+        if use_surrogate:
+            return self._surrogate_evaluate(decision_vector, as_dataframe)
+        return self._func_evaluate(decision_vector)
 
     def _surrogate_evaluate(
-        self, decision_vector: np.ndarray
+        self, decision_vector: np.ndarray, as_dataframe: bool = False
     ) -> ObjectiveEvaluationResults:
         if not all(self._model_trained.values()):
             msg = (
@@ -681,23 +1205,44 @@ class VectorDataObjective(VectorObjective):
                 f"{self._model_trained}"
             )
             raise ObjectiveError(msg)
-        result = pd.DataFrame(index=range(decision_vector.shape[0]), columns=self.name)
-        uncertainity = pd.DataFrame(
-            index=range(decision_vector.shape[0]), columns=self.name
-        )
-        for name, model in self._model.items():
+        n_rows = np.shape(decision_vector)[0]
+        result = np.empty((n_rows, self.n_of_objectives), dtype=np.float64)
+        uncertainity = np.empty((n_rows, self.n_of_objectives), dtype=np.float64)
+        for column, name in enumerate(self.name):
             try:
-                result[name], uncertainity[name] = model.predict(decision_vector)
+                prediction, prediction_uncertainity = self._model[name].predict(
+                    decision_vector
+                )
             except ModelError:
                 msg = "Bad argument supplied to the model"
                 raise ObjectiveError(msg)
+            result[:, column] = np.reshape(prediction, n_rows)
+            if prediction_uncertainity is None:
+                uncertainity[:, column] = np.nan
+            else:
+                uncertainity[:, column] = np.reshape(prediction_uncertainity, n_rows)
+        if as_dataframe:
+            result = pd.DataFrame(result, columns=self.name)
+            uncertainity = pd.DataFrame(uncertainity, columns=self.name)
         return ObjectiveEvaluationResults(result, uncertainity)
 
-    def _func_evaluate(self, decision_vector: np.ndarray) -> ObjectiveEvaluationResults:
-        if self.evaluator is None:
-            msg = "No analytical function provided"
-            raise ObjectiveError(msg)
-        results = super()._func_evaluate(decision_vector)
-        self.X = np.vstack((self.X, decision_vector))
-        self.y = np.vstack((self.y, results.objectives))
+    def _store_results(
+        self, decision_vector: np.ndarray, result: Union[List, np.ndarray]
+    ) -> ObjectiveEvaluationResults:
+        results = super()._store_results(decision_vector, result)
+        self._extend_samples(decision_vector, results.objectives)
+        if self.archive is not None:
+            self.archive.append(
+                decision_vector, results.objectives, results.uncertainity
+            )
         return results
+
+    def __getstate__(self):
+        # Locks can not be pickled
+        state = self.__dict__.copy()
+        del state["_VectorDataObjective__samples_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__samples_lock = threading.Lock()
@@ -3,6 +3,8 @@ problems.
 
 """
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
 
 # , TypedDict coming in py3.8
@@ -13,16 +15,25 @@ from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from sklearn.neighbors import KDTree
 
-from desdeo_problem.Constraint import ScalarConstraint
+from desdeo_problem.Archive import EvaluationArchive
+from desdeo_problem.Cache import EvaluationCache
+from desdeo_problem.Constraint import ConstraintBlock, ScalarConstraint
+from desdeo_problem.Executor import BaseExecutor, SerialExecutor
+from desdeo_problem.ModelStore import ModelStore
 from desdeo_problem.Objective import (
+    ObjectiveEvaluationResults,
     VectorDataObjective,
     VectorObjective,
     _ScalarDataObjective,
     _ScalarObjective,
+    _call_evaluator,
+    _fit_models,
 )
-from desdeo_problem.surrogatemodels.SurrogateModels import BaseRegressor
-from desdeo_problem.Variable import Variable
+from desdeo_problem.Stats import EvaluationStats, timed
+from desdeo_problem.surrogatemodels.SurrogateModels import BaseRegressor, ModelError
+from desdeo_problem.Variable import Variable, VariableSet
 
 
 class ProblemError(Exception):
@@ -31,6 +42,21 @@ class ProblemError(Exception):
     """
 
 
+class BoundsViolationError(ValueError):
+    """Raised when decision vectors violate the bounds of the variables.
+
+    Attributes:
+        rows (np.ndarray): The rows of the violating elements.
+        columns (np.ndarray): The columns of the violating elements.
+
+    """
+
+    def __init__(self, msg: str, rows: np.ndarray, columns: np.ndarray):
+        super().__init__(msg)
+        self.rows: np.ndarray = rows
+        self.columns: np.ndarray = columns
+
+
 # TODO consider replacing namedtuple with attr.s for validation purposes.
 
 
@@ -78,6 +104,8 @@ class ProblemBase(ABC):
         self.__n_of_variables: int = 0
         self.__decision_vectors: np.ndarray = None
         self.__objective_vectors: np.ndarray = None
+        self.__constraint_block: ConstraintBlock = None
+        self.__stats: EvaluationStats = None
 
     @property
     def nadir(self) -> np.ndarray:
@@ -119,10 +147,30 @@ class ProblemBase(ABC):
     def decision_vectors(self, val: np.ndarray):
         self.__decision_vectors = val
 
+    @property
+    def stats(self) -> EvaluationStats:
+        """The statistics of the evaluations, None if they are not collected."""
+        return self.__stats
+
+    @stats.setter
+    def stats(self, val: EvaluationStats):
+        self.__stats = val
+
     @abstractmethod
     def get_variable_bounds(self) -> Union[None, np.ndarray]:
         pass
 
+    def _constraint_block(self) -> ConstraintBlock:
+        """Return a ConstraintBlock of self.constraints, rebuilding it if the
+        constraints have changed since it was built.
+
+        """
+        block = self.__constraint_block
+        if block is None or block.constraints != tuple(self.constraints):
+            block = ConstraintBlock(self.constraints)
+            self.__constraint_block = block
+        return block
+
     @abstractmethod
     def evaluate(
         self, decision_vectors: np.ndarray, use_surrogate: bool = False
@@ -419,12 +467,6 @@ class ScalarMOProblem(ProblemBase):
         uncertainity: np.ndarray = np.ndarray(
             (n_rows, self.n_of_objectives), dtype=float
         )  # ??? Use np.zeros instead of this?
-        if self.n_of_constraints > 0:
-            constraint_values: np.ndarray = np.ndarray(
-                (n_rows, self.n_of_constraints), dtype=float
-            )
-        else:
-            constraint_values = None
 
         # Calculate the objective values
         for (col_i, objective) in enumerate(self.objectives):
@@ -435,11 +477,12 @@ class ScalarMOProblem(ProblemBase):
         fitness = objective_vectors * self._max_multiplier
 
         # Calculate the constraint values
-        if constraint_values is not None:
-            for (col_i, constraint) in enumerate(self.constraints):
-                constraint_values[:, col_i] = np.array(
-                    constraint.evaluate(decision_vectors, objective_vectors)
-                )
+        if self.n_of_constraints > 0:
+            constraint_values = self._constraint_block().evaluate(
+                decision_vectors, objective_vectors
+            )
+        else:
+            constraint_values = None
 
         return EvaluationResults(
             objective_vectors, fitness, constraint_values, uncertainity
@@ -482,6 +525,12 @@ class ScalarDataProblem(ProblemBase):
         nadir (np.ndarray): The nadir point of the problem.
         ideal (np.ndarray): The ideal point of the problem.
 
+    Note:
+        A KD-tree of the decision_vectors is built at construction and used to find
+        the closest decision vectors in evaluate. It is rebuilt if decision_vectors
+        is replaced with another array. After calling build_model, evaluate
+        interpolates between the closest decision vectors instead.
+
     Note:
         It is assumed that the decision_vectors and objectives follow a direct
         one-to-one mapping, i.e., the objective values on the ith row in
@@ -502,6 +551,8 @@ class ScalarDataProblem(ProblemBase):
         # Used to indicate if a model has been built to represent the model.
         # Used in the evaluation.
         self.__model_exists: bool = False
+        self.__n_neighbors: int = 1
+        self.__power: float = 2.0
         self.__constraints: List[ScalarConstraint] = []
 
         try:
@@ -525,6 +576,10 @@ class ScalarDataProblem(ProblemBase):
         self.nadir = np.max(self.objective_vectors, axis=0)
         self.ideal = np.min(self.objective_vectors, axis=0)
 
+        self.__tree: KDTree = None
+        self.__tree_data: np.ndarray = None
+        self._spatial_index()
+
     @property
     def epsilon(self) -> float:
         return self.__epsilon
@@ -584,39 +639,101 @@ class ScalarDataProblem(ProblemBase):
 
         return constraint_values
 
+    def build_model(self, n_neighbors: int = 5, power: float = 2.0):
+        """Interpolate the objective vectors in evaluate instead of returning the
+        objective vector of the closest decision vector. The objective values are
+        the average of the objective vectors of the n_neighbors closest decision
+        vectors, weighted by the inverse of their distances to the power of
+        power.
+
+        Args:
+            n_neighbors (int, optional): The number of closest decision vectors
+            interpolated between. Defaults to 5.
+            power (float, optional): The power of the inverse distances used as
+            weights. Zero weights the closest decision vectors equally.
+            Defaults to 2.0.
+
+        Raises:
+            ProblemError: n_neighbors is not between 1 and the number of
+            decision vectors, or power is negative.
+
+        """
+        if not 1 <= n_neighbors <= len(self.decision_vectors):
+            msg = (
+                f"n_neighbors should be between 1 and the number of decision "
+                f"vectors {len(self.decision_vectors)}. Recieved {n_neighbors}"
+            )
+            raise ProblemError(msg)
+        if power < 0:
+            msg = f"power should be non-negative. Recieved {power}"
+            raise ProblemError(msg)
+        self.__n_neighbors = n_neighbors
+        self.__power = power
+        self.__model_exists = True
+
     def evaluate(self, decision_vectors: np.ndarray) -> np.ndarray:
         """Evaluate the values of the objectives corresponding to the decision
         decision_vectors.
 
         Args:
             decision_vectors (np.ndarray): A 2D array with the decision
-            decision_vectors to be evaluated on each row.
+            decision_vectors to be evaluated on each row. A single decision
+            vector may be given as a 1D array.
 
         Returns:
             nd.ndarray: A 2D array with the objective values corresponding to
-            each decision vectors on the rows.
+            each decision vectors on the rows. If decision_vectors is a 1D array,
+            a 1D array with the objective values of the single decision vector.
+            If build_model has been called, the objective values are followed by
+            their uncertainity of the same shape, the weighted standard
+            deviation of the interpolated objective vectors.
 
         Note:
-            At the moment, this function just maps the given decision
-            decision_vectors to the closest decision variable present (using an
-            L2 distance) in the problem and returns the corresponsing objective
-            vector.
+            Unless build_model has been called, this function just maps the given
+            decision decision_vectors to the closest decision variable present
+            (using an L2 distance) in the problem and returns the corresponsing
+            objective vector.
 
         """
+        queries = np.atleast_2d(decision_vectors)
         if not self.__model_exists:
-            idx = np.unravel_index(
-                np.linalg.norm(
-                    self.decision_vectors - decision_vectors, axis=1
-                ).argmin(),
-                self.objective_vectors.shape,
-                order="F",
-            )[0]
+            _, idx = self._spatial_index().query(queries, k=1)
+            idx = idx[:, 0]
+            if np.ndim(decision_vectors) == 1:
+                idx = idx[0]
+            return (self.objective_vectors[idx],)
+
+        distances, idx = self._spatial_index().query(queries, k=self.__n_neighbors)
+        # Decision vectors present in the problem get their own objective vectors
+        exact = distances == 0
+        with np.errstate(divide="ignore"):
+            weights = np.where(
+                exact.any(axis=1, keepdims=True),
+                exact.astype(float),
+                distances ** -self.__power,
+            )
+        weights /= weights.sum(axis=1, keepdims=True)
 
-        else:
-            msg = "Models not implemented yet for data based problems."
-            raise NotImplementedError(msg)
+        # neighbours: (n_of_queries, n_neighbors, n_of_objectives)
+        neighbours = self.objective_vectors[idx]
+        objectives = np.einsum("qk,qko->qo", weights, neighbours)
+        variance = np.einsum(
+            "qk,qko->qo", weights, (neighbours - objectives[:, None, :]) ** 2
+        )
+        uncertainity = np.sqrt(variance)
+        if np.ndim(decision_vectors) == 1:
+            return (objectives[0], uncertainity[0])
+        return (objectives, uncertainity)
 
-        return (self.objective_vectors[idx],)
+    def _spatial_index(self) -> KDTree:
+        """Return the KD-tree of self.decision_vectors, rebuilding it if
+        decision_vectors has been replaced since it was built.
+
+        """
+        if self.__tree is None or self.__tree_data is not self.decision_vectors:
+            self.__tree = KDTree(self.decision_vectors)
+            self.__tree_data = self.decision_vectors
+        return self.__tree
 
 
 class MOProblem(ProblemBase):
@@ -627,12 +744,29 @@ class MOProblem(ProblemBase):
     Args:
         objectives (List[Union[_ScalarObjective, VectorObjective]]): A list containing
             the objectives of the problem.
-        variables (List[Variable]): A list containing the variables of the problem.
+        variables (Union[List[Variable], VariableSet]): A list or a VariableSet
+            containing the variables of the problem.
         constraints (List[ScalarConstraint]): A list of the constraints of the problem.
         nadir (Optional[np.ndarray], optional): Nadir point of the problem.
             Defaults to None.
         ideal (Optional[np.ndarray], optional): Ideal point of the problem.
             Defaults to None.
+        executor (BaseExecutor, optional): The executor used to evaluate the
+            objectives, and chunks of the population, concurrently. Defaults to None,
+            which evaluates the objectives one after another on the whole population.
+        trusted (bool, optional): If True, the decision vectors are not checked
+            against the number of variables and the variable bounds. Use only when the
+            caller guarantees valid decision vectors. Can be overridden on each call
+            to evaluate. Defaults to False.
+        cache (EvaluationCache, optional): A cache for the results of the true
+            evaluations. Decision vectors found in the cache are not evaluated again.
+            Defaults to None, which disables caching.
+        archive (EvaluationArchive, optional): An on-disk archive to which every true
+            evaluation is appended. If a cache is also given, it is warm-started with
+            the evaluations already in the archive. Defaults to None.
+        stats (EvaluationStats, optional): Statistics in which the time spent on each
+            objective, constraint and surrogate model, and on checking the decision
+            vectors, is recorded. Defaults to None, which measures nothing.
 
     Raises:
         ProblemError: If ideal or nadir vectors are not the same size as number of
@@ -645,17 +779,23 @@ class MOProblem(ProblemBase):
     def __init__(
         self,
         objectives: List[Union[_ScalarObjective, VectorObjective]],
-        variables: List[Variable],
+        variables: Union[List[Variable], VariableSet],
         constraints: List[ScalarConstraint] = None,
         nadir: Optional[np.ndarray] = None,
         ideal: Optional[np.ndarray] = None,
+        executor: BaseExecutor = None,
+        trusted: bool = False,
+        cache: EvaluationCache = None,
+        archive: EvaluationArchive = None,
+        stats: EvaluationStats = None,
     ):
         super().__init__()
+        self.stats = stats
         self.__objectives: List[Union[_ScalarObjective, VectorObjective]] = objectives
-        self.__variables: List[Variable] = variables
+        self.__variables: Union[List[Variable], VariableSet] = variables
         self.__constraints: List[ScalarConstraint] = constraints
-        self.__n_of_variables: int = len(self.variables)
-        self.__n_of_objectives: int = sum(map(number_of_objectives, self.__objectives))
+        self._update_variable_cache()
+        self._update_objective_cache()
         if self.constraints is not None:
             self.__n_of_constraints: int = len(self.constraints)
         else:
@@ -684,20 +824,20 @@ class MOProblem(ProblemBase):
         self.__nadir = nadir
         self.__ideal = ideal
 
-        # Multiplier to convert maximization to minimization
-        max_multiplier = np.asarray([1, -1])
-        to_maximize = [objective.maximize for objective in objectives]
-        # Does not work
-        # to_maximize = sum(to_maximize, [])  # To flatten the list
-        to_maximize = (
-            np.hstack(to_maximize) * 1
-        )  # To flatten list and convert to zeros and ones
-        # to_maximize = np.asarray(to_maximize) * 1  # Convert to zeros and ones
-        self._max_multiplier = max_multiplier[to_maximize]
-
-        # Objective and variable names
-        self.objective_names = self.get_objective_names()
-        self.variable_names = self.get_variable_names()
+        if executor is None:
+            executor = SerialExecutor()
+        self.__executor: BaseExecutor = executor
+        self.trusted: bool = trusted
+        self.__cache: EvaluationCache = cache
+        self.__archive: EvaluationArchive = archive
+        if archive is not None:
+            archive.initialize(
+                self.variable_names,
+                np.hstack(self.objective_names).tolist(),
+                self.n_of_constraints,
+            )
+            if cache is not None:
+                archive.fill_cache(cache)
 
     @property
     def n_of_constraints(self) -> int:
@@ -714,14 +854,18 @@ class MOProblem(ProblemBase):
     @objectives.setter
     def objectives(self, val: List[_ScalarObjective]):
         self.__objectives = val
+        self._update_objective_cache()
+        if self.cache is not None:
+            self.cache.clear()
 
     @property
-    def variables(self) -> List[Variable]:
+    def variables(self) -> Union[List[Variable], VariableSet]:
         return self.__variables
 
     @variables.setter
-    def variables(self, val: List[Variable]):
+    def variables(self, val: Union[List[Variable], VariableSet]):
         self.__variables = val
+        self._update_variable_cache()
 
     @property
     def constraints(self) -> List[ScalarConstraint]:
@@ -730,6 +874,8 @@ class MOProblem(ProblemBase):
     @constraints.setter
     def constraints(self, val: List[ScalarConstraint]):
         self.__constraints = val
+        if self.cache is not None:
+            self.cache.clear()
 
     @property
     def n_of_objectives(self) -> int:
@@ -763,6 +909,66 @@ class MOProblem(ProblemBase):
     def ideal(self, val: np.ndarray):
         self.__ideal = val
 
+    @property
+    def executor(self) -> BaseExecutor:
+        return self.__executor
+
+    @executor.setter
+    def executor(self, val: BaseExecutor):
+        if val is None:
+            val = SerialExecutor()
+        self.__executor = val
+
+    @property
+    def cache(self) -> EvaluationCache:
+        return self.__cache
+
+    @cache.setter
+    def cache(self, val: EvaluationCache):
+        self.__cache = val
+
+    @property
+    def archive(self) -> EvaluationArchive:
+        return self.__archive
+
+    def _update_variable_cache(self):
+        """Precompute the names and bounds of the variables. Called when the
+        variables are (re)assigned.
+
+        """
+        self.__n_of_variables = len(self.variables)
+        if isinstance(self.variables, VariableSet):
+            bounds = self.variables.get_bounds()
+            self.variable_names = list(self.variables.names)
+        else:
+            bounds = np.array(
+                [var.get_bounds() for var in self.variables], dtype=float
+            ).reshape(-1, 2)
+            self.variable_names = [var.name for var in self.variables]
+        self._variable_bounds = _read_only(bounds)
+        self._lower_bounds = _read_only(bounds[:, 0])
+        self._upper_bounds = _read_only(bounds[:, 1])
+
+    def _update_objective_cache(self):
+        """Precompute the number and names of the objectives, and the multiplier
+        converting maximization to minimization. Called when the objectives are
+        (re)assigned.
+
+        """
+        self.__n_of_objectives = sum(map(number_of_objectives, self.objectives))
+        # Multiplier to convert maximization to minimization
+        max_multiplier = np.asarray([1, -1])
+        to_maximize = [objective.maximize for objective in self.objectives]
+        # Does not work
+        # to_maximize = sum(to_maximize, [])  # To flatten the list
+        to_maximize = (
+            np.hstack(to_maximize) * 1
+        )  # To flatten list and convert to zeros and ones
+        # to_maximize = np.asarray(to_maximize) * 1  # Convert to zeros and ones
+        self._max_multiplier = _read_only(max_multiplier[to_maximize])
+        obj_list = [[(obj.name)] for obj in self.objectives]
+        self.objective_names = reduce(iadd, obj_list, [])
+
     def get_variable_bounds(self) -> Union[np.ndarray, None]:
         """Return the upper and lower bounds of each decision variable present
         in the problem as a 2D numpy array. The first column corresponds to the
@@ -771,14 +977,12 @@ class MOProblem(ProblemBase):
 
         Returns:
            np.ndarray: Lower and upper bounds of each variable
-           as a 2D numpy array. If undefined variables, return None instead.
+           as a 2D, read-only, numpy array. If undefined variables, return None
+           instead.
 
         """
         if self.variables is not None:
-            bounds = np.ndarray((self.n_of_variables, 2))
-            for ind, var in enumerate(self.variables):
-                bounds[ind] = np.array(var.get_bounds())
-            return bounds
+            return self._variable_bounds
         else:
             return None
 
@@ -790,7 +994,7 @@ class MOProblem(ProblemBase):
             List[str]: Names of the variables in the order they were added.
 
         """
-        return [var.name for var in self.variables]
+        return list(self.variable_names)
 
     def get_objective_names(self) -> List[str]:
         """Return the names of the objectives present in the problem in the
@@ -800,29 +1004,31 @@ class MOProblem(ProblemBase):
             List[str]: Names of the objectives in the order they were added.
 
         """
-        obj_list = [[(obj.name)] for obj in self.objectives]
-        return reduce(iadd, obj_list, [])
+        return list(self.objective_names)
 
     def get_variable_lower_bounds(self) -> np.ndarray:
         """Return the lower bounds of each variable as a list. The order of the bounds
         follows the order the variables were added to the problem.
 
         Returns:
-            np.ndarray: An array with the lower bounds of the variables.
+            np.ndarray: A read-only array with the lower bounds of the variables.
         """
-        return np.array([var.get_bounds()[0] for var in self.variables])
+        return self._lower_bounds
 
     def get_variable_upper_bounds(self) -> np.ndarray:
         """Return the upper bounds of each variable as a list. The order of the bounds
         follows the order the variables were added to the problem.
 
         Returns:
-            np.ndarray: An array with the upper bounds of the variables.
+            np.ndarray: A read-only array with the upper bounds of the variables.
         """
-        return np.array([var.get_bounds()[1] for var in self.variables])
+        return self._upper_bounds
 
     def evaluate(
-        self, decision_vectors: np.ndarray, use_surrogate: bool = False
+        self,
+        decision_vectors: np.ndarray,
+        use_surrogate: bool = False,
+        trusted: bool = None,
     ) -> EvaluationResults:
         """Evaluates the problem using an ensemble of input vectors.
 
@@ -832,6 +1038,9 @@ class MOProblem(ProblemBase):
             variable.
             use_surrogate (bool): A bool to control whether to use the true, potentially
             expensive function or a surrogate model to evaluate the objectives.
+            trusted (bool, optional): If True, skip checking the decision vectors
+            against the number of variables and the variable bounds. Defaults to
+            None, which uses self.trusted.
 
         Returns:
             Tuple[np.ndarray, Union[None, np.ndarray]]: If constraint are
@@ -841,30 +1050,298 @@ class MOProblem(ProblemBase):
 
         Raises:
             ProblemError: The decision_vectors have wrong dimensions.
-            ValueError: If decision_vectors violate the lower or upper bounds.
+            BoundsViolationError: If decision_vectors violate the lower or upper
+            bounds. A subclass of ValueError.
 
         """
+        stats = self.stats
+        if stats is not None:
+            start = time.perf_counter()
+        decision_vectors = self._check_decision_vectors(decision_vectors, trusted)
+
+        if use_surrogate:
+            objective_vectors, uncertainity = self._evaluate_objectives(
+                decision_vectors, use_surrogate
+            )
+            # Calculate the constraint values
+            constraint_values = self._evaluate_constraints(
+                decision_vectors, objective_vectors
+            )
+        elif self.cache is not None:
+            (
+                objective_vectors,
+                uncertainity,
+                constraint_values,
+            ) = self._evaluate_with_cache(decision_vectors)
+        else:
+            (
+                objective_vectors,
+                uncertainity,
+                constraint_values,
+            ) = self._evaluate_true(decision_vectors)
+
+        # Calculate fitness, which is always to be minimized
+        fitness = objective_vectors * self._max_multiplier
+
+        if stats is not None:
+            stats.record(
+                "evaluate",
+                "evaluate",
+                time.perf_counter() - start,
+                decision_vectors.shape[0],
+            )
+        return EvaluationResults(
+            objective_vectors, fitness, constraint_values, uncertainity
+        )
+
+    def _evaluate_true(
+        self, decision_vectors: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, Union[None, np.ndarray]]:
+        """Evaluate the objectives and constraints using the true evaluators, and
+        append the results to self.archive.
+
+        Args:
+            decision_vectors (np.ndarray): A 2D array of decision vectors.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, Union[None, np.ndarray]]: The objective
+            vectors, the uncertainity in them and the constraint values.
+
+        """
+        objective_vectors, uncertainity = self._evaluate_objectives(decision_vectors)
+        constraint_values = self._evaluate_constraints(
+            decision_vectors, objective_vectors
+        )
+        if self.archive is not None:
+            self.archive.append(
+                decision_vectors, objective_vectors, uncertainity, constraint_values
+            )
+        return objective_vectors, uncertainity, constraint_values
+
+    def _evaluate_with_cache(
+        self, decision_vectors: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, Union[None, np.ndarray]]:
+        """Evaluate the objectives and constraints using self.cache. The rows not
+        found in the cache are evaluated together as one batch, and their results
+        are added to the cache. Rows repeated in decision_vectors are evaluated only
+        once.
+
+        Args:
+            decision_vectors (np.ndarray): A 2D array of decision vectors.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, Union[None, np.ndarray]]: The objective
+            vectors, the uncertainity in them and the constraint values.
+
+        """
+        (
+            objective_vectors,
+            uncertainity,
+            constraint_values,
+            missing,
+        ) = self._lookup_cache(decision_vectors)
+        if missing:
+            to_evaluate = decision_vectors[[rows[0] for rows in missing.values()]]
+            self._store_in_cache(
+                missing,
+                self._evaluate_true(to_evaluate),
+                objective_vectors,
+                uncertainity,
+                constraint_values,
+            )
+        return objective_vectors, uncertainity, constraint_values
+
+    def _lookup_cache(
+        self, decision_vectors: np.ndarray
+    ) -> Tuple[
+        np.ndarray, np.ndarray, Union[None, np.ndarray], Dict[bytes, List[int]]
+    ]:
+        """Fill the results of the rows of decision_vectors found in self.cache.
+
+        Args:
+            decision_vectors (np.ndarray): A 2D array of decision vectors.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, Union[None, np.ndarray],
+            Dict[bytes, List[int]]]: The objective vectors, the uncertainity in them
+            and the constraint values, filled on the rows found in the cache, and
+            the rows missing from the cache grouped by their keys.
+
+        """
+        n_rows = decision_vectors.shape[0]
+        objective_vectors = np.ndarray((n_rows, self.n_of_objectives), dtype=float)
+        uncertainity = np.ndarray((n_rows, self.n_of_objectives), dtype=float)
+        if self.n_of_constraints > 0:
+            constraint_values = np.ndarray(
+                (n_rows, self.n_of_constraints), dtype=float
+            )
+        else:
+            constraint_values = None
+
+        # Rows missing from the cache, grouped by their keys
+        missing: Dict[bytes, List[int]] = {}
+        for row, key in enumerate(self.cache.keys(decision_vectors)):
+            cached = self.cache.get(key)
+            if cached is None:
+                missing.setdefault(key, []).append(row)
+                continue
+            objective_vectors[row] = cached.objectives
+            uncertainity[row] = cached.uncertainity
+            if constraint_values is not None:
+                constraint_values[row] = cached.constraints
+        return objective_vectors, uncertainity, constraint_values, missing
+
+    def _store_in_cache(
+        self,
+        missing: Dict[bytes, List[int]],
+        new_results: Tuple[np.ndarray, np.ndarray, Union[None, np.ndarray]],
+        objective_vectors: np.ndarray,
+        uncertainity: np.ndarray,
+        constraint_values: Union[None, np.ndarray],
+    ):
+        """Store the results of evaluating the rows missing from self.cache, one row
+        for each key, and copy them to all the rows of each key.
+
+        Args:
+            missing (Dict[bytes, List[int]]): The missing rows grouped by their
+            keys, as returned by _lookup_cache.
+            new_results (Tuple[np.ndarray, np.ndarray, Union[None, np.ndarray]]): The
+            objective vectors, uncertainity and constraint values of the first row
+            of each key, in the order of missing.
+            objective_vectors (np.ndarray): The objective vectors to be filled.
+            uncertainity (np.ndarray): The uncertainity to be filled.
+            constraint_values (Union[None, np.ndarray]): The constraint values to be
+            filled, None if the problem has no constraints.
+
+        """
+        new_objectives, new_uncertainity, new_constraints = new_results
+        for i, (key, rows) in enumerate(missing.items()):
+            objective_vectors[rows] = new_objectives[i]
+            uncertainity[rows] = new_uncertainity[i]
+            if constraint_values is not None:
+                constraint_values[rows] = new_constraints[i]
+                self.cache.store(
+                    key, new_objectives[i], new_uncertainity[i], new_constraints[i]
+                )
+            else:
+                self.cache.store(key, new_objectives[i], new_uncertainity[i])
+
+    def _check_decision_vectors(
+        self, decision_vectors: np.ndarray, trusted: bool = None
+    ) -> np.ndarray:
+        """Reshape the decision vectors into a 2D array and check them against the
+        number of variables and the variable bounds.
+
+        Args:
+            decision_vectors (np.ndarray): A 1D or 2D array of decision vectors.
+            trusted (bool, optional): If True, only reshape the decision vectors.
+            Defaults to None, which uses self.trusted.
+
+        Returns:
+            np.ndarray: The decision vectors as a 2D array.
+
+        Raises:
+            ProblemError: The decision_vectors have wrong dimensions.
+            BoundsViolationError: If decision_vectors violate the lower or upper
+            bounds.
+
+        """
+        stats = self.stats
+        if stats is None:
+            return self._validate_decision_vectors(decision_vectors, trusted)
+        start = time.perf_counter()
+        decision_vectors = self._validate_decision_vectors(decision_vectors, trusted)
+        stats.record(
+            "validation",
+            "decision vectors",
+            time.perf_counter() - start,
+            decision_vectors.shape[0],
+        )
+        return decision_vectors
+
+    def _validate_decision_vectors(
+        self, decision_vectors: np.ndarray, trusted: bool = None
+    ) -> np.ndarray:
+        """The checks of _check_decision_vectors, without recording statistics."""
         # Reshape decision_vectors with single row to work with the code
         shape = np.shape(decision_vectors)
         if len(shape) == 1:
             decision_vectors = np.reshape(decision_vectors, (1, shape[0]))
+            shape = (1, shape[0])
+        if trusted is None:
+            trusted = self.trusted
+        if trusted:
+            return decision_vectors
 
-        # Checking bounds
-        if np.any(self.get_variable_lower_bounds() > decision_vectors):
-            raise ValueError("Some decision variable values violate lower bounds")
-        if np.any(self.get_variable_upper_bounds() < decision_vectors):
-            raise ValueError("Some decision variable values violate upper bounds")
-
-        (n_rows, n_cols) = np.shape(decision_vectors)
-
-        if n_cols != self.n_of_variables:
+        if len(shape) != 2 or shape[1] != self.n_of_variables:
             msg = (
                 "The length of the input vectors does not match the number "
                 "of variables in the problem: Input vector length {}, "
                 "number of variables {}."
-            ).format(n_cols, self.n_of_variables)
+            ).format(shape[-1] if shape else 0, self.n_of_variables)
             raise ProblemError(msg)
 
+        # Checking both bounds in one pass
+        violations = (decision_vectors < self._lower_bounds) | (
+            decision_vectors > self._upper_bounds
+        )
+        if violations.any():
+            raise self._bounds_violation(decision_vectors, violations)
+        return decision_vectors
+
+    def _bounds_violation(
+        self, decision_vectors: np.ndarray, violations: np.ndarray
+    ) -> BoundsViolationError:
+        """Build the error listing the elements of decision_vectors which violate the
+        bounds. Only the first ten elements are described in the message.
+
+        Args:
+            decision_vectors (np.ndarray): A 2D array of decision vectors.
+            violations (np.ndarray): A boolean array marking the violating elements.
+
+        Returns:
+            BoundsViolationError: The error to be raised.
+
+        """
+        rows, columns = np.nonzero(violations)
+        values = np.asarray(decision_vectors)[rows, columns]
+        n_shown = 10
+        described = []
+        for (row, column, value) in zip(
+            rows[:n_shown], columns[:n_shown], values[:n_shown]
+        ):
+            if value < self._lower_bounds[column]:
+                bound = f"lower bound {self._lower_bounds[column]}"
+            else:
+                bound = f"upper bound {self._upper_bounds[column]}"
+            described.append(
+                f"row {row}, variable {self.variable_names[column]}: "
+                f"{value} violates the {bound}"
+            )
+        if len(rows) > n_shown:
+            described.append("...")
+        msg = (
+            f"Some decision variable values violate the bounds. Number of "
+            f"violations: {len(rows)}.\n" + "\n".join(described)
+        )
+        return BoundsViolationError(msg, rows, columns)
+
+    def _evaluate_objectives(
+        self, decision_vectors: np.ndarray, use_surrogate: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate all the objectives of the problem using self.executor. Each
+        objective is evaluated on each chunk of the population as a separate task.
+
+        Args:
+            decision_vectors (np.ndarray): A 2D array of decision vectors.
+            use_surrogate (bool): Whether to use the surrogate models.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The objective vectors and the
+            uncertainity in them. One column for each objective.
+
+        """
+        n_rows = decision_vectors.shape[0]
         objective_vectors: np.ndarray = np.ndarray(
             (n_rows, self.n_of_objectives), dtype=float
         )
@@ -873,50 +1350,309 @@ class MOProblem(ProblemBase):
             (n_rows, self.n_of_objectives), dtype=float
         )
 
-        if self.n_of_constraints > 0:
-            constraint_values: np.ndarray = np.ndarray(
-                (n_rows, self.n_of_constraints), dtype=float
+        # Build one task for each combination of an objective and a chunk of rows
+        tasks = [
+            (objective, rows, columns)
+            for (objective, columns) in self._objective_columns()
+            for rows in self.executor.chunks(n_rows)
+        ]
+
+        objectives = [objective for (objective, _, _) in tasks]
+        chunks = [decision_vectors[rows] for (_, rows, _) in tasks]
+        stats = self.stats
+        if stats is None:
+            all_results = self.executor.map(
+                _evaluate_objective, objectives, chunks, [use_surrogate] * len(tasks)
             )
         else:
-            constraint_values = None
+            # The tasks are timed where they run, so that the times of concurrent
+            # tasks do not include waiting for each other
+            timed_results = self.executor.map(
+                timed,
+                [_evaluate_objective] * len(tasks),
+                objectives,
+                chunks,
+                [use_surrogate] * len(tasks),
+            )
+            kind = "surrogate" if use_surrogate else "objective"
+            all_results = []
+            for objective, chunk, (results, seconds) in zip(
+                objectives, chunks, timed_results
+            ):
+                stats.record(kind, _stats_name(objective), seconds, chunk.shape[0])
+                all_results.append(results)
+
+        if not use_surrogate:
+            # The results are stored in this process, in the order of the rows, as
+            # the objectives in the tasks of a ProcessExecutor are copies
+            all_results = [
+                objective._store_results(chunk, results)
+                if _evaluates_in_parts(objective)
+                else results
+                for objective, chunk, results in zip(objectives, chunks, all_results)
+            ]
+
+        for (_, rows, columns), results in zip(tasks, all_results):
+            _place_results(objective_vectors, uncertainity, rows, columns, results)
+        return objective_vectors, uncertainity
+
+    def _objective_columns(
+        self
+    ) -> List[Tuple[Union[_ScalarObjective, VectorObjective], slice]]:
+        """Return the objectives of the problem paired with the columns of the
+        objective vectors they fill.
 
-        # Calculate the objective values
+        """
+        objective_columns = []
         obj_column = 0
         for objective in self.objectives:
             elem_in_curr_obj = number_of_objectives(objective)
+            objective_columns.append(
+                (objective, slice(obj_column, obj_column + elem_in_curr_obj))
+            )
+            obj_column = obj_column + elem_in_curr_obj
+        return objective_columns
 
-            if elem_in_curr_obj == 1:
-                results = objective.evaluate(decision_vectors, use_surrogate)
-                objective_vectors[:, obj_column] = results.objectives
-                uncertainity[:, obj_column] = results.uncertainity
-            elif elem_in_curr_obj > 1:
-                # results = list(map(objective.evaluate, decision_vectors))
-                results = objective.evaluate(decision_vectors, use_surrogate)
+    def _evaluate_constraints(
+        self, decision_vectors: np.ndarray, objective_vectors: np.ndarray
+    ) -> Union[None, np.ndarray]:
+        """Evaluate the constraints of the problem.
 
-                objective_vectors[
-                    :, obj_column : obj_column + elem_in_curr_obj
-                ] = results.objectives
+        Args:
+            decision_vectors (np.ndarray): A 2D array of decision vectors.
+            objective_vectors (np.ndarray): The corresponding objective vectors.
 
-                uncertainity[
-                    :, obj_column : obj_column + elem_in_curr_obj
-                ] = results.uncertainity
+        Returns:
+            Union[None, np.ndarray]: The constraint values, one column for each
+            constraint. None if the problem has no constraints.
 
-            obj_column = obj_column + elem_in_curr_obj
+        """
+        if self.n_of_constraints == 0:
+            return None
+        return self._constraint_block().evaluate(
+            decision_vectors, objective_vectors, self.stats
+        )
 
-        # Calculate fitness, which is always to be minimized
-        fitness = objective_vectors * self._max_multiplier
+    async def evaluate_async(
+        self,
+        decision_vectors: np.ndarray,
+        use_surrogate: bool = False,
+        max_concurrency: int = None,
+        timeout: float = None,
+        trusted: bool = None,
+    ) -> EvaluationResults:
+        """Asynchronous version of evaluate. The objectives are evaluated
+        concurrently, followed by the constraints. Coroutine evaluators are awaited,
+        other evaluators are run in the default executor of the event loop. As in
+        evaluate, the decision vectors found in self.cache are not evaluated again.
 
-        # Calculate the constraint values
-        if constraint_values is not None:
-            for (col_i, constraint) in enumerate(self.constraints):
-                constraint_values[:, col_i] = np.array(
-                    constraint.evaluate(decision_vectors, objective_vectors)
+        Args:
+            decision_vectors (np.ndarray): An 2D array of decision variable
+            input vectors. Each column represent the values of each decision
+            variable.
+            use_surrogate (bool): A bool to control whether to use the true, potentially
+            expensive function or a surrogate model to evaluate the objectives.
+            max_concurrency (int, optional): Maximum number of objective or constraint
+            evaluations running at the same time. Defaults to None, which means no
+            limit.
+            timeout (float, optional): Time in seconds allowed for each objective or
+            constraint evaluation. Defaults to None, which means no time limit.
+            trusted (bool, optional): If True, skip checking the decision vectors
+            against the number of variables and the variable bounds. Defaults to
+            None, which uses self.trusted.
+
+        Returns:
+            EvaluationResults: Same as the results returned by evaluate.
+
+        Raises:
+            ProblemError: The decision_vectors have wrong dimensions, or an
+            evaluation did not finish in time.
+            BoundsViolationError: If decision_vectors violate the lower or upper
+            bounds. A subclass of ValueError.
+
+        """
+        stats = self.stats
+        if stats is not None:
+            start = time.perf_counter()
+        decision_vectors = self._check_decision_vectors(decision_vectors, trusted)
+        if max_concurrency is not None:
+            semaphore = asyncio.Semaphore(max_concurrency)
+        else:
+            semaphore = None
+
+        async def limited(kind: str, name: str, n_rows: int, awaitable):
+            if semaphore is not None:
+                async with semaphore:
+                    return await limited_in_time(kind, name, n_rows, awaitable)
+            return await limited_in_time(kind, name, n_rows, awaitable)
+
+        async def limited_in_time(kind: str, name: str, n_rows: int, awaitable):
+            if stats is not None:
+                task_start = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(awaitable, timeout)
+            except asyncio.TimeoutError:
+                msg = f"Evaluation of {name} did not finish in {timeout} seconds."
+                raise ProblemError(msg)
+            if stats is not None and kind is not None:
+                stats.record(kind, name, time.perf_counter() - task_start, n_rows)
+            return result
+
+        if use_surrogate:
+            (
+                objective_vectors,
+                uncertainity,
+                constraint_values,
+            ) = await self._evaluate_population_async(
+                decision_vectors, use_surrogate, limited
+            )
+        elif self.cache is not None:
+            (
+                objective_vectors,
+                uncertainity,
+                constraint_values,
+                missing,
+            ) = self._lookup_cache(decision_vectors)
+            if missing:
+                to_evaluate = decision_vectors[[rows[0] for rows in missing.values()]]
+                self._store_in_cache(
+                    missing,
+                    await self._evaluate_true_async(to_evaluate, limited),
+                    objective_vectors,
+                    uncertainity,
+                    constraint_values,
                 )
+        else:
+            (
+                objective_vectors,
+                uncertainity,
+                constraint_values,
+            ) = await self._evaluate_true_async(decision_vectors, limited)
 
+        # Calculate fitness, which is always to be minimized
+        fitness = objective_vectors * self._max_multiplier
+
+        if stats is not None:
+            stats.record(
+                "evaluate",
+                "evaluate_async",
+                time.perf_counter() - start,
+                decision_vectors.shape[0],
+            )
         return EvaluationResults(
             objective_vectors, fitness, constraint_values, uncertainity
         )
 
+    async def _evaluate_true_async(
+        self, decision_vectors: np.ndarray, limited: Callable
+    ) -> Tuple[np.ndarray, np.ndarray, Union[None, np.ndarray]]:
+        """Asynchronous version of _evaluate_true. The results are appended to
+        self.archive.
+
+        Args:
+            decision_vectors (np.ndarray): A 2D array of decision vectors.
+            limited (Callable): Wraps each evaluation in the concurrency and time
+            limits of evaluate_async.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, Union[None, np.ndarray]]: The objective
+            vectors, the uncertainity in them and the constraint values.
+
+        """
+        (
+            objective_vectors,
+            uncertainity,
+            constraint_values,
+        ) = await self._evaluate_population_async(decision_vectors, False, limited)
+        if self.archive is not None:
+            self.archive.append(
+                decision_vectors, objective_vectors, uncertainity, constraint_values
+            )
+        return objective_vectors, uncertainity, constraint_values
+
+    async def _evaluate_population_async(
+        self, decision_vectors: np.ndarray, use_surrogate: bool, limited: Callable
+    ) -> Tuple[np.ndarray, np.ndarray, Union[None, np.ndarray]]:
+        """Evaluate the objectives concurrently, followed by the constraints.
+
+        Args:
+            decision_vectors (np.ndarray): A 2D array of decision vectors.
+            use_surrogate (bool): Whether to use the surrogate models.
+            limited (Callable): Wraps each evaluation in the concurrency and time
+            limits of evaluate_async.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, Union[None, np.ndarray]]: The objective
+            vectors, the uncertainity in them and the constraint values.
+
+        """
+        n_rows = decision_vectors.shape[0]
+        objective_vectors, uncertainity = await self._evaluate_objectives_async(
+            decision_vectors, use_surrogate, limited
+        )
+
+        # Calculate the constraint values
+        if self.n_of_constraints > 0:
+            constraint_results = await asyncio.gather(
+                *[
+                    limited(
+                        "constraint",
+                        constraint.name,
+                        n_rows,
+                        constraint.evaluate_async(decision_vectors, objective_vectors),
+                    )
+                    for constraint in self.constraints
+                ]
+            )
+            constraint_values = np.ndarray((n_rows, self.n_of_constraints))
+            for (col_i, result) in enumerate(constraint_results):
+                constraint_values[:, col_i] = np.array(result)
+        else:
+            constraint_values = None
+        return objective_vectors, uncertainity, constraint_values
+
+    async def _evaluate_objectives_async(
+        self, decision_vectors: np.ndarray, use_surrogate: bool, limited: Callable
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate all the objectives of the problem concurrently.
+
+        Args:
+            decision_vectors (np.ndarray): A 2D array of decision vectors.
+            use_surrogate (bool): Whether to use the surrogate models.
+            limited (Callable): Wraps each evaluation in the concurrency and time
+            limits of evaluate_async.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The objective vectors and the
+            uncertainity in them. One column for each objective.
+
+        """
+        n_rows = decision_vectors.shape[0]
+        objective_vectors: np.ndarray = np.ndarray(
+            (n_rows, self.n_of_objectives), dtype=float
+        )
+        uncertainity: np.ndarray = np.ndarray(
+            (n_rows, self.n_of_objectives), dtype=float
+        )
+        objective_columns = self._objective_columns()
+        kind = "surrogate" if use_surrogate else "objective"
+        all_results = await asyncio.gather(
+            *[
+                limited(
+                    kind,
+                    _stats_name(objective),
+                    n_rows,
+                    objective.evaluate_async(decision_vectors, use_surrogate),
+                )
+                for (objective, _) in objective_columns
+            ]
+        )
+        for (_, columns), results in zip(objective_columns, all_results):
+            _place_results(
+                objective_vectors, uncertainity, slice(None), columns, results
+            )
+        return objective_vectors, uncertainity
+
     def evaluate_constraint_values(self) -> Optional[np.ndarray]:
         """Evaluate just the constraint function values using the attributes
         decision_vectors and objective_vectors
@@ -931,6 +1667,115 @@ class MOProblem(ProblemBase):
         raise NotImplementedError("Not implemented for ScalarMOProblem")
 
 
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Return a contiguous copy of array which can not be modified.
+
+    """
+    array = np.array(array, order="C")
+    array.flags.writeable = False
+    return array
+
+
+def _place_results(
+    objective_vectors: np.ndarray,
+    uncertainity: np.ndarray,
+    rows: slice,
+    columns: slice,
+    results: ObjectiveEvaluationResults,
+):
+    """Place the results of evaluating one objective in the columns of the
+    objective vectors and uncertainity arrays.
+
+    """
+    if columns.stop - columns.start == 1:
+        objective_vectors[rows, columns.start] = results.objectives
+        uncertainity[rows, columns.start] = results.uncertainity
+    else:
+        objective_vectors[rows, columns] = results.objectives
+        uncertainity[rows, columns] = results.uncertainity
+
+
+def _evaluate_objective(
+    objective: Union[_ScalarObjective, VectorObjective],
+    decision_vectors: np.ndarray,
+    use_surrogate: bool,
+):
+    """Evaluate a single objective. Defined at the module level so that the tasks
+    submitted to a ProcessExecutor can be pickled. For the objectives evaluated in
+    parts, only the evaluator is called, and the raw results are returned to be
+    stored with _store_results by the caller.
+
+    """
+    if not use_surrogate and _evaluates_in_parts(objective):
+        return _call_evaluator(objective, decision_vectors)
+    return objective.evaluate(decision_vectors, use_surrogate)
+
+
+def _evaluates_in_parts(objective: Union[_ScalarObjective, VectorObjective]) -> bool:
+    """Whether the true evaluation of objective is a call of its evaluator followed
+    by _store_results, which keeps the values, samples and archives of the objective.
+    The objectives overriding _func_evaluate are evaluated as a whole.
+
+    """
+    return type(objective)._func_evaluate in (
+        _ScalarObjective._func_evaluate,
+        VectorObjective._func_evaluate,
+    )
+
+
+def _stats_name(objective: Union[_ScalarObjective, VectorObjective]) -> str:
+    """The name of an objective in EvaluationStats. The names of the objectives of a
+    VectorObjective are joined.
+
+    """
+    if isinstance(objective.name, str):
+        return objective.name
+    return ", ".join(objective.name)
+
+
+def _predict_joint(
+    model: BaseRegressor, decision_vectors: np.ndarray
+) -> Tuple[np.ndarray, Union[None, np.ndarray]]:
+    """Predict all the objectives with a joint surrogate model. Defined at the module
+    level so that the tasks submitted to a ProcessExecutor can be pickled.
+
+    """
+    try:
+        return model.predict(decision_vectors)
+    except ModelError:
+        msg = "Bad argument supplied to the model"
+        raise ProblemError(msg)
+
+
+def _train_objectives(
+    objectives: List[_ScalarDataObjective],
+    models: List[BaseRegressor],
+    model_parameters: List[Dict],
+    index: List[int],
+    data: pd.DataFrame,
+    executor: BaseExecutor = None,
+    store: ModelStore = None,
+):
+    """Fit the surrogate models of the objectives, with an executor if given, and
+    install the fitted models in the objectives. Models found in the store are
+    loaded instead of fitted.
+
+    Raises:
+        ProblemError: If VectorDataObjective is used as one of the objective
+        instances. They are not supported yet.
+
+    """
+    if not all(isinstance(obj, _ScalarDataObjective) for obj in objectives):
+        msg = "Support for VectorDataObjective not supported yet"
+        raise ProblemError(msg)
+    training_data = [obj._training_data(index, data) for obj in objectives]
+    fitted_models = _fit_models(
+        models, model_parameters, training_data, executor, store
+    )
+    for objective, model in zip(objectives, fitted_models):
+        objective._install_model(model, index is None and data is None)
+
+
 # TODO: Put this in ProblemBase
 def number_of_objectives(obj_instance: Union[_ScalarObjective, VectorObjective]) -> int:
     """Return the number of objectives in the given obj_instance.
@@ -1044,23 +1889,20 @@ class DataProblem(MOProblem):
                     )
                 )
         if variables is None:
-            variables = []
-            for var in variable_names:
-                initial_value = data[var].mean(axis=0)
-                if bounds is None:
-                    lower_bound = data[var].min(axis=0)
-                    upper_bound = data[var].max(axis=0)
-                else:
-                    lower_bound = bounds[var]["lower_bound"]
-                    upper_bound = bounds[var]["upper_bound"]
-                variables.append(
-                    Variable(
-                        name=var,
-                        initial_value=initial_value,
-                        lower_bound=lower_bound,
-                        upper_bound=upper_bound,
-                    )
-                )
+            initial_values = data[variable_names].mean(axis=0).values
+            if bounds is None:
+                lower_bounds = data[variable_names].min(axis=0).values
+                upper_bounds = data[variable_names].max(axis=0).values
+            else:
+                lower_bounds = bounds.loc["lower_bound", variable_names].values
+                upper_bounds = bounds.loc["upper_bound", variable_names].values
+            variables = VariableSet(
+                names=variable_names,
+                initial_values=initial_values,
+                lower_bounds=lower_bounds,
+                upper_bounds=upper_bounds,
+            )
+        self._joint_model: BaseRegressor = None
         super().__init__(objectives, variables, constraints)
 
     def train(
@@ -1069,6 +1911,8 @@ class DataProblem(MOProblem):
         model_parameters: Union[Dict, List[Dict]] = None,
         index: List[int] = None,
         data: pd.DataFrame = None,
+        executor: BaseExecutor = None,
+        store: ModelStore = None,
     ):
         """Train surrogate models for all the objectives. The models should have a fit
         method and a predict method. The predict method should return predicted values
@@ -1086,6 +1930,15 @@ class DataProblem(MOProblem):
             used.
             data (pd.DataFrame, optional): Use this argument if some external data is
             to be used for training. Defaults to None.
+            executor (BaseExecutor, optional): An executor used to fit the models of
+            the objectives in parallel, e.g., a ProcessExecutor. The models and their
+            parameters must then be picklable. If any of the fits raises an exception,
+            the fits not yet started are cancelled and the exception is raised.
+            Defaults to None, which fits the models one after another.
+            store (ModelStore, optional): A store of trained models. Models trained
+            on the same data with the same parameters are loaded from the store
+            instead of trained, and newly trained models are saved in it. Defaults to
+            None.
 
         Raises:
             ProblemError: If VectorDataObjective is used as one of the objective
@@ -1096,6 +1949,12 @@ class DataProblem(MOProblem):
             model_parameters = [model_parameters] * len(self.get_objective_names())
         elif len(models) == 1:
             models = models * len(self.get_objective_names())
+        if executor is not None or store is not None:
+            _train_objectives(
+                self.objectives, models, model_parameters, index, data, executor, store
+            )
+            self._joint_model = None
+            return
         for model, model_params, name in zip(
             models, model_parameters, self.get_objective_names()
         ):
@@ -1108,6 +1967,7 @@ class DataProblem(MOProblem):
         model_parameters: Dict,
         index: List[int] = None,
         data: pd.DataFrame = None,
+        store: ModelStore = None,
     ):
         """Train one objective at a time, otherwise same is the train method.
 
@@ -1121,6 +1981,8 @@ class DataProblem(MOProblem):
             used.
             data (pd.DataFrame, optional): Use this argument if some external data is
             to be used for training. Defaults to None.
+            store (ModelStore, optional): A store of trained models, see train.
+            Defaults to None.
 
         Raises:
             ProblemError: If name is not in the list of objective names.
@@ -1134,11 +1996,146 @@ class DataProblem(MOProblem):
             )
         obj_index = self.get_objective_names().index(name)
         if isinstance(self.objectives[obj_index], _ScalarDataObjective):
-            self.objectives[obj_index].train(model, model_parameters, index, data)
+            self.objectives[obj_index].train(
+                model, model_parameters, index, data, store=store
+            )
+            # The objectives are now evaluated by their own models
+            self._joint_model = None
         else:
             msg = "Support for VectorDataObjective not supported yet"
             raise ProblemError(msg)
 
+    def train_joint(
+        self,
+        model: BaseRegressor,
+        model_parameters: Dict = None,
+        index: List[int] = None,
+        data: pd.DataFrame = None,
+        store: ModelStore = None,
+    ):
+        """Train a single multi-output surrogate model for all the objectives. When
+        evaluating with use_surrogate=True, the whole population is then predicted
+        with one call to the predict method of the model, instead of one call for each
+        objective. Training the objectives separately with train or
+        train_one_objective discards the joint model.
+
+        Args:
+            model (BaseRegressor): The class for the surrogate modelling algorithm.
+            The predict method of the model should accept multiple outputs and return
+            the predictions with one column for each objective, as well as the
+            uncertainity (or None).
+            model_parameters (Dict, optional): **model_parameters is passed to the
+            model when initialized.
+            index (List[int], optional): The indices of the samples to be used for
+            training the surrogate model. If no values are proveded, all samples are
+            used.
+            data (pd.DataFrame, optional): Use this argument if some external data is
+            to be used for training. Defaults to None.
+            store (ModelStore, optional): A store of trained models, see train.
+            Defaults to None.
+
+        Raises:
+            ProblemError: If the objectives are not all _ScalarDataObjectives sharing
+            the same samples.
+        """
+        if not all(isinstance(obj, _ScalarDataObjective) for obj in self.objectives):
+            msg = "Joint surrogate models are only supported for _ScalarDataObjective"
+            raise ProblemError(msg)
+        n_of_samples = [len(obj.samples) for obj in self.objectives]
+        if len(set(n_of_samples)) != 1:
+            msg = (
+                f"The objectives do not share the same samples. Number of samples in "
+                f"each objective: {n_of_samples}"
+            )
+            raise ProblemError(msg)
+        if data is not None:
+            X = data[self.get_variable_names()]
+            y = data[self.get_objective_names()]
+        else:
+            X = self.objectives[0].X
+            y = np.column_stack([obj.y for obj in self.objectives])
+            if index is not None:
+                X, y = X[index], y[index]
+        (self._joint_model,) = _fit_models(
+            [model], [model_parameters], [(X, y)], store=store
+        )
+
+    def _evaluate_objectives(
+        self, decision_vectors: np.ndarray, use_surrogate: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate all the objectives of the problem. If use_surrogate is True and a
+        joint model has been trained with train_joint, each chunk of the population
+        is predicted with a single call to the joint model.
+
+        """
+        if not use_surrogate or self._joint_model is None:
+            return super()._evaluate_objectives(decision_vectors, use_surrogate)
+        n_rows = decision_vectors.shape[0]
+        objective_vectors: np.ndarray = np.ndarray(
+            (n_rows, self.n_of_objectives), dtype=float
+        )
+        uncertainity: np.ndarray = np.ndarray(
+            (n_rows, self.n_of_objectives), dtype=float
+        )
+        chunks = self.executor.chunks(n_rows)
+        stats = self.stats
+        if stats is None:
+            all_results = self.executor.map(
+                _predict_joint,
+                [self._joint_model] * len(chunks),
+                [decision_vectors[rows] for rows in chunks],
+            )
+        else:
+            timed_results = self.executor.map(
+                timed,
+                [_predict_joint] * len(chunks),
+                [self._joint_model] * len(chunks),
+                [decision_vectors[rows] for rows in chunks],
+            )
+            all_results = []
+            for rows, (results, seconds) in zip(chunks, timed_results):
+                n_chunk_rows = rows.stop - rows.start
+                stats.record("surrogate", "joint model", seconds, n_chunk_rows)
+                all_results.append(results)
+        for rows, (result, result_uncertainity) in zip(chunks, all_results):
+            n_chunk_rows = rows.stop - rows.start
+            objective_vectors[rows] = np.reshape(
+                result, (n_chunk_rows, self.n_of_objectives)
+            )
+            if result_uncertainity is None:
+                uncertainity[rows] = np.nan
+            else:
+                # Some models return a single uncertainity for all the outputs
+                uncertainity[rows] = np.broadcast_to(
+                    np.reshape(result_uncertainity, (n_chunk_rows, -1)),
+                    (n_chunk_rows, self.n_of_objectives),
+                )
+        return objective_vectors, uncertainity
+
+    async def _evaluate_objectives_async(
+        self, decision_vectors: np.ndarray, use_surrogate: bool, limited: Callable
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate all the objectives of the problem concurrently. If use_surrogate
+        is True and a joint model has been trained with train_joint, the joint model
+        predicts all the objectives, as in _evaluate_objectives, in the default
+        executor of the event loop.
+
+        """
+        if not use_surrogate or self._joint_model is None:
+            return await super()._evaluate_objectives_async(
+                decision_vectors, use_surrogate, limited
+            )
+        loop = asyncio.get_event_loop()
+        # The joint model is timed by _evaluate_objectives itself
+        return await limited(
+            None,
+            "joint model",
+            decision_vectors.shape[0],
+            loop.run_in_executor(
+                None, self._evaluate_objectives, decision_vectors, use_surrogate
+            ),
+        )
+
 
 class ExperimentalProblem(MOProblem):
     """A problem class for data-based problem. This supports surrogate modelling.
@@ -1189,19 +2186,12 @@ class ExperimentalProblem(MOProblem):
                 _ScalarDataObjective(data=data[variable_names + [obj]], name=obj)
             )
 
-        variables = []
-        for var in variable_names:
-            initial_value = data[var].mean(axis=0)
-            lower_bound = data[var].min(axis=0)
-            upper_bound = data[var].max(axis=0)
-            variables.append(
-                Variable(
-                    name=var,
-                    initial_value=initial_value,
-                    lower_bound=lower_bound,
-                    upper_bound=upper_bound,
-                )
-            )
+        variables = VariableSet(
+            names=variable_names,
+            initial_values=data[variable_names].mean(axis=0).values,
+            lower_bounds=data[variable_names].min(axis=0).values,
+            upper_bounds=data[variable_names].max(axis=0).values,
+        )
         super().__init__(objectives, variables, constraints)
 
     def train(
@@ -1210,6 +2200,8 @@ class ExperimentalProblem(MOProblem):
         model_parameters: Union[Dict, List[Dict]] = None,
         index: List[int] = None,
         data: pd.DataFrame = None,
+        executor: BaseExecutor = None,
+        store: ModelStore = None,
     ):
         """Train surrogate models for all the objectives. The models should have a fit
         method and a predict method. The predict method should return predicted values
@@ -1227,6 +2219,15 @@ class ExperimentalProblem(MOProblem):
             used.
             data (pd.DataFrame, optional): Use this argument if some external data is
             to be used for training. Defaults to None.
+            executor (BaseExecutor, optional): An executor used to fit the models of
+            the objectives in parallel, e.g., a ProcessExecutor. The models and their
+            parameters must then be picklable. If any of the fits raises an exception,
+            the fits not yet started are cancelled and the exception is raised.
+            Defaults to None, which fits the models one after another.
+            store (ModelStore, optional): A store of trained models. Models trained
+            on the same data with the same parameters are loaded from the store
+            instead of trained, and newly trained models are saved in it. Defaults to
+            None.
 
         Raises:
             ProblemError: If VectorDataObjective is used as one of the objective
@@ -1237,6 +2238,11 @@ class ExperimentalProblem(MOProblem):
             model_parameters = [model_parameters] * len(self.get_objective_names())
         elif len(models) == 1:
             models = models * len(self.get_objective_names())
+        if executor is not None or store is not None:
+            _train_objectives(
+                self.objectives, models, model_parameters, index, data, executor, store
+            )
+            return
         for model, model_params, name in zip(
             models, model_parameters, self.get_objective_names()
         ):
@@ -1249,6 +2255,7 @@ class ExperimentalProblem(MOProblem):
         model_parameters: Dict,
         index: List[int] = None,
         data: pd.DataFrame = None,
+        store: ModelStore = None,
     ):
         """Train one objective at a time, otherwise same is the train method.
 
@@ -1262,6 +2269,8 @@ class ExperimentalProblem(MOProblem):
             used.
             data (pd.DataFrame, optional): Use this argument if some external data is
             to be used for training. Defaults to None.
+            store (ModelStore, optional): A store of trained models, see train.
+            Defaults to None.
 
         Raises:
             ProblemError: If name is not in the list of objective names.
@@ -1275,7 +2284,9 @@ class ExperimentalProblem(MOProblem):
             )
         obj_index = self.get_objective_names().index(name)
         if isinstance(self.objectives[obj_index], _ScalarDataObjective):
-            self.objectives[obj_index].train(model, model_parameters, index, data)
+            self.objectives[obj_index].train(
+                model, model_parameters, index, data, store=store
+            )
         else:
             msg = "Support for VectorDataObjective not supported yet"
             raise ProblemError(msg)
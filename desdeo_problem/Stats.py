@@ -0,0 +1,252 @@
+"""Defines the statistics collected when evaluating a problem: the wall time, the
+number of calls and the number of rows evaluated for each objective, constraint
+and surrogate model, and the time spent checking the decision vectors.
+
+"""
+
+import time
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+import pandas as pd
+
+
+class StatsError(Exception):
+    """Raised when an error related to the EvaluationStats class is encountered.
+
+    """
+
+
+class StatsEvent(NamedTuple):
+    """A single measurement, as passed to the callbacks of EvaluationStats.
+
+    Attributes:
+        kind (str): What was measured. One of EvaluationStats.kinds.
+        name (str): The name of the objective or constraint measured.
+        seconds (float): The wall time of the call.
+        rows (int): The number of decision vectors handled by the call.
+
+    """
+
+    kind: str
+    name: str
+    seconds: float
+    rows: int
+
+
+class TimingStats:
+    """The accumulated measurements of one objective, constraint or step.
+
+    Attributes:
+        calls (int): The number of calls.
+        rows (int): The total number of decision vectors handled by the calls.
+        seconds (float): The total wall time of the calls.
+
+    """
+
+    def __init__(self):
+        self.calls: int = 0
+        self.rows: int = 0
+        self.seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """The mean wall time of a call. Zero if there were no calls."""
+        return self.seconds / self.calls if self.calls else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"TimingStats(calls={self.calls}, rows={self.rows}, "
+            f"seconds={self.seconds:.6g})"
+        )
+
+
+class EvaluationStats:
+    """Statistics of the evaluations of a problem. Attach an instance to an
+    MOProblem, or any of its subclasses, either with the stats argument or by
+    setting problem.stats, to collect them. Problems without stats do not measure
+    anything.
+
+    The measurements are grouped by kind and name:
+
+    - "evaluate": each call of evaluate or evaluate_async as a whole.
+    - "validation": checking the decision vectors against the variables, and the
+      shapes of the arguments of the constraints.
+    - "objective": each true evaluation of an objective, or of a chunk of the
+      population when the executor splits it.
+    - "surrogate": each prediction of a surrogate model, named after the
+      objective, or "joint model" for the joint model of a DataProblem.
+    - "constraint": each constraint. The constraints made with
+      constraint_function_factory that share their left hand side share its
+      time evenly.
+
+    The objectives evaluated concurrently, by an executor or by evaluate_async,
+    are timed separately, so their times may add up to more than the time of
+    evaluate.
+
+    Args:
+        callbacks (List[Callable[[StatsEvent], None]], optional): Functions called
+            with every measurement, e.g. to feed them to a metrics system. Defaults
+            to None.
+
+    """
+
+    kinds: Tuple[str, ...] = (
+        "evaluate",
+        "validation",
+        "objective",
+        "surrogate",
+        "constraint",
+    )
+
+    def __init__(self, callbacks: List[Callable[[StatsEvent], None]] = None):
+        self.__callbacks: List[Callable[[StatsEvent], None]] = list(callbacks or [])
+        self.__timings: Dict[Tuple[str, str], TimingStats] = {}
+
+    @property
+    def callbacks(self) -> Tuple[Callable[[StatsEvent], None], ...]:
+        return tuple(self.__callbacks)
+
+    def add_callback(self, callback: Callable[[StatsEvent], None]):
+        """Call callback with every measurement from now on.
+
+        Args:
+            callback (Callable[[StatsEvent], None]): The function to be called.
+
+        """
+        self.__callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[StatsEvent], None]):
+        """Stop calling a callback added earlier.
+
+        Args:
+            callback (Callable[[StatsEvent], None]): The function to be removed.
+
+        Raises:
+            StatsError: When the callback has not been added.
+
+        """
+        try:
+            self.__callbacks.remove(callback)
+        except ValueError:
+            msg = f"The callback {callback} has not been added."
+            raise StatsError(msg)
+
+    def record(self, kind: str, name: str, seconds: float, rows: int):
+        """Add a measurement to the statistics and pass it to the callbacks.
+
+        Args:
+            kind (str): What was measured. One of EvaluationStats.kinds.
+            name (str): The name of the objective or constraint measured.
+            seconds (float): The wall time of the call.
+            rows (int): The number of decision vectors handled by the call.
+
+        Raises:
+            StatsError: When the kind is not supported.
+
+        """
+        timing = self.__timings.get((kind, name))
+        if timing is None:
+            if kind not in self.kinds:
+                msg = f"Kind should be one of {self.kinds}. Recieved {kind}"
+                raise StatsError(msg)
+            timing = TimingStats()
+            self.__timings[(kind, name)] = timing
+        timing.calls += 1
+        timing.rows += int(rows)
+        timing.seconds += seconds
+        if self.__callbacks:
+            event = StatsEvent(kind, name, seconds, int(rows))
+            for callback in self.__callbacks:
+                callback(event)
+
+    def get(self, kind: str, name: str) -> TimingStats:
+        """Return the accumulated measurements of one objective, constraint or step.
+
+        Args:
+            kind (str): One of EvaluationStats.kinds.
+            name (str): The name of the objective or constraint.
+
+        Returns:
+            TimingStats: The measurements. Zero calls if nothing was measured.
+
+        """
+        return self.__timings.get((kind, name), TimingStats())
+
+    def of_kind(self, kind: str) -> Dict[str, TimingStats]:
+        """Return the accumulated measurements of one kind by name.
+
+        Args:
+            kind (str): One of EvaluationStats.kinds.
+
+        Returns:
+            Dict[str, TimingStats]: The measurements of each name.
+
+        """
+        return {
+            name: timing
+            for ((timing_kind, name), timing) in self.__timings.items()
+            if timing_kind == kind
+        }
+
+    def total_seconds(self, kind: str) -> float:
+        """Return the total wall time measured of one kind.
+
+        Args:
+            kind (str): One of EvaluationStats.kinds.
+
+        Returns:
+            float: The total time in seconds.
+
+        """
+        return sum(timing.seconds for timing in self.of_kind(kind).values())
+
+    def reset(self):
+        """Forget all the measurements. The callbacks are kept."""
+        self.__timings.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Return the measurements as plain dicts, e.g. to be serialized as JSON.
+
+        Returns:
+            Dict[str, Dict[str, Dict[str, float]]]: The calls, rows and seconds of
+            each name, grouped by kind.
+
+        """
+        summary: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for ((kind, name), timing) in self.__timings.items():
+            summary.setdefault(kind, {})[name] = {
+                "calls": timing.calls,
+                "rows": timing.rows,
+                "seconds": timing.seconds,
+            }
+        return summary
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return the measurements as a DataFrame.
+
+        Returns:
+            pd.DataFrame: One row for each kind and name, with the columns "kind",
+            "name", "calls", "rows", "seconds" and "mean_seconds".
+
+        """
+        return pd.DataFrame(
+            [
+                (kind, name, timing.calls, timing.rows, timing.seconds)
+                for ((kind, name), timing) in self.__timings.items()
+            ],
+            columns=["kind", "name", "calls", "rows", "seconds"],
+        ).assign(mean_seconds=lambda df: df["seconds"] / df["calls"])
+
+
+def timed(function: Callable, *args) -> Tuple[object, float]:
+    """Call function with args and measure the wall time of the call. Defined at the
+    module level so that the tasks submitted to a ProcessExecutor can be pickled.
+
+    Returns:
+        Tuple[object, float]: The value returned by function and the time in
+        seconds.
+
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
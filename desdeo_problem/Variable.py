@@ -5,7 +5,7 @@ necessary class to be used.
 """
 
 from os import path
-from typing import List, Tuple, Union
+from typing import Dict, Iterator, List, Tuple, Union
 
 import numpy as np
 
@@ -166,3 +166,180 @@ def variable_builder(
         for var_data in zip(names, initial_values, lower_bounds, upper_bounds)
     ]
     return variables
+
+
+class VariableSet:
+    """A collection of variables stored in numpy arrays. Use instead of a list of
+    Variable objects when the number of variables is large. Can be used wherever a
+    list of Variable objects is accepted by the problem classes.
+
+    Args:
+        names (List[str]): Names of the variables.
+        initial_values (Union[List[float], np.ndarray], optional): Initial values of
+            the variables. If None, the value closest to zero within the bounds is
+            used. Defaults to None.
+        lower_bounds (Union[List[float], np.ndarray], optional): Lower bounds of the
+            variables. If None, it defaults to negative infinity. Defaults to None.
+        upper_bounds (Union[List[float], np.ndarray], optional): Upper bounds of the
+            variables. If None, it defaults to positive infinity. Defaults to None.
+
+    Attributes:
+        names (List[str]): Names of the variables.
+        initial_values (np.ndarray): Initial values of the variables.
+        lower_bounds (np.ndarray): Lower bounds of the variables.
+        upper_bounds (np.ndarray): Upper bounds of the variables.
+
+    Raises:
+        VariableBuilderError: Lengths of the input arrays are different, or the
+            names are not unique.
+        VariableError: Bounds or initial values are incorrect.
+
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        initial_values: Union[List[float], np.ndarray] = None,
+        lower_bounds: Union[List[float], np.ndarray] = None,
+        upper_bounds: Union[List[float], np.ndarray] = None,
+    ) -> None:
+        names = list(names)
+        num_of_variables = len(names)
+        if lower_bounds is None:
+            lower_bounds = np.full(num_of_variables, -np.inf)
+        if upper_bounds is None:
+            upper_bounds = np.full(num_of_variables, np.inf)
+        lower_bounds = np.array(lower_bounds, dtype=float).reshape(-1)
+        upper_bounds = np.array(upper_bounds, dtype=float).reshape(-1)
+        if initial_values is None:
+            initial_values = np.clip(0.0, lower_bounds, upper_bounds)
+        initial_values = np.array(initial_values, dtype=float).reshape(-1)
+        for (array_name, array) in (
+            ("initial_values", initial_values),
+            ("lower_bounds", lower_bounds),
+            ("upper_bounds", upper_bounds),
+        ):
+            if not (num_of_variables == len(array)):
+                msg = (
+                    "The length of the list of names and the number of elements in "
+                    f"the {array_name} array should be the same"
+                )
+                raise VariableBuilderError(msg)
+        index = {name: i for (i, name) in enumerate(names)}
+        if len(index) != num_of_variables:
+            msg = "The names of the variables should be unique"
+            raise VariableBuilderError(msg)
+
+        # Check that the bounds make sense
+        bad_bounds = ~(lower_bounds < upper_bounds)
+        if np.any(bad_bounds):
+            i = np.flatnonzero(bad_bounds)[0]
+            msg = (
+                "Lower bound {} should be less than the upper bound {}. Found in {} "
+                "variable(s), first in variable {}."
+            ).format(lower_bounds[i], upper_bounds[i], bad_bounds.sum(), names[i])
+            raise VariableError(msg)
+
+        # Check that the initial values are between the bounds
+        bad_values = ~(
+            (lower_bounds <= initial_values) & (initial_values <= upper_bounds)
+        )
+        if np.any(bad_values):
+            i = np.flatnonzero(bad_values)[0]
+            msg = (
+                "The initial value {} should be between the upper ({}) and lower "
+                "({}) bounds. Found in {} variable(s), first in variable {}."
+            ).format(
+                initial_values[i],
+                upper_bounds[i],
+                lower_bounds[i],
+                bad_values.sum(),
+                names[i],
+            )
+            raise VariableError(msg)
+
+        for array in (initial_values, lower_bounds, upper_bounds):
+            array.flags.writeable = False
+        self.__names: List[str] = names
+        self.__index: Dict[str, int] = index
+        self.__initial_values: np.ndarray = initial_values
+        self.__lower_bounds: np.ndarray = lower_bounds
+        self.__upper_bounds: np.ndarray = upper_bounds
+
+    @property
+    def names(self) -> List[str]:
+        return self.__names
+
+    @property
+    def initial_values(self) -> np.ndarray:
+        return self.__initial_values
+
+    @property
+    def lower_bounds(self) -> np.ndarray:
+        return self.__lower_bounds
+
+    @property
+    def upper_bounds(self) -> np.ndarray:
+        return self.__upper_bounds
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+    def __iter__(self) -> Iterator[Variable]:
+        for i in range(len(self)):
+            yield self._variable(i)
+
+    def __getitem__(
+        self, key: Union[int, str, slice, List[int], List[str], np.ndarray]
+    ) -> Union[Variable, "VariableSet"]:
+        """Return a single Variable when indexed by a position or a name, or a new
+        VariableSet when indexed by a slice or a sequence of positions or names.
+
+        """
+        if isinstance(key, str):
+            return self._variable(self.index(key))
+        if isinstance(key, (int, np.integer)):
+            return self._variable(range(len(self))[key])
+        if isinstance(key, slice):
+            positions = np.arange(len(self))[key]
+        else:
+            positions = np.array(
+                [self.index(k) if isinstance(k, str) else k for k in key], dtype=int
+            )
+        return VariableSet(
+            [self.__names[i] for i in positions],
+            self.__initial_values[positions],
+            self.__lower_bounds[positions],
+            self.__upper_bounds[positions],
+        )
+
+    def index(self, name: str) -> int:
+        """Return the position of the variable with the given name.
+
+        Raises:
+            VariableError: No variable with the name exists.
+
+        """
+        try:
+            return self.__index[name]
+        except KeyError:
+            msg = f"No variable named {name}"
+            raise VariableError(msg)
+
+    def get_bounds(self) -> np.ndarray:
+        """Return the bounds of the variables as a 2D array. The first column contains
+        the lower bounds and the second column the upper bounds.
+
+        Returns:
+            np.ndarray: An array of shape (number of variables, 2).
+
+        """
+        return np.stack((self.__lower_bounds, self.__upper_bounds), axis=1)
+
+    def _variable(self, i: int) -> Variable:
+        return Variable(
+            self.__names[i],
+            self.__initial_values[i],
+            self.__lower_bounds[i],
+            self.__upper_bounds[i],
+        )
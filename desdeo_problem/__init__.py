@@ -1,6 +1,12 @@
-__all__ = ["ScalarConstraint", "ConstraintError", "constraint_function_factory"]
+__all__ = [
+    "ScalarConstraint",
+    "ConstraintBlock",
+    "ConstraintError",
+    "constraint_function_factory",
+]
 
 from desdeo_problem.Constraint import (
+    ConstraintBlock,
     ConstraintError,
     ScalarConstraint,
     constraint_function_factory,
@@ -1,63 +1,330 @@
+from typing import Iterator, List, NamedTuple, Tuple, Union
+
 import numpy as np
 import pandas as pd
+from sklearn.neighbors import KDTree
 
 from desdeo_problem.surrogatemodels.SurrogateModels import BaseRegressor, ModelError
 
 
 class LipschitzianRegressor(BaseRegressor):
-    def __init__(self, L: float = None):
-        self.L: float = L
+    """Lipschitzian regression using the Manhattan distance.
+
+    The distances between the samples are computed in blocks of rows, so that the
+    memory used by fit and predict stays around memory_budget bytes instead of
+    growing with the square of the number of samples.
+
+    With use_index=True, fit sorts the samples of each output into n_bands bands of
+    similar output values and builds a KD-tree of each band. predict then only
+    computes the distances to the samples which can still tighten the bounds of a
+    query: a band of larger (smaller) outputs can only raise the lower (lower the
+    upper) bound within a radius given by the current bound and the extreme output of
+    the band. The bounds are started from the nearest neighbours of the query. The
+    predictions are the same as without the index. The index pays off for many
+    samples of few variables.
+
+    Args:
+        L (Union[float, np.ndarray], optional): The Lipschitz constant, one for each
+            output. Defaults to None. Unless fixed_L is True, fit replaces it with
+            the constant estimated from the data.
+        fixed_L (bool, optional): Keep the given L in fit and partial_fit instead of
+            estimating it from the data. Defaults to False.
+        memory_budget (int, optional): Approximate number of bytes used for the
+            temporary distance arrays. Defaults to 256 MiB.
+        use_index (bool, optional): Whether to predict using a KD-tree of the
+            samples. Defaults to False.
+        n_neighbors (int, optional): Number of nearest neighbours used for the
+            initial bounds of the indexed predictions. Defaults to 8.
+        n_bands (int, optional): Number of bands of output values in the index.
+            Defaults to 32.
+
+    """
+
+    def __init__(
+        self,
+        L: Union[float, np.ndarray] = None,
+        fixed_L: bool = False,
+        memory_budget: int = 256 * 2 ** 20,
+        use_index: bool = False,
+        n_neighbors: int = 8,
+        n_bands: int = 32,
+    ):
+        if memory_budget < 1:
+            msg = (
+                f"memory_budget should be a positive integer. Recieved "
+                f"{memory_budget}"
+            )
+            raise ModelError(msg)
+        if n_neighbors < 1:
+            msg = f"n_neighbors should be a positive integer. Recieved {n_neighbors}"
+            raise ModelError(msg)
+        if fixed_L and L is None:
+            msg = "L should be given when fixed_L is True."
+            raise ModelError(msg)
+        if n_bands < 1:
+            msg = f"n_bands should be a positive integer. Recieved {n_bands}"
+            raise ModelError(msg)
+        self.L: Union[float, np.ndarray] = L
+        self.fixed_L: bool = fixed_L
+        self.memory_budget: int = memory_budget
+        self.use_index: bool = use_index
+        self.n_neighbors: int = n_neighbors
+        self.n_bands: int = n_bands
         self.X: np.ndarray = None
         self.y: np.ndarray = None
+        self._index: _BandIndex = None
 
     def fit(self, X, y):
-        if isinstance(X, (pd.DataFrame, pd.Series)):
-            X = X.values
-        if isinstance(y, (pd.DataFrame, pd.Series)):
-            y = y.values.reshape(-1, 1)
-
-        # Make a 2-D array if needed
-        y = np.atleast_1d(y)
-        if y.ndim == 1:
-            y = y.reshape(-1, 1)
-
-        self_dist_x = self.self_distance(X)
-        self_dist_y = self.self_distance(y)
-        with np.errstate(divide="ignore", invalid="ignore"):
-            delta = np.true_divide(self_dist_y, self_dist_x)
-            delta[~np.isfinite(delta)] = -np.inf
-            L = delta.max()
+        X, y = _as_2d_arrays(X, y)
         self.X = X
         self.y = y
-        self.L = L
+        self._index = _BandIndex(X, y, self.n_bands) if self.use_index else None
+        if self.fixed_L:
+            return
+
+        # One Lipschitz constant for each output, the largest slope between any two
+        # samples. Each block of rows is only compared with itself and the rows
+        # after it, and the constants are updated after each block.
+        n_outputs = y.shape[1]
+        L = np.full(n_outputs, -np.inf)
+        for rows in self._blocks(X.shape[0], X.shape[0], n_outputs):
+            dist_x = self._distance_block(X[rows], X[rows.start :])
+            L = np.maximum(L, _max_slopes(dist_x, y[rows], y[rows.start :]))
+        self.L = L[0] if n_outputs == 1 else L
+
+    def partial_fit(self, X, y):
+        """Add samples to a fitted model. Only the distances between the new samples
+        and all the samples are computed, so adding m samples to a model of n samples
+        costs O(m * n) instead of the O(n ** 2) of fitting again. The result is the
+        same as fitting on all the samples.
+
+        Args:
+            X (np.ndarray): The new decision vectors.
+            y (np.ndarray): The new outputs.
+
+        Raises:
+            ModelError: If the number of variables or outputs does not match the
+                samples already in the model.
+
+        """
+        if self.X is None:
+            return self.fit(X, y)
+        X, y = _as_2d_arrays(X, y)
+        if X.shape[1] != self.X.shape[1] or y.shape[1] != self.y.shape[1]:
+            msg = (
+                f"The shapes of the new samples do not match the fitted samples. "
+                f"Recieved X of shape {X.shape} and y of shape {y.shape}, expected "
+                f"{self.X.shape[1]} variables and {self.y.shape[1]} outputs."
+            )
+            raise ModelError(msg)
+        n_outputs = y.shape[1]
+        if not self.fixed_L:
+            L = np.full(n_outputs, -np.inf) if self.L is None else np.atleast_1d(self.L)
+            n_samples = self.X.shape[0] + X.shape[0]
+            for rows in self._blocks(X.shape[0], n_samples, n_outputs):
+                # The new samples against the old ones, and against each other
+                dist_x = self._distance_block(X[rows], self.X)
+                L = np.maximum(L, _max_slopes(dist_x, y[rows], self.y))
+                dist_x = self._distance_block(X[rows], X[rows.start :])
+                L = np.maximum(L, _max_slopes(dist_x, y[rows], y[rows.start :]))
+            self.L = L[0] if n_outputs == 1 else L
+        self.X = np.vstack((self.X, X))
+        self.y = np.vstack((self.y, y))
+        # The index is rebuilt when next needed
+        self._index = None
 
     def predict(self, X):
-        dist = self.distance(X, self.X)
-        y_low = (self.y - self.L * dist).max(axis=0)
-        y_high = (self.y + self.L * dist).min(axis=0)
+        if isinstance(X, (pd.DataFrame, pd.Series)):
+            X = X.values
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 1:
+            X = X.reshape(-1, 1)
+        n_outputs = self.y.shape[1]
+        L = np.broadcast_to(np.asarray(self.L, dtype=float), (n_outputs,))
+        y_low = np.empty((X.shape[0], n_outputs))
+        y_high = np.empty((X.shape[0], n_outputs))
+        # The search radius of the index is not defined for non-positive constants
+        indexed = self.use_index and np.all(np.isfinite(L)) and np.all(L > 0)
+        if indexed and self._index is None:
+            self._index = _BandIndex(self.X, self.y, self.n_bands)
+        for rows in self._blocks(X.shape[0], self.X.shape[0], n_outputs):
+            if indexed:
+                y_low[rows], y_high[rows] = self._indexed_bounds(X[rows], L)
+            else:
+                dist = self._distance_block(X[rows], self.X)
+                scaled_dist = dist[:, :, None] * L
+                y_low[rows] = (self.y[None, :, :] - scaled_dist).max(axis=1)
+                y_high[rows] = (self.y[None, :, :] + scaled_dist).min(axis=1)
         y_mean = (y_low + y_high) / 2
         y_delta = np.abs((y_high - y_low) / 2)
+        # Single output models keep returning 1-D predictions
+        if n_outputs == 1:
+            return (y_mean[:, 0], y_delta[:, 0])
         return (y_mean, y_delta)
 
+    def _indexed_bounds(
+        self, X: np.ndarray, L: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute the lower and upper bounds of the predictions of X using the
+        index of the samples.
+
+        """
+        # Initial bounds from the nearest neighbours
+        n_neighbors = min(self.n_neighbors, self.X.shape[0])
+        dist, neighbors = self._index.tree.query(X, k=n_neighbors)
+        scaled_dist = dist[:, :, None] * L
+        y_low = (self.y[neighbors] - scaled_dist).max(axis=1)
+        y_high = (self.y[neighbors] + scaled_dist).min(axis=1)
+
+        for output, bands in enumerate(self._index.bands):
+            for band in bands:
+                # A sample i can only raise y_low if y_i - L * d_i > y_low, which
+                # requires d_i < (band.y_max - y_low) / L. Likewise for y_high.
+                radius = np.maximum(
+                    band.y_max - y_low[:, output], y_high[:, output] - band.y_min
+                ) / L[output]
+                queries = np.flatnonzero(radius > 0)
+                if queries.size == 0:
+                    continue
+                candidates = band.tree.query_radius(X[queries], radius[queries])
+                lengths = np.array([len(indices) for indices in candidates])
+                if lengths.sum() == 0:
+                    continue
+                samples = band.samples[np.concatenate(candidates)]
+                rows = np.repeat(queries, lengths)
+                dist = np.abs(X[rows] - self.X[samples]).sum(axis=1)
+                scaled_dist = dist * L[output]
+                y = self.y[samples, output]
+
+                # Reduce the candidates of each query, skipping queries without any
+                has_candidates = lengths > 0
+                starts = (np.cumsum(lengths) - lengths)[has_candidates]
+                queries = queries[has_candidates]
+                band_low = np.maximum.reduceat(y - scaled_dist, starts)
+                band_high = np.minimum.reduceat(y + scaled_dist, starts)
+                y_low[queries, output] = np.maximum(y_low[queries, output], band_low)
+                y_high[queries, output] = np.minimum(y_high[queries, output], band_high)
+        return y_low, y_high
+
     def self_distance(self, arr):
-        if arr.ndim == 1:
-            dist = np.abs(np.subtract(arr[None, :], arr[:, None]))
-        elif arr.ndim == 2:
-            dist = np.sum(np.abs(np.subtract(arr[None, :, :], arr[:, None, :])), axis=2)
-        else:
+        if arr.ndim not in (1, 2):
             msg = (
                 f"Array of wrong dimension. Expected dimension = 1 or 2. Recieved "
                 f"dimension = {arr.ndim}"
             )
             raise ModelError(msg)
-        return dist
+        return self.distance(arr, arr)
 
     def distance(self, array1, array2):
+        """Return the Manhattan distances between the rows of array2 and array1, of
+        shape (len(array2), len(array1)).
+
+        """
         if array1.ndim == 1:
             array1 = array1.reshape(-1, 1)
         if array2.ndim == 1:
             array2 = array2.reshape(-1, 1)
-        dist = np.sum(
-            np.abs(np.subtract(array1[None, :, :], array2[:, None, :])), axis=2
-        )
+        dist = np.empty((array2.shape[0], array1.shape[0]))
+        for rows in self._blocks(array2.shape[0], array1.shape[0], 1):
+            dist[rows] = self._distance_block(array2[rows], array1)
         return dist
+
+    def _blocks(self, n_rows: int, n_columns: int, n_outputs: int) -> Iterator[slice]:
+        """Split n_rows rows into blocks whose distance arrays to n_columns samples
+        fit in the memory budget.
+
+        """
+        # Distances, their scaled copies and temporaries, for each output
+        bytes_per_row = 8 * max(n_columns, 1) * (2 + 2 * n_outputs)
+        block_size = max(1, self.memory_budget // bytes_per_row)
+        for start in range(0, n_rows, block_size):
+            yield slice(start, min(start + block_size, n_rows))
+
+    @staticmethod
+    def _distance_block(rows: np.ndarray, samples: np.ndarray) -> np.ndarray:
+        """Manhattan distances between rows and samples, accumulated one variable at
+        a time so that no (n_rows, n_samples, n_variables) array is built.
+
+        """
+        dist = np.zeros((rows.shape[0], samples.shape[0]))
+        difference = np.empty_like(dist)
+        for variable in range(rows.shape[1]):
+            np.subtract(
+                rows[:, variable, None], samples[None, :, variable], out=difference
+            )
+            np.abs(difference, out=difference)
+            dist += difference
+        return dist
+
+
+class _Band(NamedTuple):
+    """Samples with outputs between y_min and y_max, and a KD-tree of them.
+
+    """
+
+    samples: np.ndarray
+    y_min: float
+    y_max: float
+    tree: KDTree
+
+
+class _BandIndex:
+    """The index used by the LipschitzianRegressor for pruned predictions: a KD-tree
+    of all the samples, and for each output, the samples split into bands of
+    similar output values.
+
+    """
+
+    def __init__(self, X: np.ndarray, y: np.ndarray, n_bands: int):
+        self.tree: KDTree = KDTree(X, metric="manhattan")
+        self.bands: List[List[_Band]] = []
+        for output in range(y.shape[1]):
+            order = np.argsort(y[:, output], kind="stable")
+            bands = []
+            for samples in np.array_split(order, min(n_bands, len(order))):
+                bands.append(
+                    _Band(
+                        samples,
+                        y[samples[0], output],
+                        y[samples[-1], output],
+                        KDTree(X[samples], metric="manhattan"),
+                    )
+                )
+            self.bands.append(bands)
+
+
+def _as_2d_arrays(X, y) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert the samples to 2-D float arrays, with one column for each variable and
+    each output.
+
+    """
+    if isinstance(X, (pd.DataFrame, pd.Series)):
+        X = X.values
+    if isinstance(y, pd.Series):
+        y = y.values.reshape(-1, 1)
+    elif isinstance(y, pd.DataFrame):
+        y = y.values
+
+    # Make 2-D arrays if needed
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X.reshape(-1, 1)
+    y = np.atleast_1d(np.asarray(y, dtype=float))
+    if y.ndim == 1:
+        y = y.reshape(-1, 1)
+    return X, y
+
+
+def _max_slopes(dist_x: np.ndarray, y_rows: np.ndarray, y_samples: np.ndarray):
+    """Return the largest slope |y_i - y_j| / dist(x_i, x_j) for each output. Pairs
+    with zero distance are ignored.
+
+    """
+    slopes = np.empty(y_rows.shape[1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for output in range(y_rows.shape[1]):
+            delta = np.abs(y_rows[:, output, None] - y_samples[None, :, output])
+            np.true_divide(delta, dist_x, out=delta)
+            delta[~np.isfinite(delta)] = -np.inf
+            slopes[output] = delta.max() if delta.size > 0 else -np.inf
+    return slopes
@@ -0,0 +1,196 @@
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.linalg import cholesky, solve_triangular
+from sklearn.gaussian_process import GaussianProcessRegressor as GPR
+from sklearn.gaussian_process.kernels import (
+    RBF,
+    ConstantKernel,
+    Kernel,
+    Sum,
+    WhiteKernel,
+)
+
+from desdeo_problem.surrogatemodels.SurrogateModels import BaseRegressor, ModelError
+
+
+class SparseGaussianProcessRegressor(BaseRegressor):
+    """Gaussian process regression approximated with inducing points, using the
+    deterministic training conditional (DTC) approximation.
+
+    The hyperparameters of the kernel are optimized by an exact Gaussian process on
+    a random subset of the samples. The inducing points are a random subset of the
+    samples. With m inducing points, fitting on n samples costs O(n * m ** 2) time
+    and the samples are processed in blocks, so that memory does not grow with
+    n * m. Predicting costs O(m ** 2) for each sample.
+
+    Args:
+        kernel (Kernel, optional): A scikit-learn kernel. A WhiteKernel added to the
+            kernel is used as the noise of the samples. Defaults to None, which uses
+            ConstantKernel() * RBF() + WhiteKernel().
+        n_inducing (int, optional): Number of inducing points. Defaults to 200.
+        n_hyperparameter_samples (int, optional): Number of samples used for
+            optimizing the hyperparameters. Defaults to 1000.
+        n_restarts_optimizer (int, optional): Passed to the exact Gaussian process
+            optimizing the hyperparameters. Defaults to 0.
+        block_size (int, optional): Number of samples processed at once. Defaults to
+            10000.
+        random_state (int, optional): Seed for choosing the subsets of the samples.
+            Defaults to None.
+
+    """
+
+    def __init__(
+        self,
+        kernel: Kernel = None,
+        n_inducing: int = 200,
+        n_hyperparameter_samples: int = 1000,
+        n_restarts_optimizer: int = 0,
+        block_size: int = 10000,
+        random_state: int = None,
+    ):
+        if n_inducing < 1:
+            msg = f"n_inducing should be a positive integer. Recieved {n_inducing}"
+            raise ModelError(msg)
+        if block_size < 1:
+            msg = f"block_size should be a positive integer. Recieved {block_size}"
+            raise ModelError(msg)
+        if kernel is None:
+            kernel = ConstantKernel() * RBF() + WhiteKernel()
+        self.kernel: Kernel = kernel
+        self.n_inducing: int = n_inducing
+        self.n_hyperparameter_samples: int = n_hyperparameter_samples
+        self.n_restarts_optimizer: int = n_restarts_optimizer
+        self.block_size: int = block_size
+        self.random_state: int = random_state
+        self.kernel_: Kernel = None
+        self.noise_: float = None
+        self.inducing_points: np.ndarray = None
+
+    def fit(self, X, y):
+        if isinstance(X, (pd.DataFrame, pd.Series)):
+            X = X.values
+        if isinstance(y, (pd.DataFrame, pd.Series)):
+            y = y.values
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 1:
+            X = X.reshape(-1, 1)
+        y = np.asarray(y, dtype=float)
+        self._single_output = y.ndim == 1
+        y = y.reshape(X.shape[0], -1)
+        n_samples = X.shape[0]
+        rng = np.random.default_rng(self.random_state)
+
+        # Normalized outputs, as the default kernel assumes zero mean
+        self._y_mean = y.mean(axis=0)
+        self._y_std = y.std(axis=0)
+        self._y_std[self._y_std == 0] = 1.0
+        y = (y - self._y_mean) / self._y_std
+
+        # Hyperparameters from an exact Gaussian process on a subset
+        n_subset = min(self.n_hyperparameter_samples, n_samples)
+        subset = rng.choice(n_samples, n_subset, replace=False)
+        exact = GPR(
+            kernel=self.kernel,
+            n_restarts_optimizer=self.n_restarts_optimizer,
+            random_state=self.random_state,
+        )
+        exact.fit(X[subset], y[subset])
+        self.kernel_, self.noise_ = _split_noise(exact.kernel_, exact.alpha)
+
+        n_inducing = min(self.n_inducing, n_samples)
+        self.inducing_points = X[rng.choice(n_samples, n_inducing, replace=False)]
+
+        # With inducing points Z, K_mm = k(Z, Z) = L_mm L_mm^T and K_mn = k(Z, X).
+        # Forming noise * K_mm + K_mn K_nm squares the condition number of K_mm,
+        # which fails on smooth or noise-free data. Instead, with V = L_mm^-1 K_mn,
+        # the posterior needs B = noise * I + V V^T and V y, accumulated in blocks.
+        self._L_mm = _cholesky(self.kernel_(self.inducing_points))
+        B = np.zeros((n_inducing, n_inducing))
+        B[np.diag_indices_from(B)] = self.noise_
+        V_y = np.zeros((n_inducing, y.shape[1]))
+        for start in range(0, n_samples, self.block_size):
+            rows = slice(start, start + self.block_size)
+            V = solve_triangular(
+                self._L_mm, self.kernel_(self.inducing_points, X[rows]), lower=True
+            )
+            B += V @ V.T
+            V_y += V @ y[rows]
+        self._L_B = _cholesky(B)
+        # The mean is K_sm L_mm^-T B^-1 V y
+        self._weights = solve_triangular(
+            self._L_mm,
+            solve_triangular(
+                self._L_B.T,
+                solve_triangular(self._L_B, V_y, lower=True),
+                lower=False,
+            ),
+            lower=True,
+            trans="T",
+        )
+
+    def predict(self, X) -> Tuple[np.ndarray, np.ndarray]:
+        if self.kernel_ is None:
+            raise ModelError("Model not fitted yet")
+        if isinstance(X, (pd.DataFrame, pd.Series)):
+            X = X.values
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 1:
+            X = X.reshape(-1, 1)
+        K_ms = self.kernel_(self.inducing_points, X)
+        mean = K_ms.T @ self._weights
+
+        # DTC variance: k(x, x) - |L_mm^-1 K_ms|^2 + noise * |L_B^-1 L_mm^-1 K_ms|^2,
+        # plus the noise
+        V_s = solve_triangular(self._L_mm, K_ms, lower=True)
+        W_s = solve_triangular(self._L_B, V_s, lower=True)
+        variance = (
+            self.kernel_.diag(X)
+            - np.sum(V_s ** 2, axis=0)
+            + self.noise_ * np.sum(W_s ** 2, axis=0)
+            + self.noise_
+        )
+        std = np.sqrt(np.maximum(variance, 0))
+
+        mean = mean * self._y_std + self._y_mean
+        std = std[:, None] * self._y_std
+        if self._single_output:
+            return mean[:, 0], std[:, 0]
+        return mean, std
+
+
+def _cholesky(matrix: np.ndarray, max_tries: int = 8) -> np.ndarray:
+    """Return the lower Cholesky factor of a symmetric positive semi-definite
+    matrix. Jitter is added to the diagonal, starting from 1e-10 of its mean and
+    growing tenfold after each failed try.
+
+    Raises:
+        ModelError: When the factorization fails max_tries times.
+
+    """
+    jitter = 1e-10 * np.mean(np.diag(matrix))
+    for _ in range(max_tries):
+        try:
+            return cholesky(matrix + jitter * np.eye(matrix.shape[0]), lower=True)
+        except np.linalg.LinAlgError:
+            jitter *= 10
+    msg = (
+        f"The kernel matrix of the inducing points is singular, even with a jitter "
+        f"of {jitter / 10:.3g} added to its diagonal."
+    )
+    raise ModelError(msg)
+
+
+def _split_noise(kernel: Kernel, alpha: float) -> Tuple[Kernel, float]:
+    """Split a fitted kernel into the kernel of the signal and the variance of the
+    noise. The noise is taken from a WhiteKernel added to the kernel, if any.
+
+    """
+    noise = float(np.max(alpha))
+    if isinstance(kernel, Sum):
+        if isinstance(kernel.k2, WhiteKernel):
+            return kernel.k1, noise + kernel.k2.noise_level
+        if isinstance(kernel.k1, WhiteKernel):
+            return kernel.k2, noise + kernel.k1.noise_level
+    return kernel, noise
@@ -0,0 +1,180 @@
+"""Vectorized implementations of the DTLZ test problems. Each function evaluates a
+whole population of decision vectors in [0, 1] at once, returning the objective
+vectors on the rows of a 2D array. With M objectives, the first M - 1 variables
+are the position variables and the remaining k = n - M + 1 variables the distance
+variables. The definitions follow the optproblems package.
+
+"""
+
+import numpy as np
+
+
+def _as_population(x: np.ndarray) -> np.ndarray:
+    return np.atleast_2d(np.asarray(x, dtype=float))
+
+
+def _rastrigin_g(xm: np.ndarray) -> np.ndarray:
+    """The multimodal g function of DTLZ1 and DTLZ3."""
+    return 100.0 * (
+        xm.shape[1]
+        + np.sum((xm - 0.5) ** 2 - np.cos(20.0 * np.pi * (xm - 0.5)), axis=1)
+    )
+
+
+def _sphere_g(xm: np.ndarray) -> np.ndarray:
+    """The g function of DTLZ2, DTLZ4 and DTLZ5."""
+    return np.sum((xm - 0.5) ** 2, axis=1)
+
+
+def _linear(position: np.ndarray, g: np.ndarray) -> np.ndarray:
+    """The linear front of DTLZ1. f_i is the product of the first M - i position
+    variables, times one minus the next one for i > 1.
+
+    """
+    n_rows = position.shape[0]
+    ones = np.ones((n_rows, 1))
+    products = np.cumprod(np.hstack((ones, position)), axis=1)[:, ::-1]
+    complements = np.hstack((ones, 1.0 - position[:, ::-1]))
+    return 0.5 * (1.0 + g)[:, None] * products * complements
+
+
+def _spherical(angles: np.ndarray, g: np.ndarray) -> np.ndarray:
+    """The spherical front of DTLZ2-6. f_i is the product of the cosines of the
+    first M - i angles, times the sine of the next one for i > 1.
+
+    """
+    n_rows = angles.shape[0]
+    ones = np.ones((n_rows, 1))
+    cosines = np.cumprod(np.hstack((ones, np.cos(angles))), axis=1)[:, ::-1]
+    sines = np.hstack((ones, np.sin(angles[:, ::-1])))
+    return (1.0 + g)[:, None] * cosines * sines
+
+
+def dtlz1(x: np.ndarray, n_of_objectives: int) -> np.ndarray:
+    """Evaluate DTLZ1.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    x = _as_population(x)
+    m = n_of_objectives
+    return _linear(x[:, : m - 1], _rastrigin_g(x[:, m - 1 :]))
+
+
+def dtlz2(x: np.ndarray, n_of_objectives: int) -> np.ndarray:
+    """Evaluate DTLZ2.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    x = _as_population(x)
+    m = n_of_objectives
+    return _spherical(x[:, : m - 1] * (np.pi / 2.0), _sphere_g(x[:, m - 1 :]))
+
+
+def dtlz3(x: np.ndarray, n_of_objectives: int) -> np.ndarray:
+    """Evaluate DTLZ3.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    x = _as_population(x)
+    m = n_of_objectives
+    return _spherical(x[:, : m - 1] * (np.pi / 2.0), _rastrigin_g(x[:, m - 1 :]))
+
+
+def dtlz4(x: np.ndarray, n_of_objectives: int, alpha: float = 100.0) -> np.ndarray:
+    """Evaluate DTLZ4.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        alpha (float, optional): The exponent of the position variables, which
+            biases the density of the solutions. Defaults to 100.0.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    x = _as_population(x)
+    m = n_of_objectives
+    angles = x[:, : m - 1] ** alpha * (np.pi / 2.0)
+    return _spherical(angles, _sphere_g(x[:, m - 1 :]))
+
+
+def _degenerate_angles(position: np.ndarray, g: np.ndarray) -> np.ndarray:
+    """The angles of DTLZ5 and DTLZ6, which collapse the front to a curve."""
+    angles = (np.pi / (4.0 * (1.0 + g)))[:, None] * (1.0 + 2.0 * g[:, None] * position)
+    angles[:, 0] = position[:, 0] * (np.pi / 2.0)
+    return angles
+
+
+def dtlz5(x: np.ndarray, n_of_objectives: int) -> np.ndarray:
+    """Evaluate DTLZ5.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    x = _as_population(x)
+    m = n_of_objectives
+    g = _sphere_g(x[:, m - 1 :])
+    return _spherical(_degenerate_angles(x[:, : m - 1], g), g)
+
+
+def dtlz6(x: np.ndarray, n_of_objectives: int) -> np.ndarray:
+    """Evaluate DTLZ6.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    x = _as_population(x)
+    m = n_of_objectives
+    g = np.sum(x[:, m - 1 :] ** 0.1, axis=1)
+    return _spherical(_degenerate_angles(x[:, : m - 1], g), g)
+
+
+def dtlz7(x: np.ndarray, n_of_objectives: int) -> np.ndarray:
+    """Evaluate DTLZ7.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    x = _as_population(x)
+    m = n_of_objectives
+    position = x[:, : m - 1]
+    xm = x[:, m - 1 :]
+    g = 1.0 + 9.0 * np.sum(xm, axis=1) / xm.shape[1]
+    h = m - np.sum(
+        position / (1.0 + g)[:, None] * (1.0 + np.sin(3.0 * np.pi * position)), axis=1
+    )
+    return np.column_stack((position, (1.0 + g) * h))
@@ -0,0 +1,306 @@
+"""Vectorized implementations of the large-scale LSMOP test problems of Cheng et
+al. (2017), "Test problems for large-scale multiobjective and many-objective
+optimization". Each function evaluates a whole population of decision vectors at
+once, returning the objective vectors on the rows of a 2D array.
+
+With M objectives and n variables, the first M - 1 variables are in [0, 1] and the
+rest in [0, 10]. The distance variables are divided unevenly between the
+objectives according to a chaotic sequence, and the variables of each objective
+in nk subcomponents of equal size. If n - M + 1 is not divisible accordingly, the
+remaining last variables do not affect the objectives.
+
+"""
+
+from typing import Callable, Tuple
+
+import numpy as np
+
+
+def subcomponent_sizes(
+    n_of_variables: int, n_of_objectives: int, nk: int = 5
+) -> np.ndarray:
+    """Compute the sizes of the subcomponents of the distance variables of each
+    objective.
+
+    Args:
+        n_of_variables (int): The number of variables.
+        n_of_objectives (int): The number of objectives.
+        nk (int, optional): The number of subcomponents of each objective.
+            Defaults to 5.
+
+    Returns:
+        np.ndarray: The size of the subcomponents of each objective.
+
+    """
+    c = np.empty(n_of_objectives)
+    c[0] = 3.8 * 0.1 * (1.0 - 0.1)
+    for i in range(1, n_of_objectives):
+        c[i] = 3.8 * c[i - 1] * (1.0 - c[i - 1])
+    return np.floor(
+        c / np.sum(c) * (n_of_variables - n_of_objectives + 1) / nk
+    ).astype(int)
+
+
+# Basic functions, reducing the last axis
+
+
+def _sphere(x: np.ndarray) -> np.ndarray:
+    return np.sum(x ** 2, axis=-1)
+
+
+def _griewank(x: np.ndarray) -> np.ndarray:
+    roots = np.sqrt(np.arange(1, x.shape[-1] + 1))
+    return np.sum(x ** 2, axis=-1) / 4000.0 - np.prod(np.cos(x / roots), axis=-1) + 1.0
+
+
+def _schwefel(x: np.ndarray) -> np.ndarray:
+    return np.max(np.abs(x), axis=-1)
+
+
+def _rastrigin(x: np.ndarray) -> np.ndarray:
+    return np.sum(x ** 2 - 10.0 * np.cos(2.0 * np.pi * x) + 10.0, axis=-1)
+
+
+def _rosenbrock(x: np.ndarray) -> np.ndarray:
+    head = x[..., :-1]
+    return np.sum(100.0 * (head ** 2 - x[..., 1:]) ** 2 + (head - 1.0) ** 2, axis=-1)
+
+
+def _ackley(x: np.ndarray) -> np.ndarray:
+    size = x.shape[-1]
+    return (
+        20.0
+        - 20.0 * np.exp(-0.2 * np.sqrt(np.sum(x ** 2, axis=-1) / size))
+        - np.exp(np.sum(np.cos(2.0 * np.pi * x), axis=-1) / size)
+        + np.e
+    )
+
+
+def _position_and_g(
+    x: np.ndarray,
+    n_of_objectives: int,
+    nk: int,
+    nonlinear: bool,
+    odd: Callable,
+    even: Callable,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Link the distance variables to the first variable and compute the g
+    function of each objective. The odd objectives (counting from one) use odd as
+    the basic function and the even objectives even.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The position variables and the g values.
+
+    """
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    m = n_of_objectives
+    sizes = subcomponent_sizes(x.shape[1], m, nk)
+    n = m - 1 + nk * np.sum(sizes)
+    position = x[:, : m - 1]
+
+    index = np.arange(m, n + 1) / n
+    if nonlinear:
+        scale = 1.0 + np.cos(index * np.pi / 2.0)
+    else:
+        scale = 1.0 + index
+    distance = scale * x[:, m - 1 : n] - 10.0 * x[:, :1]
+
+    g = np.empty((x.shape[0], m))
+    start = 0
+    for i in range(m):
+        size = sizes[i]
+        group = distance[:, start : start + nk * size].reshape(-1, nk, size)
+        basic = odd if i % 2 == 0 else even
+        g[:, i] = np.sum(basic(group), axis=1) / size / nk
+        start += nk * size
+    return position, g
+
+
+def _linear(position: np.ndarray, g: np.ndarray) -> np.ndarray:
+    ones = np.ones((position.shape[0], 1))
+    products = np.cumprod(np.hstack((ones, position)), axis=1)[:, ::-1]
+    return (1.0 + g) * products * np.hstack((ones, 1.0 - position[:, ::-1]))
+
+
+def _spherical(position: np.ndarray, g: np.ndarray) -> np.ndarray:
+    ones = np.ones((position.shape[0], 1))
+    angles = position * (np.pi / 2.0)
+    cosines = np.cumprod(np.hstack((ones, np.cos(angles))), axis=1)[:, ::-1]
+    shifted = np.hstack((g[:, 1:], np.zeros((g.shape[0], 1))))
+    return (1.0 + g + shifted) * cosines * np.hstack((ones, np.sin(angles[:, ::-1])))
+
+
+def _disconnected(position: np.ndarray, g: np.ndarray) -> np.ndarray:
+    g = 1.0 + np.sum(g, axis=1)
+    m = position.shape[1] + 1
+    h = m - np.sum(
+        position / (1.0 + g)[:, None] * (1.0 + np.sin(3.0 * np.pi * position)), axis=1
+    )
+    return np.column_stack((position, (1.0 + g) * h))
+
+
+def lsmop1(x: np.ndarray, n_of_objectives: int, nk: int = 5) -> np.ndarray:
+    """Evaluate LSMOP1: linear front, linear linkage, sphere functions.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        nk (int, optional): The number of subcomponents of each objective.
+            Defaults to 5.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    return _linear(*_position_and_g(x, n_of_objectives, nk, False, _sphere, _sphere))
+
+
+def lsmop2(x: np.ndarray, n_of_objectives: int, nk: int = 5) -> np.ndarray:
+    """Evaluate LSMOP2: linear front, linear linkage, Griewank and Schwefel
+    functions.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        nk (int, optional): The number of subcomponents of each objective.
+            Defaults to 5.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    return _linear(
+        *_position_and_g(x, n_of_objectives, nk, False, _griewank, _schwefel)
+    )
+
+
+def lsmop3(x: np.ndarray, n_of_objectives: int, nk: int = 5) -> np.ndarray:
+    """Evaluate LSMOP3: linear front, linear linkage, Rastrigin and Rosenbrock
+    functions.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        nk (int, optional): The number of subcomponents of each objective.
+            Defaults to 5.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    return _linear(
+        *_position_and_g(x, n_of_objectives, nk, False, _rastrigin, _rosenbrock)
+    )
+
+
+def lsmop4(x: np.ndarray, n_of_objectives: int, nk: int = 5) -> np.ndarray:
+    """Evaluate LSMOP4: linear front, linear linkage, Ackley and Griewank
+    functions.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        nk (int, optional): The number of subcomponents of each objective.
+            Defaults to 5.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    return _linear(
+        *_position_and_g(x, n_of_objectives, nk, False, _ackley, _griewank)
+    )
+
+
+def lsmop5(x: np.ndarray, n_of_objectives: int, nk: int = 5) -> np.ndarray:
+    """Evaluate LSMOP5: spherical front, nonlinear linkage, sphere functions.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        nk (int, optional): The number of subcomponents of each objective.
+            Defaults to 5.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    return _spherical(
+        *_position_and_g(x, n_of_objectives, nk, True, _sphere, _sphere)
+    )
+
+
+def lsmop6(x: np.ndarray, n_of_objectives: int, nk: int = 5) -> np.ndarray:
+    """Evaluate LSMOP6: spherical front, nonlinear linkage, Rosenbrock and
+    Schwefel functions.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        nk (int, optional): The number of subcomponents of each objective.
+            Defaults to 5.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    return _spherical(
+        *_position_and_g(x, n_of_objectives, nk, True, _rosenbrock, _schwefel)
+    )
+
+
+def lsmop7(x: np.ndarray, n_of_objectives: int, nk: int = 5) -> np.ndarray:
+    """Evaluate LSMOP7: spherical front, nonlinear linkage, Ackley and Rosenbrock
+    functions.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        nk (int, optional): The number of subcomponents of each objective.
+            Defaults to 5.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    return _spherical(
+        *_position_and_g(x, n_of_objectives, nk, True, _ackley, _rosenbrock)
+    )
+
+
+def lsmop8(x: np.ndarray, n_of_objectives: int, nk: int = 5) -> np.ndarray:
+    """Evaluate LSMOP8: spherical front, nonlinear linkage, Griewank and sphere
+    functions.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        nk (int, optional): The number of subcomponents of each objective.
+            Defaults to 5.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    return _spherical(
+        *_position_and_g(x, n_of_objectives, nk, True, _griewank, _sphere)
+    )
+
+
+def lsmop9(x: np.ndarray, n_of_objectives: int, nk: int = 5) -> np.ndarray:
+    """Evaluate LSMOP9: disconnected front, nonlinear linkage, sphere and Ackley
+    functions.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        nk (int, optional): The number of subcomponents of each objective.
+            Defaults to 5.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    return _disconnected(
+        *_position_and_g(x, n_of_objectives, nk, True, _sphere, _ackley)
+    )
@@ -0,0 +1,305 @@
+"""Reference Pareto fronts and the ideal and nadir points of the problems built by
+test_problem_builder. The fronts are computed from closed forms, or by evaluating
+Pareto optimal solutions with the vectorized problems, and cached on disk.
+
+"""
+
+import os
+from itertools import combinations
+from os import path
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy.optimize import minimize_scalar
+from scipy.special import comb
+
+from desdeo_problem.Problem import ProblemError
+from desdeo_problem.testproblems import DTLZ
+
+default_cache_directory: str = path.join(
+    path.expanduser("~"), ".cache", "desdeo_problem", "pareto_fronts"
+)
+"""str: The directory where pareto_front caches the fronts by default."""
+
+# The Pareto optimal values of f1 of ZDT3
+_zdt3_intervals = np.array(
+    [
+        [0.0, 0.0830015349],
+        [0.1822287280, 0.2577623634],
+        [0.4093136748, 0.4538821041],
+        [0.6183967944, 0.6525117038],
+        [0.8233317983, 0.8518328654],
+    ]
+)
+# The smallest Pareto optimal value of f1 of ZDT6
+_zdt6_f1_min = 0.2807753191
+
+
+def pareto_front(
+    problem_name: str,
+    n_points: int,
+    n_of_objectives: int = 2,
+    cache_directory: Optional[str] = default_cache_directory,
+) -> np.ndarray:
+    """Sample the Pareto front of a test problem. The fronts of the ZDT problems,
+    the one dimensional fronts of DTLZ5, DTLZ6 and WFG3, and the disconnected
+    fronts of DTLZ7 and LSMOP9 are sampled evenly with n_points points (31 points
+    for ZDT5, whose front is discrete). The other fronts are simplex lattices, or
+    simplex lattices projected on the unit sphere, with at most n_points points,
+    but at least the extreme points of the front.
+
+    Args:
+        problem_name (str): Name of the problem in all caps. Supported: ZDT1-6,
+            DTLZ1-7, WFG3-9 and LSMOP1-9.
+        n_points (int): The number of points to sample.
+        n_of_objectives (int, optional): The number of objectives. Defaults to 2.
+        cache_directory (Optional[str], optional): A directory where the fronts
+            are saved and loaded from. Created if it does not exist. Defaults to
+            default_cache_directory. If None, the fronts are not cached.
+
+    Returns:
+        np.ndarray: The objective vectors of the front on the rows.
+
+    Raises:
+        ProblemError: The problem is not supported or the arguments are
+            invalid.
+
+    """
+    if n_points < 1:
+        msg = f"n_points should be a positive integer. Recieved {n_points}"
+        raise ProblemError(msg)
+    _check_objectives(problem_name, n_of_objectives)
+    if cache_directory is not None:
+        cache_path = path.join(
+            cache_directory, f"{problem_name}_{n_of_objectives}_{n_points}.npy"
+        )
+        if path.exists(cache_path):
+            return np.load(cache_path)
+
+    front = _sample_front(problem_name, n_points, n_of_objectives)
+
+    if cache_directory is not None:
+        os.makedirs(cache_directory, exist_ok=True)
+        # np.save adds the extension to names without one
+        np.save(cache_path + ".tmp.npy", front)
+        os.replace(cache_path + ".tmp.npy", cache_path)
+    return front
+
+
+def ideal_and_nadir(
+    problem_name: str, n_of_objectives: int = 2
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the ideal and nadir points of a test problem from the shape of its
+    Pareto front.
+
+    Args:
+        problem_name (str): Name of the problem in all caps. Supported: ZDT1-6,
+            DTLZ1-7, WFG1-9 and LSMOP1-9.
+        n_of_objectives (int, optional): The number of objectives. Defaults to 2.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The ideal and the nadir point.
+
+    Raises:
+        ProblemError: The problem is not supported.
+
+    """
+    _check_objectives(problem_name, n_of_objectives, fronts_only=False)
+    m = n_of_objectives
+    if problem_name in ("ZDT1", "ZDT2", "ZDT4"):
+        return np.zeros(2), np.ones(2)
+    if problem_name == "ZDT3":
+        result = minimize_scalar(
+            lambda f1: 1.0 - np.sqrt(f1) - f1 * np.sin(10.0 * np.pi * f1),
+            bounds=tuple(_zdt3_intervals[-1]),
+            method="bounded",
+            options={"xatol": 1e-12},
+        )
+        return np.array([0.0, result.fun]), np.array([_zdt3_intervals[-1, 1], 1.0])
+    if problem_name == "ZDT5":
+        return np.array([1.0, 10.0 / 31.0]), np.array([31.0, 10.0])
+    if problem_name == "ZDT6":
+        return (
+            np.array([_zdt6_f1_min, 0.0]),
+            np.array([1.0, 1.0 - _zdt6_f1_min ** 2]),
+        )
+    if problem_name == "DTLZ1":
+        return np.zeros(m), np.full(m, 0.5)
+    if problem_name in ("DTLZ5", "DTLZ6"):
+        # On the front the angles but the first are pi / 4
+        return np.zeros(m), _degenerate_maxima(np.sqrt(0.5), m)
+    if problem_name in ("DTLZ7", "LSMOP9"):
+        return _disconnected_extremes(m)
+    if problem_name == "WFG3":
+        # On the front x_1 is free and the other position parameters are 0.5
+        return np.zeros(m), 2.0 * np.arange(1, m + 1) * _degenerate_maxima(0.5, m)
+    if problem_name.startswith("WFG"):
+        # f_m = x_M + 2 * m * h_m, with x_M = 0 on the front and h_m in [0, 1]
+        return np.zeros(m), 2.0 * np.arange(1, m + 1)
+    # DTLZ2-4 and LSMOP1-8 have the unit simplex or the unit sphere as the front
+    return np.zeros(m), np.ones(m)
+
+
+def _check_objectives(problem_name: str, n_of_objectives: int, fronts_only=True):
+    """Check that the problem is supported with n_of_objectives objectives.
+
+    Raises:
+        ProblemError: The problem is not supported.
+
+    """
+    supported = (
+        [f"ZDT{i}" for i in range(1, 7)]
+        + [f"DTLZ{i}" for i in range(1, 8)]
+        + [f"WFG{i}" for i in range(1 if not fronts_only else 3, 10)]
+        + [f"LSMOP{i}" for i in range(1, 10)]
+    )
+    if problem_name not in supported:
+        msg = (
+            "Specified Problem not yet supported.\n The supported problems are:"
+            + str(supported)
+        )
+        raise ProblemError(msg)
+    if problem_name.startswith("ZDT") and n_of_objectives != 2:
+        msg = (
+            "ZDT problems can only have 2 objectives. "
+            + "Number of objectives recieved = "
+            + str(n_of_objectives)
+        )
+        raise ProblemError(msg)
+    if n_of_objectives < 2:
+        msg = (
+            "The problems need at least 2 objectives. "
+            + "Number of objectives recieved = "
+            + str(n_of_objectives)
+        )
+        raise ProblemError(msg)
+
+
+def _sample_front(problem_name: str, n_points: int, m: int) -> np.ndarray:
+    if problem_name.startswith("ZDT"):
+        return _zdt_front(problem_name, n_points)
+    if problem_name == "DTLZ1":
+        return 0.5 * _simplex_lattice(n_points, m)
+    if problem_name in ("DTLZ5", "DTLZ6"):
+        # Pareto optimal solutions: g is zero and the other position variables
+        # do not matter
+        x = np.full((n_points, m), 0.5)
+        x[:, 0] = np.linspace(0.0, 1.0, n_points)
+        if problem_name == "DTLZ6":
+            x[:, m - 1 :] = 0.0
+        return DTLZ.dtlz5(x, m) if problem_name == "DTLZ5" else DTLZ.dtlz6(x, m)
+    if problem_name in ("DTLZ7", "LSMOP9"):
+        return _disconnected_front(n_points, m)
+    if problem_name == "WFG3":
+        x1 = np.linspace(0.0, 1.0, n_points)[:, None]
+        h = x1 * _degenerate_maxima(0.5, m)
+        h[:, -1] = 1.0 - x1[:, 0]
+        return 2.0 * np.arange(1, m + 1) * h
+    if problem_name.startswith("WFG"):
+        return 2.0 * np.arange(1, m + 1) * _sphere_lattice(n_points, m)
+    if problem_name in ("LSMOP1", "LSMOP2", "LSMOP3", "LSMOP4"):
+        return _simplex_lattice(n_points, m)
+    # DTLZ2-4 and LSMOP5-8
+    return _sphere_lattice(n_points, m)
+
+
+def _zdt_front(problem_name: str, n_points: int) -> np.ndarray:
+    if problem_name == "ZDT5":
+        f1 = np.arange(1.0, 32.0)
+        return np.column_stack((f1, 10.0 / f1))
+    if problem_name == "ZDT3":
+        # Spread the points over the intervals in proportion to their lengths
+        lengths = np.diff(_zdt3_intervals, axis=1)[:, 0]
+        position = np.linspace(0.0, np.sum(lengths), n_points)
+        starts = np.concatenate(([0.0], np.cumsum(lengths)[:-1]))
+        interval = np.searchsorted(starts, position, side="right") - 1
+        f1 = _zdt3_intervals[interval, 0] + position - starts[interval]
+        f1 = np.minimum(f1, _zdt3_intervals[interval, 1])
+        return np.column_stack(
+            (f1, 1.0 - np.sqrt(f1) - f1 * np.sin(10.0 * np.pi * f1))
+        )
+    if problem_name == "ZDT6":
+        f1 = np.linspace(_zdt6_f1_min, 1.0, n_points)
+        return np.column_stack((f1, 1.0 - f1 ** 2))
+    f1 = np.linspace(0.0, 1.0, n_points)
+    if problem_name == "ZDT2":
+        return np.column_stack((f1, 1.0 - f1 ** 2))
+    # ZDT1 and ZDT4
+    return np.column_stack((f1, 1.0 - np.sqrt(f1)))
+
+
+def _simplex_lattice(n_points: int, m: int) -> np.ndarray:
+    """The points of the unit simplex whose coordinates are multiples of 1 / h,
+    for the largest h giving at most n_points points, but at least 1.
+
+    """
+    h = 1
+    while comb(h + m, m - 1, exact=True) <= n_points:
+        h += 1
+    # Each combination of m - 1 bars among h + m - 1 slots divides h units in m
+    bars = np.array(list(combinations(range(h + m - 1), m - 1)), dtype=float)
+    n_rows = len(bars)
+    bars = np.column_stack((np.full(n_rows, -1.0), bars, np.full(n_rows, h + m - 1)))
+    return (np.diff(bars, axis=1) - 1.0) / h
+
+
+def _sphere_lattice(n_points: int, m: int) -> np.ndarray:
+    lattice = _simplex_lattice(n_points, m)
+    return lattice / np.linalg.norm(lattice, axis=1, keepdims=True)
+
+
+def _degenerate_maxima(base: float, m: int) -> np.ndarray:
+    """The largest values of the shape functions on a front where the first
+    position parameter is free and the rest are fixed: base ** (m - 2) for the
+    first two objectives, base ** (m - i) for the ith objective, and 1 for the
+    last.
+
+    """
+    return base ** np.concatenate(([m - 2], np.arange(m - 2, -1, -1)))
+
+
+def _phi(t: np.ndarray) -> np.ndarray:
+    return t * (1.0 + np.sin(3.0 * np.pi * t))
+
+
+def _last_phi_maximum() -> Tuple[float, float]:
+    """The last local maximum of phi in [0, 1] and its value."""
+    result = minimize_scalar(
+        lambda t: -_phi(t),
+        bounds=(0.75, 1.0),
+        method="bounded",
+        options={"xatol": 1e-12},
+    )
+    return result.x, -result.fun
+
+
+def _disconnected_extremes(m: int) -> Tuple[np.ndarray, np.ndarray]:
+    """The ideal and nadir points of the disconnected fronts of DTLZ7 and LSMOP9,
+    on which f_M = 2 * M - sum(phi(f_i)) with phi(t) = t * (1 + sin(3 * pi * t)).
+
+    The front is the product of the values of t in [0, 1] with phi(t) greater than
+    at any smaller t, the largest of which is the last local maximum of phi.
+
+    """
+    (t_max, phi_max) = _last_phi_maximum()
+    ideal = np.zeros(m)
+    ideal[-1] = 2.0 * m - (m - 1) * phi_max
+    nadir = np.full(m, t_max)
+    nadir[-1] = 2.0 * m
+    return ideal, nadir
+
+
+def _disconnected_front(n_points: int, m: int) -> np.ndarray:
+    """A grid on the disconnected front of DTLZ7 and LSMOP9, with at most n_points
+    points, but at least 2 values for each of the first M - 1 objectives.
+
+    """
+    (t_max, _) = _last_phi_maximum()
+    t = np.linspace(0.0, t_max, 100001)
+    phi = _phi(t)
+    record = np.concatenate(([True], phi[1:] > np.maximum.accumulate(phi)[:-1]))
+    n_values = max(2, int(np.floor(n_points ** (1.0 / (m - 1)) + 1e-9)))
+    values = t[record][np.linspace(0, np.sum(record) - 1, n_values).astype(int)]
+    grid = np.stack(np.meshgrid(*[values] * (m - 1), indexing="ij"), axis=-1)
+    position = grid.reshape(-1, m - 1)
+    return np.column_stack((position, 2.0 * m - np.sum(_phi(position), axis=1)))
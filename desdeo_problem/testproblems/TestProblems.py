@@ -1,21 +1,40 @@
-from optproblems import zdt, dtlz
-from desdeo_problem.Variable import variable_builder
+from functools import partial
+
+import numpy as np
+from optproblems import zdt, dtlz, wfg
+from desdeo_problem.Variable import VariableSet, variable_builder
 from desdeo_problem.Objective import VectorObjective
 from desdeo_problem.Problem import MOProblem
 from desdeo_problem.Problem import ProblemError
+from desdeo_problem.testproblems import DTLZ, LSMOP, WFG, ZDT
+from desdeo_problem.testproblems.ParetoFront import ideal_and_nadir
 
 
 def test_problem_builder(
-    name: str, n_of_variables: int = None, n_of_objectives: int = None
+    name: str,
+    n_of_variables: int = None,
+    n_of_objectives: int = None,
+    vectorized: bool = True,
+    n_of_position_variables: int = None,
 ) -> MOProblem:
-    """Build test problems. Currently supported: ZDT1-4, ZDT6, and DTLZ1-7.
+    """Build test problems. Currently supported: ZDT1-6, DTLZ1-7, WFG1-9 and
+    LSMOP1-9.
 
     Args:
         name (str): Name of the problem in all caps. For example: "ZDT1", "DTLZ4", etc.
-        n_of_variables (int, optional): Number of variables. Required for DTLZ problems,
-            but can be skipped for ZDT problems as they only support one variable value.
-        n_of_objectives (int, optional): Required for DTLZ problems,
-            but can be skipped for ZDT problems as they only support one variable value.
+        n_of_variables (int, optional): Number of variables. Required for DTLZ, WFG
+            and LSMOP problems, but can be skipped for ZDT problems.
+        n_of_objectives (int, optional): Required for DTLZ, WFG and LSMOP problems,
+            but can be skipped for ZDT problems as they only support two objectives.
+        vectorized (bool, optional): Evaluate the whole population at once with the
+            implementations in the ZDT, DTLZ, WFG and LSMOP modules. If False, the
+            individuals are evaluated one by one with optproblems, and the ZDT
+            problems are limited to their default number of variables. ZDT5 and
+            LSMOP problems are only available vectorized. ZDT5 has its 80 bits as
+            variables in [0, 1]. Defaults to True.
+        n_of_position_variables (int, optional): The number of position variables k
+            of WFG problems. Must be a multiple of n_of_objectives - 1. Defaults to
+            None, which uses 2 * (n_of_objectives - 1).
 
     Raises:
         ProblemError: When one of many issues occur while building the MOProblem
@@ -38,8 +57,59 @@ def test_problem_builder(
         "DTLZ5": dtlz.DTLZ5,
         "DTLZ6": dtlz.DTLZ6,
         "DTLZ7": dtlz.DTLZ7,
+        "WFG1": wfg.WFG1,
+        "WFG2": wfg.WFG2,
+        "WFG3": wfg.WFG3,
+        "WFG4": wfg.WFG4,
+        "WFG5": wfg.WFG5,
+        "WFG6": wfg.WFG6,
+        "WFG7": wfg.WFG7,
+        "WFG8": wfg.WFG8,
+        "WFG9": wfg.WFG9,
+        "LSMOP1": None,
+        "LSMOP2": None,
+        "LSMOP3": None,
+        "LSMOP4": None,
+        "LSMOP5": None,
+        "LSMOP6": None,
+        "LSMOP7": None,
+        "LSMOP8": None,
+        "LSMOP9": None,
+    }
+    vectorized_problems = {
+        "ZDT1": ZDT.zdt1,
+        "ZDT2": ZDT.zdt2,
+        "ZDT3": ZDT.zdt3,
+        "ZDT4": ZDT.zdt4,
+        "ZDT5": ZDT.zdt5,
+        "ZDT6": ZDT.zdt6,
+        "DTLZ1": DTLZ.dtlz1,
+        "DTLZ2": DTLZ.dtlz2,
+        "DTLZ3": DTLZ.dtlz3,
+        "DTLZ4": DTLZ.dtlz4,
+        "DTLZ5": DTLZ.dtlz5,
+        "DTLZ6": DTLZ.dtlz6,
+        "DTLZ7": DTLZ.dtlz7,
+        "WFG1": WFG.wfg1,
+        "WFG2": WFG.wfg2,
+        "WFG3": WFG.wfg3,
+        "WFG4": WFG.wfg4,
+        "WFG5": WFG.wfg5,
+        "WFG6": WFG.wfg6,
+        "WFG7": WFG.wfg7,
+        "WFG8": WFG.wfg8,
+        "WFG9": WFG.wfg9,
+        "LSMOP1": LSMOP.lsmop1,
+        "LSMOP2": LSMOP.lsmop2,
+        "LSMOP3": LSMOP.lsmop3,
+        "LSMOP4": LSMOP.lsmop4,
+        "LSMOP5": LSMOP.lsmop5,
+        "LSMOP6": LSMOP.lsmop6,
+        "LSMOP7": LSMOP.lsmop7,
+        "LSMOP8": LSMOP.lsmop8,
+        "LSMOP9": LSMOP.lsmop9,
     }
-    num_var = {"ZDT1": 30, "ZDT2": 30, "ZDT3": 30, "ZDT4": 10, "ZDT6": 10}
+    num_var = {"ZDT1": 30, "ZDT2": 30, "ZDT3": 30, "ZDT4": 10, "ZDT5": 80, "ZDT6": 10}
     if not (name in problems.keys()):
         msg = (
             "Specified Problem not yet supported.\n The supported problems are:"
@@ -51,7 +121,16 @@ def test_problem_builder(
             n_of_variables = num_var[name]
         if n_of_objectives is None:
             n_of_objectives = 2
-        if not (n_of_variables == num_var[name]):
+        if vectorized and n_of_variables < 2:
+            msg = (
+                "ZDT problems need at least 2 variables. "
+                + "Number of variables recieved = "
+                + str(n_of_variables)
+            )
+            raise ProblemError(msg)
+        if (not vectorized or name == "ZDT5") and not (
+            n_of_variables == num_var[name]
+        ):
             msg = (
                 name
                 + " problem has been limited to "
@@ -67,7 +146,18 @@ def test_problem_builder(
                 + str(n_of_objectives)
             )
             raise ProblemError(msg)
-        obj_func = problems[name]()
+        if name == "ZDT5" and not vectorized:
+            msg = "ZDT5 is only available vectorized."
+            raise ProblemError(msg)
+        lower_limits = np.zeros(n_of_variables)
+        upper_limits = np.ones(n_of_variables)
+        if name == "ZDT4":
+            lower_limits[1:] = -5.0
+            upper_limits[1:] = 5.0
+        if vectorized:
+            evaluator = vectorized_problems[name]
+        else:
+            obj_func = problems[name]()
     elif "DTLZ" in name:
         if (n_of_variables is None) or (n_of_objectives is None):
             msg = (
@@ -75,20 +165,106 @@ def test_problem_builder(
                 + " for the DTLZ problems"
             )
             raise ProblemError(msg)
-        obj_func = problems[name](n_of_objectives, n_of_variables)
+        if n_of_variables < n_of_objectives:
+            msg = (
+                "DTLZ problems need at least as many variables as objectives. "
+                + "Number of variables recieved = "
+                + str(n_of_variables)
+            )
+            raise ProblemError(msg)
+        lower_limits = np.zeros(n_of_variables)
+        upper_limits = np.ones(n_of_variables)
+        if vectorized:
+            evaluator = partial(
+                vectorized_problems[name], n_of_objectives=n_of_objectives
+            )
+        else:
+            obj_func = problems[name](n_of_objectives, n_of_variables)
+    elif "WFG" in name:
+        if (n_of_variables is None) or (n_of_objectives is None):
+            msg = (
+                "Please provide both number of variables and objectives"
+                + " for the WFG problems"
+            )
+            raise ProblemError(msg)
+        if n_of_objectives < 2:
+            msg = (
+                "WFG problems need at least 2 objectives. "
+                + "Number of objectives recieved = "
+                + str(n_of_objectives)
+            )
+            raise ProblemError(msg)
+        k = n_of_position_variables
+        if k is None:
+            k = 2 * (n_of_objectives - 1)
+        if not (1 <= k < n_of_variables and k % (n_of_objectives - 1) == 0):
+            msg = (
+                "The number of position variables of WFG problems should be a "
+                + "multiple of the number of objectives minus one, and less than "
+                + "the number of variables. Number of position variables = "
+                + str(k)
+            )
+            raise ProblemError(msg)
+        if name in ("WFG2", "WFG3") and (n_of_variables - k) % 2 != 0:
+            msg = (
+                name
+                + " problem needs an even number of distance variables. "
+                + "Number of distance variables = "
+                + str(n_of_variables - k)
+            )
+            raise ProblemError(msg)
+        lower_limits = np.zeros(n_of_variables)
+        upper_limits = 2.0 * np.arange(1, n_of_variables + 1)
+        if vectorized:
+            evaluator = partial(
+                vectorized_problems[name], n_of_objectives=n_of_objectives, k=k
+            )
+        else:
+            obj_func = problems[name](n_of_objectives, n_of_variables, k)
+    elif "LSMOP" in name:
+        if (n_of_variables is None) or (n_of_objectives is None):
+            msg = (
+                "Please provide both number of variables and objectives"
+                + " for the LSMOP problems"
+            )
+            raise ProblemError(msg)
+        if not vectorized:
+            msg = "LSMOP problems are only available vectorized."
+            raise ProblemError(msg)
+        if n_of_objectives < 2 or np.any(
+            LSMOP.subcomponent_sizes(n_of_variables, n_of_objectives) < 1
+        ):
+            msg = (
+                "Too few variables for the LSMOP problems with "
+                + str(n_of_objectives)
+                + " objectives. Number of variables recieved = "
+                + str(n_of_variables)
+            )
+            raise ProblemError(msg)
+        lower_limits = np.zeros(n_of_variables)
+        upper_limits = np.full(n_of_variables, 10.0)
+        upper_limits[: n_of_objectives - 1] = 1.0
+        evaluator = partial(vectorized_problems[name], n_of_objectives=n_of_objectives)
     else:
         msg = "How did you end up here?"
         raise ProblemError(msg)
-    lower_limits = obj_func.min_bounds
-    upper_limits = obj_func.max_bounds
     var_names = ["x" + str(i + 1) for i in range(n_of_variables)]
     obj_names = ["f" + str(i + 1) for i in range(n_of_objectives)]
-    variables = variable_builder(
-        names=var_names,
-        initial_values=lower_limits,
-        lower_bounds=lower_limits,
-        upper_bounds=upper_limits,
-    )
+    if "WFG" in name or "LSMOP" in name:
+        # These are meant to be used with many variables
+        variables = VariableSet(
+            names=var_names,
+            initial_values=lower_limits,
+            lower_bounds=lower_limits,
+            upper_bounds=upper_limits,
+        )
+    else:
+        variables = variable_builder(
+            names=var_names,
+            initial_values=lower_limits,
+            lower_bounds=lower_limits,
+            upper_bounds=upper_limits,
+        )
 
     # Because optproblems can only handle one objective at a time
     def modified_obj_func(x):
@@ -104,6 +280,10 @@ def test_problem_builder(
                 return list(map(obj_func, x))
         raise TypeError("Unforseen problem, contact developer")
 
-    objective = VectorObjective(name=obj_names, evaluator=modified_obj_func)
-    problem = MOProblem([objective], variables, None)
+    if not vectorized:
+        evaluator = modified_obj_func
+    objective = VectorObjective(name=obj_names, evaluator=evaluator)
+    ideal, nadir = ideal_and_nadir(name, n_of_objectives)
+    problem = MOProblem([objective], variables, None, nadir=nadir, ideal=ideal)
     return problem
+
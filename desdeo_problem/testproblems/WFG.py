@@ -0,0 +1,365 @@
+"""Vectorized implementations of the WFG test problems. Each function evaluates a
+whole population of decision vectors at once, returning the objective vectors on
+the rows of a 2D array. The ith variable is in [0, 2i]. Of the n variables, the
+first k are the position variables and the remaining l = n - k the distance
+variables. k must be a multiple of the number of objectives minus one, and l must
+be even for WFG2 and WFG3. The definitions follow the optproblems package, which
+reimplements the original WFG toolkit.
+
+"""
+
+import numpy as np
+
+
+def _correct_to_01(a: np.ndarray, epsilon: float = 1.0e-10) -> np.ndarray:
+    """Clip the values within epsilon of [0, 1], which result from rounding
+    errors, to [0, 1].
+
+    """
+    a = np.where((a <= 0.0) & (a >= -epsilon), 0.0, a)
+    return np.where((a >= 1.0) & (a <= 1.0 + epsilon), 1.0, a)
+
+
+def _normalize_z(z: np.ndarray) -> np.ndarray:
+    z = np.atleast_2d(np.asarray(z, dtype=float))
+    return z / (2.0 * np.arange(1, z.shape[1] + 1))
+
+
+# Transformation functions
+
+
+def _b_poly(y: np.ndarray, alpha: float) -> np.ndarray:
+    return _correct_to_01(y ** alpha)
+
+
+def _b_flat(y: np.ndarray, a: float, b: float, c: float) -> np.ndarray:
+    tmp1 = np.minimum(0.0, np.floor(y - b)) * a * (b - y) / b
+    tmp2 = np.minimum(0.0, np.floor(c - y)) * (1.0 - a) * (y - c) / (1.0 - c)
+    return _correct_to_01(a + tmp1 - tmp2)
+
+
+def _b_param(y: np.ndarray, u: np.ndarray, a: float, b: float, c: float):
+    v = a - (1.0 - 2.0 * u) * np.abs(np.floor(0.5 - u) + a)
+    return _correct_to_01(y ** (b + (c - b) * v))
+
+
+def _s_linear(y: np.ndarray, a: float) -> np.ndarray:
+    return _correct_to_01(np.abs(y - a) / np.abs(np.floor(a - y) + a))
+
+
+def _s_decept(y: np.ndarray, a: float, b: float, c: float) -> np.ndarray:
+    tmp1 = np.floor(y - a + b) * (1.0 - c + (a - b) / b) / (a - b)
+    tmp2 = np.floor(a + b - y) * (1.0 - c + (1.0 - a - b) / b) / (1.0 - a - b)
+    return _correct_to_01(1.0 + (np.abs(y - a) - b) * (tmp1 + tmp2 + 1.0 / b))
+
+
+def _s_multi(y: np.ndarray, a: float, b: float, c: float) -> np.ndarray:
+    tmp1 = np.abs(y - c) / (2.0 * (np.floor(c - y) + c))
+    tmp2 = (4.0 * a + 2.0) * np.pi * (0.5 - tmp1)
+    return _correct_to_01((1.0 + np.cos(tmp2) + 4.0 * b * tmp1 ** 2) / (b + 2.0))
+
+
+def _r_sum(y: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """Weighted mean of the last axis of y."""
+    return _correct_to_01(y @ w / np.sum(w))
+
+
+def _r_nonsep(y: np.ndarray, a: int) -> np.ndarray:
+    """Non-separable reduction of the last axis of y."""
+    size = y.shape[-1]
+    numerator = np.sum(y, axis=-1)
+    if a == size and size > 1:
+        # Every element is compared with all the others: sum the absolute
+        # differences of all pairs from the sorted values
+        ranks = 2.0 * np.arange(size) - size + 1.0
+        numerator += 2.0 * np.sort(y, axis=-1) @ ranks
+    else:
+        for k in range(a - 1):
+            numerator += np.sum(np.abs(y - np.roll(y, -(k + 1), axis=-1)), axis=-1)
+    tmp = np.ceil(a / 2.0)
+    denominator = size * tmp * (1.0 + 2.0 * a - 2.0 * tmp) / a
+    return _correct_to_01(numerator / denominator)
+
+
+def _group_reduce(y: np.ndarray, k: int, m: int, reduce) -> np.ndarray:
+    """Reduce the k position parameters in m - 1 equal groups and the distance
+    parameters in one group. reduce is called with the columns of each group.
+
+    """
+    size = k // (m - 1)
+    position = reduce(y[:, :k].reshape(y.shape[0], m - 1, size))
+    return np.column_stack((position, reduce(y[:, k:])))
+
+
+def _r_sum_groups(y: np.ndarray, k: int, m: int, w: np.ndarray = None) -> np.ndarray:
+    """The r_sum reduction of WFG1-5 and WFG7-8. Unit weights by default."""
+    if w is None:
+        return _group_reduce(y, k, m, lambda g: _correct_to_01(np.mean(g, axis=-1)))
+    size = k // (m - 1)
+    position = y[:, :k].reshape(y.shape[0], m - 1, size) * w[:k].reshape(m - 1, size)
+    position = position.sum(axis=-1) / w[:k].reshape(m - 1, size).sum(axis=-1)
+    return np.column_stack(
+        (_correct_to_01(position), _r_sum(y[:, k:], w[k:]))
+    )
+
+
+def _r_nonsep_groups(y: np.ndarray, k: int, m: int) -> np.ndarray:
+    """The r_nonsep reduction of WFG6 and WFG9."""
+    position = _r_nonsep(
+        y[:, :k].reshape(y.shape[0], m - 1, k // (m - 1)), k // (m - 1)
+    )
+    return np.column_stack((position, _r_nonsep(y[:, k:], y.shape[1] - k)))
+
+
+def _pair_reduce(y: np.ndarray, k: int) -> np.ndarray:
+    """The r_nonsep reduction of the consecutive pairs of distance parameters of
+    WFG2 and WFG3.
+
+    """
+    pairs = y[:, k:].reshape(y.shape[0], -1, 2)
+    return np.column_stack((y[:, :k], _r_nonsep(pairs, 2)))
+
+
+def _suffix_means(y: np.ndarray) -> np.ndarray:
+    """The means of y[:, i + 1:] for each column i but the last."""
+    sums = np.cumsum(y[:, :0:-1], axis=1)[:, ::-1]
+    return sums / np.arange(y.shape[1] - 1, 0, -1)
+
+
+def _prefix_means(y: np.ndarray) -> np.ndarray:
+    """The means of y[:, :i] for each column i but the first."""
+    return np.cumsum(y[:, :-1], axis=1) / np.arange(1, y.shape[1])
+
+
+# Shape functions
+
+
+def _x_from_t(t: np.ndarray, degenerate: bool = False) -> np.ndarray:
+    a = np.ones(t.shape[1] - 1)
+    if degenerate:
+        a[1:] = 0.0
+    x_m = t[:, -1:]
+    return np.column_stack((np.maximum(x_m, a) * (t[:, :-1] - 0.5) + 0.5, x_m))
+
+
+def _products(first: np.ndarray, last: np.ndarray) -> np.ndarray:
+    """h_m for the shapes which are products over the position parameters: the
+    product of first(x_i) over the first M - m parameters, times last(x_(M-m+1))
+    for m > 1.
+
+    """
+    n_rows = first.shape[0]
+    ones = np.ones((n_rows, 1))
+    products = np.cumprod(np.hstack((ones, first)), axis=1)[:, ::-1]
+    return _correct_to_01(products * np.hstack((ones, last[:, ::-1])))
+
+
+def _linear(x: np.ndarray) -> np.ndarray:
+    return _products(x[:, :-1], 1.0 - x[:, :-1])
+
+
+def _convex(x: np.ndarray) -> np.ndarray:
+    angles = x[:, :-1] * (np.pi / 2.0)
+    return _products(1.0 - np.cos(angles), 1.0 - np.sin(angles))
+
+
+def _concave(x: np.ndarray) -> np.ndarray:
+    angles = x[:, :-1] * (np.pi / 2.0)
+    return _products(np.sin(angles), np.cos(angles))
+
+
+def _mixed(x: np.ndarray, a: int, alpha: float) -> np.ndarray:
+    tmp = 2.0 * a * np.pi
+    return _correct_to_01(
+        (1.0 - x[:, 0] - np.cos(tmp * x[:, 0] + np.pi / 2.0) / tmp) ** alpha
+    )
+
+
+def _disc(x: np.ndarray, a: int, alpha: float, beta: float) -> np.ndarray:
+    tmp = a * x[:, 0] ** beta * np.pi
+    return _correct_to_01(1.0 - x[:, 0] ** alpha * np.cos(tmp) ** 2)
+
+
+def _objectives(x: np.ndarray, h: np.ndarray) -> np.ndarray:
+    return x[:, -1:] + 2.0 * np.arange(1, h.shape[1] + 1) * h
+
+
+def _convex_front(t: np.ndarray, last) -> np.ndarray:
+    """The convex front of WFG1 and WFG2, with last as the shape of the last
+    objective.
+
+    """
+    x = _x_from_t(t)
+    h = _convex(x)
+    h[:, -1] = last(x)
+    return _objectives(x, h)
+
+
+def _concave_front(t: np.ndarray) -> np.ndarray:
+    x = _x_from_t(t)
+    return _objectives(x, _concave(x))
+
+
+def wfg1(z: np.ndarray, n_of_objectives: int, k: int) -> np.ndarray:
+    """Evaluate WFG1.
+
+    Args:
+        z (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        k (int): The number of position variables.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    y = _normalize_z(z)
+    y[:, k:] = _s_linear(y[:, k:], 0.35)
+    y[:, k:] = _b_flat(y[:, k:], 0.8, 0.75, 0.85)
+    y = _b_poly(y, 0.02)
+    w = 2.0 * np.arange(1, y.shape[1] + 1)
+    t = _r_sum_groups(y, k, n_of_objectives, w)
+    return _convex_front(t, lambda x: _mixed(x, 5, 1.0))
+
+
+def wfg2(z: np.ndarray, n_of_objectives: int, k: int) -> np.ndarray:
+    """Evaluate WFG2.
+
+    Args:
+        z (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        k (int): The number of position variables.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    y = _normalize_z(z)
+    y[:, k:] = _s_linear(y[:, k:], 0.35)
+    t = _r_sum_groups(_pair_reduce(y, k), k, n_of_objectives)
+    return _convex_front(t, lambda x: _disc(x, 5, 1.0, 1.0))
+
+
+def wfg3(z: np.ndarray, n_of_objectives: int, k: int) -> np.ndarray:
+    """Evaluate WFG3.
+
+    Args:
+        z (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        k (int): The number of position variables.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    y = _normalize_z(z)
+    y[:, k:] = _s_linear(y[:, k:], 0.35)
+    t = _r_sum_groups(_pair_reduce(y, k), k, n_of_objectives)
+    x = _x_from_t(t, degenerate=True)
+    return _objectives(x, _linear(x))
+
+
+def wfg4(z: np.ndarray, n_of_objectives: int, k: int) -> np.ndarray:
+    """Evaluate WFG4.
+
+    Args:
+        z (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        k (int): The number of position variables.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    y = _s_multi(_normalize_z(z), 30, 10, 0.35)
+    return _concave_front(_r_sum_groups(y, k, n_of_objectives))
+
+
+def wfg5(z: np.ndarray, n_of_objectives: int, k: int) -> np.ndarray:
+    """Evaluate WFG5.
+
+    Args:
+        z (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        k (int): The number of position variables.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    y = _s_decept(_normalize_z(z), 0.35, 0.001, 0.05)
+    return _concave_front(_r_sum_groups(y, k, n_of_objectives))
+
+
+def wfg6(z: np.ndarray, n_of_objectives: int, k: int) -> np.ndarray:
+    """Evaluate WFG6.
+
+    Args:
+        z (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        k (int): The number of position variables.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    y = _normalize_z(z)
+    y[:, k:] = _s_linear(y[:, k:], 0.35)
+    return _concave_front(_r_nonsep_groups(y, k, n_of_objectives))
+
+
+def wfg7(z: np.ndarray, n_of_objectives: int, k: int) -> np.ndarray:
+    """Evaluate WFG7.
+
+    Args:
+        z (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        k (int): The number of position variables.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    y = _normalize_z(z)
+    u = _correct_to_01(_suffix_means(y)[:, :k])
+    y[:, :k] = _b_param(y[:, :k], u, 0.98 / 49.98, 0.02, 50)
+    y[:, k:] = _s_linear(y[:, k:], 0.35)
+    return _concave_front(_r_sum_groups(y, k, n_of_objectives))
+
+
+def wfg8(z: np.ndarray, n_of_objectives: int, k: int) -> np.ndarray:
+    """Evaluate WFG8.
+
+    Args:
+        z (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        k (int): The number of position variables.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    y = _normalize_z(z)
+    u = _correct_to_01(_prefix_means(y)[:, k - 1 :])
+    y[:, k:] = _b_param(y[:, k:], u, 0.98 / 49.98, 0.02, 50)
+    y[:, k:] = _s_linear(y[:, k:], 0.35)
+    return _concave_front(_r_sum_groups(y, k, n_of_objectives))
+
+
+def wfg9(z: np.ndarray, n_of_objectives: int, k: int) -> np.ndarray:
+    """Evaluate WFG9.
+
+    Args:
+        z (np.ndarray): A 2D array of decision vectors.
+        n_of_objectives (int): The number of objectives.
+        k (int): The number of position variables.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    y = _normalize_z(z)
+    u = _correct_to_01(_suffix_means(y))
+    y[:, :-1] = _b_param(y[:, :-1], u, 0.98 / 49.98, 0.02, 50)
+    y[:, :k] = _s_decept(y[:, :k], 0.35, 0.001, 0.05)
+    y[:, k:] = _s_multi(y[:, k:], 30, 95, 0.35)
+    return _concave_front(_r_nonsep_groups(y, k, n_of_objectives))
@@ -0,0 +1,122 @@
+"""Vectorized implementations of the ZDT test problems. Each function evaluates a
+whole population of decision vectors at once, returning the values of the two
+objectives on the rows of a 2D array. The definitions follow the optproblems
+package.
+
+"""
+
+import numpy as np
+
+
+def _as_population(x: np.ndarray) -> np.ndarray:
+    return np.atleast_2d(np.asarray(x, dtype=float))
+
+
+def _zdt1to3_g(x: np.ndarray) -> np.ndarray:
+    return 1.0 + 9.0 * np.sum(x[:, 1:], axis=1) / (x.shape[1] - 1)
+
+
+def zdt1(x: np.ndarray) -> np.ndarray:
+    """Evaluate ZDT1.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors in [0, 1].
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    x = _as_population(x)
+    f1 = x[:, 0]
+    g = _zdt1to3_g(x)
+    return np.column_stack((f1, g * (1.0 - np.sqrt(f1 / g))))
+
+
+def zdt2(x: np.ndarray) -> np.ndarray:
+    """Evaluate ZDT2.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors in [0, 1].
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    x = _as_population(x)
+    f1 = x[:, 0]
+    g = _zdt1to3_g(x)
+    return np.column_stack((f1, g * (1.0 - (f1 / g) ** 2)))
+
+
+def zdt3(x: np.ndarray) -> np.ndarray:
+    """Evaluate ZDT3.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors in [0, 1].
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    x = _as_population(x)
+    f1 = x[:, 0]
+    g = _zdt1to3_g(x)
+    fraction = f1 / g
+    h = 1.0 - np.sqrt(fraction) - fraction * np.sin(10.0 * np.pi * f1)
+    return np.column_stack((f1, g * h))
+
+
+def zdt4(x: np.ndarray) -> np.ndarray:
+    """Evaluate ZDT4.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors. The first variable is in
+            [0, 1] and the rest in [-5, 5].
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    x = _as_population(x)
+    f1 = x[:, 0]
+    tail = x[:, 1:]
+    g = (
+        1.0
+        + 10.0 * (x.shape[1] - 1)
+        + np.sum(tail ** 2 - 10.0 * np.cos(4.0 * np.pi * tail), axis=1)
+    )
+    return np.column_stack((f1, g * (1.0 - np.sqrt(f1 / g))))
+
+
+def zdt5(x: np.ndarray) -> np.ndarray:
+    """Evaluate ZDT5, the binary problem of the suite.
+
+    Args:
+        x (np.ndarray): A 2D array of 80 bits on each row: a substring of 30 bits
+            followed by 10 substrings of 5 bits. The values are rounded to bits.
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    bits = np.rint(_as_population(x))
+    f1 = 1.0 + np.sum(bits[:, :30], axis=1)
+    u = np.sum(bits[:, 30:80].reshape(-1, 10, 5), axis=2)
+    g = np.sum(np.where(u < 5, 2.0 + u, 1.0), axis=1)
+    return np.column_stack((f1, g / f1))
+
+
+def zdt6(x: np.ndarray) -> np.ndarray:
+    """Evaluate ZDT6.
+
+    Args:
+        x (np.ndarray): A 2D array of decision vectors in [0, 1].
+
+    Returns:
+        np.ndarray: The objective vectors.
+
+    """
+    x = _as_population(x)
+    f1 = 1.0 - np.exp(-4.0 * x[:, 0]) * np.sin(6.0 * np.pi * x[:, 0]) ** 6
+    g = 1.0 + 9.0 * (np.sum(x[:, 1:], axis=1) / (x.shape[1] - 1)) ** 0.25
+    return np.column_stack((f1, g * (1.0 - (f1 / g) ** 2)))
@@ -0,0 +1,105 @@
+import asyncio
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from desdeo_problem.Archive import EvaluationArchive, SampleArchive
+from desdeo_problem.Cache import EvaluationCache
+from desdeo_problem.Executor import ProcessExecutor
+from desdeo_problem.Objective import _ScalarDataObjective, _ScalarObjective
+from desdeo_problem.Problem import MOProblem
+from desdeo_problem.Variable import VariableSet
+
+
+def sum_of_squares(x: np.ndarray) -> np.ndarray:
+    return np.sum(x ** 2, axis=1)
+
+
+def archived_problem(directory, cache=None):
+    variables = VariableSet(
+        ["x0", "x1"], lower_bounds=np.zeros(2), upper_bounds=np.ones(2)
+    )
+    return MOProblem(
+        [_ScalarObjective("f", sum_of_squares)],
+        variables,
+        archive=EvaluationArchive(str(directory)),
+        cache=cache,
+    )
+
+
+def stored_decision_vectors(directory) -> np.ndarray:
+    chunks = list(EvaluationArchive(str(directory)).iter_chunks())
+    return np.vstack([chunk.decision_vectors for chunk in chunks])
+
+
+def test_evaluate_async_appends_to_archive(tmp_path):
+    problem = archived_problem(tmp_path)
+    x = np.random.default_rng(0).random((4, 2))
+    asyncio.run(problem.evaluate_async(x))
+    np.testing.assert_array_equal(stored_decision_vectors(tmp_path), x)
+
+
+def test_evaluate_async_archives_only_cache_misses(tmp_path):
+    problem = archived_problem(tmp_path, EvaluationCache())
+    rng = np.random.default_rng(0)
+    x, y = rng.random((3, 2)), rng.random((2, 2))
+    asyncio.run(problem.evaluate_async(x))
+    asyncio.run(problem.evaluate_async(np.vstack((x, y))))
+    np.testing.assert_array_equal(stored_decision_vectors(tmp_path), np.vstack((x, y)))
+
+
+def test_data_objective_archive_under_process_executor(tmp_path):
+    x = np.random.default_rng(0).random((5, 2))
+    data = pd.DataFrame(
+        np.column_stack((x, sum_of_squares(x))), columns=["x0", "x1", "f"]
+    )
+    objective = _ScalarDataObjective(
+        "f", data, evaluator=sum_of_squares, archive=EvaluationArchive(str(tmp_path))
+    )
+    variables = VariableSet(
+        ["x0", "x1"], lower_bounds=np.zeros(2), upper_bounds=np.ones(2)
+    )
+    with ProcessExecutor(n_workers=4, chunk_size=2) as executor:
+        problem = MOProblem([objective], variables, executor=executor)
+        y = np.random.default_rng(1).random((12, 2))
+        problem.evaluate(y)
+    np.testing.assert_array_equal(stored_decision_vectors(tmp_path), y)
+    assert len(objective.samples) == 17
+
+
+def test_single_row_appends_are_merged(tmp_path):
+    archive = EvaluationArchive(str(tmp_path))
+    archive.initialize(["x0"], ["f"])
+    for i in range(1000):
+        archive.append([[i]], [[i]])
+    assert len(archive) == 1000
+    assert len(archive._header["chunks"]) <= 11
+    np.testing.assert_array_equal(
+        stored_decision_vectors(tmp_path)[:, 0], np.arange(1000)
+    )
+
+
+def test_concurrent_appends(tmp_path):
+    archive = EvaluationArchive(str(tmp_path))
+    archive.initialize(["x0"], ["f"])
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(lambda i: archive.append([[i], [i]], [[i], [i]]), range(200)))
+    stored = stored_decision_vectors(tmp_path)[:, 0]
+    assert len(EvaluationArchive(str(tmp_path))) == 400
+    np.testing.assert_array_equal(np.sort(stored), np.repeat(np.arange(200), 2))
+
+
+def test_sample_archive_pickle_round_trip():
+    archive = SampleArchive(np.ones((3, 2)), np.arange(3.0))
+    restored = pickle.loads(pickle.dumps(archive))
+    restored.append(np.zeros(2), 3.0)
+    np.testing.assert_array_equal(restored.X, np.vstack((np.ones((3, 2)), [0, 0])))
+    np.testing.assert_array_equal(restored.y, np.arange(4.0))
+
+    empty = pickle.loads(pickle.dumps(SampleArchive(np.empty((0, 2)), np.empty(0))))
+    empty.append(np.ones(2), 1.0)
+    empty.append(np.ones((3, 2)), np.ones(3))
+    assert len(empty) == 4
+    np.testing.assert_array_equal(empty.X, np.ones((4, 2)))
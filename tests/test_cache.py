@@ -0,0 +1,61 @@
+import asyncio
+
+import numpy as np
+
+from desdeo_problem.Cache import EvaluationCache
+from desdeo_problem.Objective import _ScalarObjective
+from desdeo_problem.Problem import MOProblem
+from desdeo_problem.Variable import VariableSet
+
+
+class CountingEvaluator:
+    def __init__(self):
+        self.n_of_rows = 0
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        self.n_of_rows += x.shape[0]
+        return np.sum(x, axis=1)
+
+
+def counting_problem():
+    evaluator = CountingEvaluator()
+    variables = VariableSet(
+        ["x0", "x1"], lower_bounds=np.zeros(2), upper_bounds=np.ones(2)
+    )
+    problem = MOProblem(
+        [_ScalarObjective("f", evaluator)], variables, cache=EvaluationCache()
+    )
+    return problem, evaluator
+
+
+def test_evaluate_uses_cache():
+    problem, evaluator = counting_problem()
+    x = np.random.default_rng(0).random((5, 2))
+    first = problem.evaluate(x)
+    second = problem.evaluate(np.vstack((x, x[:2])))
+    assert evaluator.n_of_rows == 5
+    np.testing.assert_allclose(second.objectives[:5], first.objectives)
+
+
+def test_evaluate_async_uses_cache():
+    problem, evaluator = counting_problem()
+    x = np.random.default_rng(0).random((5, 2))
+    first = asyncio.run(problem.evaluate_async(x))
+    assert evaluator.n_of_rows == 5
+    second = asyncio.run(problem.evaluate_async(np.vstack((x, x[:2]))))
+    assert evaluator.n_of_rows == 5
+    np.testing.assert_allclose(second.objectives[:5], first.objectives)
+    np.testing.assert_allclose(second.objectives[5:], first.objectives[:2])
+
+
+def test_evaluate_async_shares_cache_with_evaluate():
+    problem, evaluator = counting_problem()
+    rng = np.random.default_rng(0)
+    x, y = rng.random((3, 2)), rng.random((4, 2))
+    problem.evaluate(x)
+    results = asyncio.run(problem.evaluate_async(np.vstack((x, y, y))))
+    assert evaluator.n_of_rows == 7
+    np.testing.assert_allclose(
+        results.objectives[:, 0], np.sum(np.vstack((x, y, y)), axis=1)
+    )
+    assert problem.cache.hits == 3
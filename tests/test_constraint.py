@@ -0,0 +1,235 @@
+import numpy as np
+import pytest
+
+from desdeo_problem.Constraint import (
+    ConstraintBlock,
+    ConstraintError,
+    ScalarConstraint,
+    constraint_function_factory,
+)
+from desdeo_problem.Stats import EvaluationStats
+
+
+def sum_of_variables(x: np.ndarray, f: np.ndarray) -> np.ndarray:
+    return np.sum(x, axis=1)
+
+
+def first_objective(x: np.ndarray, f: np.ndarray) -> np.ndarray:
+    return f[:, 0]
+
+
+def distance_to_origin(x: np.ndarray, f: np.ndarray) -> np.ndarray:
+    return np.sqrt(np.sum(x ** 2, axis=1) + np.sum(f ** 2, axis=1))
+
+
+def variable_times_objective(x: np.ndarray, f: np.ndarray) -> np.ndarray:
+    return 0.5 - x[:, 0] * f[:, 1]
+
+
+def bad_lhs(x: np.ndarray, f: np.ndarray) -> np.ndarray:
+    return x[:, 10]
+
+
+def constraints(n_of_variables: int = 3, n_of_objectives: int = 2):
+    """Constraints made by constraint_function_factory sharing and not sharing
+    their left hand sides, with every operator, interleaved with constraints
+    with plain callables as their evaluators.
+
+    """
+    return [
+        ScalarConstraint(
+            "sum < 1",
+            n_of_variables,
+            n_of_objectives,
+            constraint_function_factory(sum_of_variables, 1.0, "<"),
+        ),
+        ScalarConstraint(
+            "plain", n_of_variables, n_of_objectives, variable_times_objective
+        ),
+        ScalarConstraint(
+            "f1 > 0.2",
+            n_of_variables,
+            n_of_objectives,
+            constraint_function_factory(first_objective, 0.2, ">"),
+        ),
+        ScalarConstraint(
+            "sum > 0.5",
+            n_of_variables,
+            n_of_objectives,
+            constraint_function_factory(sum_of_variables, 0.5, ">"),
+        ),
+        ScalarConstraint(
+            "distance == 1",
+            n_of_variables,
+            n_of_objectives,
+            constraint_function_factory(distance_to_origin, 1.0, "=="),
+        ),
+        ScalarConstraint(
+            "sum == 0.75",
+            n_of_variables,
+            n_of_objectives,
+            constraint_function_factory(sum_of_variables, 0.75, "=="),
+        ),
+        ScalarConstraint(
+            "lambda",
+            n_of_variables,
+            n_of_objectives,
+            lambda x, f: f[:, 1] - x[:, -1],
+        ),
+        ScalarConstraint(
+            "f1 < 0.9",
+            n_of_variables,
+            n_of_objectives,
+            constraint_function_factory(first_objective, 0.9, "<"),
+        ),
+    ]
+
+
+def vectors(n_rows: int, n_of_variables: int = 3, n_of_objectives: int = 2):
+    rng = np.random.default_rng(n_rows)
+    return (rng.random((n_rows, n_of_variables)), rng.random((n_rows, n_of_objectives)))
+
+
+def evaluate_one_by_one(cons, decision_vectors, objective_vectors) -> np.ndarray:
+    """The per-constraint loop ConstraintBlock replaced in MOProblem.evaluate."""
+    constraint_values = np.ndarray((decision_vectors.shape[0], len(cons)))
+    for (col_i, constraint) in enumerate(cons):
+        constraint_values[:, col_i] = np.array(
+            constraint.evaluate(decision_vectors, objective_vectors)
+        )
+    return constraint_values
+
+
+@pytest.mark.parametrize("n_rows", [1, 2, 17])
+def test_block_equals_per_constraint_evaluation(n_rows):
+    cons = constraints()
+    (decision_vectors, objective_vectors) = vectors(n_rows)
+
+    expected = evaluate_one_by_one(cons, decision_vectors, objective_vectors)
+    result = ConstraintBlock(cons).evaluate(decision_vectors, objective_vectors)
+
+    assert result.shape == (n_rows, len(cons))
+    np.testing.assert_array_equal(result, expected)
+    # Each column is the value of the constraint in that position
+    for (col_i, constraint) in enumerate(cons):
+        np.testing.assert_array_equal(
+            result[:, col_i], constraint.evaluate(decision_vectors, objective_vectors)
+        )
+
+
+def test_block_is_column_major():
+    (decision_vectors, objective_vectors) = vectors(5)
+
+    result = ConstraintBlock(constraints()).evaluate(
+        decision_vectors, objective_vectors
+    )
+
+    assert result.flags.f_contiguous
+
+
+def test_block_preserves_the_order_of_the_constraints():
+    cons = constraints()
+    block = ConstraintBlock(cons)
+
+    assert block.constraints == tuple(cons)
+    assert len(block) == len(cons)
+
+    (decision_vectors, objective_vectors) = vectors(7)
+    reversed_cons = cons[::-1]
+    np.testing.assert_array_equal(
+        ConstraintBlock(reversed_cons).evaluate(decision_vectors, objective_vectors),
+        evaluate_one_by_one(reversed_cons, decision_vectors, objective_vectors),
+    )
+
+
+def test_shared_left_hand_side_is_evaluated_once():
+    calls = []
+
+    def counted_sum(x, f):
+        calls.append(x.shape[0])
+        return np.sum(x, axis=1)
+
+    cons = [
+        ScalarConstraint(
+            f"sum {operator} 1",
+            3,
+            2,
+            constraint_function_factory(counted_sum, 1.0, operator),
+        )
+        for operator in ("<", ">", "==")
+    ]
+    (decision_vectors, objective_vectors) = vectors(4)
+
+    result = ConstraintBlock(cons).evaluate(decision_vectors, objective_vectors)
+
+    assert calls == [4]
+    np.testing.assert_array_equal(
+        result, evaluate_one_by_one(cons, decision_vectors, objective_vectors)
+    )
+
+
+def test_block_with_only_plain_constraints():
+    cons = [c for c in constraints() if c.name in ("plain", "lambda")]
+    (decision_vectors, objective_vectors) = vectors(6)
+
+    np.testing.assert_array_equal(
+        ConstraintBlock(cons).evaluate(decision_vectors, objective_vectors),
+        evaluate_one_by_one(cons, decision_vectors, objective_vectors),
+    )
+
+
+@pytest.mark.parametrize(
+    "shapes", [((4, 2), (3, 2)), ((3, 2), (3, 3))], ids=["variables", "objectives"]
+)
+def test_wrong_shapes_raise_as_per_constraint(shapes):
+    # Constraints of different shapes, one of which does not match the vectors
+    cons = [
+        ScalarConstraint(
+            f"sum < {i}",
+            n_of_variables,
+            n_of_objectives,
+            constraint_function_factory(sum_of_variables, float(i), "<"),
+        )
+        for (i, (n_of_variables, n_of_objectives)) in enumerate(shapes)
+    ]
+    (decision_vectors, objective_vectors) = vectors(3)
+
+    with pytest.raises(ConstraintError):
+        evaluate_one_by_one(cons, decision_vectors, objective_vectors)
+    with pytest.raises(ConstraintError):
+        ConstraintBlock(cons).evaluate(decision_vectors, objective_vectors)
+
+
+def test_bad_left_hand_side_raises_as_per_constraint():
+    cons = [
+        ScalarConstraint("bad", 3, 2, constraint_function_factory(bad_lhs, 0.0, "<"))
+    ]
+    (decision_vectors, objective_vectors) = vectors(3)
+
+    with pytest.raises(ConstraintError):
+        evaluate_one_by_one(cons, decision_vectors, objective_vectors)
+    with pytest.raises(ConstraintError):
+        ConstraintBlock(cons).evaluate(decision_vectors, objective_vectors)
+
+
+def test_block_records_stats_for_each_constraint():
+    cons = constraints()
+    stats = EvaluationStats()
+    (decision_vectors, objective_vectors) = vectors(9)
+
+    result = ConstraintBlock(cons).evaluate(
+        decision_vectors, objective_vectors, stats
+    )
+
+    np.testing.assert_array_equal(
+        result, evaluate_one_by_one(cons, decision_vectors, objective_vectors)
+    )
+    assert set(stats.of_kind("constraint")) == {c.name for c in cons}
+    for constraint in cons:
+        timing = stats.get("constraint", constraint.name)
+        assert (timing.calls, timing.rows) == (1, 9)
+    validation = stats.get("validation", "constraint shapes")
+    assert (validation.calls, validation.rows) == (1, 9)
+    # The constraints sharing a left hand side share its time evenly
+    shared = ["sum < 1", "sum > 0.5", "sum == 0.75"]
+    assert len({stats.get("constraint", name).seconds for name in shared}) == 1
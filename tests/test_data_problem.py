@@ -0,0 +1,28 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+
+from desdeo_problem.Problem import DataProblem
+from desdeo_problem.surrogatemodels.lipschitzian import LipschitzianRegressor
+
+
+def data_problem():
+    rng = np.random.default_rng(0)
+    x = rng.random((50, 2))
+    data = pd.DataFrame(
+        np.hstack((x, np.sum(x, axis=1, keepdims=True), x[:, :1] - x[:, 1:])),
+        columns=["x0", "x1", "f0", "f1"],
+    )
+    maximize = pd.DataFrame([[False, False]], columns=["f0", "f1"])
+    return DataProblem(data, ["x0", "x1"], ["f0", "f1"], maximize=maximize)
+
+
+def test_evaluate_async_uses_joint_model():
+    problem = data_problem()
+    problem.train_joint(LipschitzianRegressor)
+    x = np.random.default_rng(1).uniform(0.1, 0.9, (10, 2))
+    expected = problem.evaluate(x, use_surrogate=True)
+    result = asyncio.run(problem.evaluate_async(x, use_surrogate=True))
+    np.testing.assert_allclose(result.objectives, expected.objectives)
+    np.testing.assert_allclose(result.uncertainity, expected.uncertainity)
@@ -0,0 +1,221 @@
+import pickle
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from desdeo_problem.Executor import (
+    ExecutorError,
+    ProcessExecutor,
+    SerialExecutor,
+    ThreadExecutor,
+)
+from desdeo_problem.Objective import (
+    ObjectiveEvaluationResults,
+    VectorDataObjective,
+    VectorObjective,
+    _ScalarDataObjective,
+    _ScalarObjective,
+)
+from desdeo_problem.Problem import MOProblem, _place_results
+from desdeo_problem.Variable import VariableSet
+
+
+def sum_of_variables(x: np.ndarray) -> np.ndarray:
+    return np.sum(x, axis=1)
+
+
+def sum_of_squares(x: np.ndarray) -> np.ndarray:
+    return np.sum(x ** 2, axis=1)
+
+
+def first_and_last(x: np.ndarray) -> np.ndarray:
+    return np.column_stack((x[:, 0], x[:, -1]))
+
+
+def product_of_row(x: np.ndarray) -> float:
+    return float(np.prod(x))
+
+
+def square(value: float) -> float:
+    return value ** 2
+
+
+def variables(n_of_variables: int = 2) -> VariableSet:
+    return VariableSet(
+        [f"x{i}" for i in range(n_of_variables)],
+        lower_bounds=np.zeros(n_of_variables),
+        upper_bounds=np.ones(n_of_variables),
+    )
+
+
+def data_objective(n_of_samples: int = 5) -> _ScalarDataObjective:
+    X = np.random.default_rng(0).random((n_of_samples, 2))
+    data = pd.DataFrame(
+        np.column_stack((X, sum_of_variables(X))), columns=["x0", "x1", "f"]
+    )
+    return _ScalarDataObjective("f", data, evaluator=sum_of_variables)
+
+
+def vector_data_objective(n_of_samples: int = 5) -> VectorDataObjective:
+    X = np.random.default_rng(0).random((n_of_samples, 2))
+    data = pd.DataFrame(
+        np.column_stack((X, first_and_last(X))), columns=["x0", "x1", "g0", "g1"]
+    )
+    return VectorDataObjective(["g0", "g1"], data, evaluator=first_and_last)
+
+
+def all_kinds_of_objectives() -> list:
+    return [
+        _ScalarObjective("scalar", sum_of_squares),
+        VectorObjective(["first", "last"], first_and_last),
+        _ScalarObjective(
+            "row_wise", product_of_row, row_wise=True, executor=SerialExecutor()
+        ),
+        data_objective(),
+        vector_data_objective(),
+    ]
+
+
+def executors() -> list:
+    return [
+        executor_class(n_workers=2, chunk_size=chunk_size)
+        for executor_class in (SerialExecutor, ThreadExecutor, ProcessExecutor)
+        for chunk_size in (None, 1, 3, 7, 20)
+    ]
+
+
+@pytest.mark.parametrize(
+    "n_rows, chunk_size, expected",
+    [
+        (8, None, [(0, 8)]),
+        (8, 3, [(0, 3), (3, 6), (6, 8)]),
+        (6, 3, [(0, 3), (3, 6)]),
+        (2, 3, [(0, 2)]),
+        (0, 3, [(0, 0)]),
+        (5, 1, [(i, i + 1) for i in range(5)]),
+    ],
+)
+def test_chunks(n_rows, chunk_size, expected):
+    chunks = SerialExecutor(chunk_size=chunk_size).chunks(n_rows)
+    assert [(chunk.start, chunk.stop) for chunk in chunks] == expected
+
+
+@pytest.mark.parametrize("arguments", [{"n_workers": 0}, {"chunk_size": 0}])
+def test_bad_arguments(arguments):
+    with pytest.raises(ExecutorError):
+        SerialExecutor(**arguments)
+
+
+@pytest.mark.parametrize("executor_class", [SerialExecutor, ThreadExecutor])
+def test_map_keeps_order(executor_class):
+    def slow_square(value):
+        # The first tasks finish last
+        time.sleep(0.01 * (5 - value))
+        return value ** 2
+
+    with executor_class(n_workers=4) as executor:
+        assert executor.map(slow_square, range(5)) == [0, 1, 4, 9, 16]
+
+
+def test_process_map_keeps_order():
+    with ProcessExecutor(n_workers=2) as executor:
+        assert executor.map(square, range(10)) == [i ** 2 for i in range(10)]
+
+
+def test_map_cancels_after_exception():
+    started = []
+    lock = threading.Lock()
+
+    def task(i):
+        if i == 0:
+            raise ValueError("first task failed")
+        with lock:
+            started.append(i)
+        time.sleep(0.05)
+
+    with ThreadExecutor(n_workers=1) as executor:
+        with pytest.raises(ValueError, match="first task failed"):
+            executor.map(task, range(20))
+    # At most the task picked up before the others were cancelled has run
+    assert len(started) <= 1
+
+
+def test_process_executor_pickles_without_pool():
+    executor = ProcessExecutor(n_workers=2, chunk_size=3)
+    executor.map(square, [1, 2])
+    restored = pickle.loads(pickle.dumps(executor))
+    assert restored._pool is None
+    assert (restored.n_workers, restored.chunk_size) == (2, 3)
+    assert restored.map(square, [3]) == [9]
+    restored.shutdown()
+    executor.shutdown()
+
+
+def test_place_results():
+    objective_vectors = np.zeros((4, 3))
+    uncertainity = np.zeros((4, 3))
+    _place_results(
+        objective_vectors,
+        uncertainity,
+        slice(1, 3),
+        slice(0, 1),
+        ObjectiveEvaluationResults(np.array([1.0, 2.0]), np.array([0.1, 0.2])),
+    )
+    _place_results(
+        objective_vectors,
+        uncertainity,
+        slice(1, 3),
+        slice(1, 3),
+        ObjectiveEvaluationResults(
+            np.array([[3.0, 4.0], [5.0, 6.0]]), np.full((2, 2), np.nan)
+        ),
+    )
+    np.testing.assert_array_equal(
+        objective_vectors, [[0, 0, 0], [1, 3, 4], [2, 5, 6], [0, 0, 0]]
+    )
+    np.testing.assert_array_equal(uncertainity[1:3, 0], [0.1, 0.2])
+    assert np.all(np.isnan(uncertainity[1:3, 1:]))
+    assert np.all(uncertainity[[0, 3]] == 0)
+
+
+@pytest.mark.parametrize(
+    "executor",
+    executors(),
+    ids=lambda executor: f"{type(executor).__name__}-{executor.chunk_size}",
+)
+def test_executors_match_serial_evaluation(executor):
+    x = np.random.default_rng(1).random((13, 2))
+    expected_objectives = all_kinds_of_objectives()
+    expected = MOProblem(expected_objectives, variables()).evaluate(x)
+    objectives = all_kinds_of_objectives()
+    with executor:
+        result = MOProblem(objectives, variables(), executor=executor).evaluate(x)
+    np.testing.assert_array_equal(result.objectives, expected.objectives)
+    np.testing.assert_array_equal(result.fitness, expected.fitness)
+    np.testing.assert_array_equal(result.uncertainity, expected.uncertainity)
+    for objective, expected_objective in zip(objectives[3:], expected_objectives[3:]):
+        np.testing.assert_array_equal(objective.X, expected_objective.X)
+        np.testing.assert_array_equal(objective.y, expected_objective.y)
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [
+        SerialExecutor(),
+        ThreadExecutor(n_workers=2, chunk_size=3),
+        ProcessExecutor(n_workers=2, chunk_size=3),
+    ],
+    ids=["serial", "thread", "process"],
+)
+def test_data_objective_keeps_samples(executor):
+    objective = data_objective()
+    problem = MOProblem([objective], variables(), executor=executor)
+    x = np.random.default_rng(1).random((8, 2))
+    with executor:
+        problem.evaluate(x)
+    assert len(objective.samples) == 13
+    np.testing.assert_allclose(objective.X[5:], x)
+    np.testing.assert_allclose(objective.y[5:], sum_of_variables(x))
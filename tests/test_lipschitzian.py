@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from desdeo_problem.surrogatemodels.lipschitzian import LipschitzianRegressor
+from desdeo_problem.surrogatemodels.SurrogateModels import ModelError
+
+
+def samples():
+    X = np.random.default_rng(0).random((50, 2))
+    return X, np.sum(X, axis=1)
+
+
+def test_fit_estimates_L_by_default():
+    X, y = samples()
+    estimate = LipschitzianRegressor()
+    estimate.fit(X, y)
+    model = LipschitzianRegressor(L=100.0)
+    model.fit(X, y)
+    assert model.L == estimate.L
+    assert model.L == pytest.approx(1.0)
+
+
+def test_fixed_L_is_kept():
+    X, y = samples()
+    model = LipschitzianRegressor(L=100.0, fixed_L=True)
+    model.fit(X, y)
+    model.partial_fit(X[:5] + 0.01, y[:5] + 1.0)
+    assert model.L == 100.0
+
+
+def test_fixed_L_requires_L():
+    with pytest.raises(ModelError):
+        LipschitzianRegressor(fixed_L=True)
@@ -0,0 +1,71 @@
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from desdeo_problem.ModelStore import ModelStore, ModelStoreError
+from desdeo_problem.Problem import ExperimentalProblem
+from desdeo_problem.surrogatemodels.lipschitzian import LipschitzianRegressor
+
+FINGERPRINT = """
+import numpy as np
+from sklearn.gaussian_process import GaussianProcessRegressor
+from sklearn.gaussian_process.kernels import RBF, ConstantKernel
+
+from desdeo_problem.ModelStore import ModelStore
+
+
+class Prior:
+    # The default repr includes the id of the instance
+    def __init__(self, scale):
+        self.scale = scale
+
+
+print(
+    ModelStore.fingerprint(
+        GaussianProcessRegressor,
+        {"kernel": ConstantKernel() * RBF(), "prior": Prior(2.0)},
+        np.arange(6.0).reshape(3, 2),
+        np.arange(3.0),
+    )
+)
+"""
+
+
+def test_fingerprint_is_stable_across_processes():
+    fingerprints = [
+        subprocess.run(
+            [sys.executable, "-c", FINGERPRINT],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for _ in range(2)
+    ]
+    assert fingerprints[0] == fingerprints[1]
+
+
+def test_fingerprint_rejects_unpicklable_parameters():
+    with pytest.raises(ModelStoreError):
+        ModelStore.fingerprint(
+            LipschitzianRegressor, {"L": lambda x: x}, np.ones((2, 1)), np.ones(2)
+        )
+
+
+def test_experimental_problem_trains_with_store(tmp_path):
+    x = np.random.default_rng(0).random((20, 2))
+    data = pd.DataFrame(
+        np.column_stack((x, x.sum(axis=1), x.prod(axis=1))),
+        columns=["x0", "x1", "f0", "f1"],
+    )
+    store = ModelStore(str(tmp_path))
+    problem = ExperimentalProblem(["x0", "x1"], ["f0", "f1"], data=data)
+    problem.train(LipschitzianRegressor, store=store)
+    assert len(list(tmp_path.glob("*.joblib"))) == 2
+
+    restarted = ExperimentalProblem(["x0", "x1"], ["f0", "f1"], data=data)
+    restarted.train(LipschitzianRegressor, store=store)
+    for objective in restarted.objectives:
+        assert isinstance(objective._model.X, np.memmap)
@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from desdeo_problem.Executor import ThreadExecutor
+from desdeo_problem.Objective import VectorDataObjective, _ScalarDataObjective
+from desdeo_problem.Problem import MOProblem
+from desdeo_problem.surrogatemodels.lipschitzian import LipschitzianRegressor
+from desdeo_problem.Variable import VariableSet
+
+
+def sum_of_squares(x: np.ndarray) -> np.ndarray:
+    return np.sum(x ** 2, axis=1)
+
+
+def both_objectives(x: np.ndarray) -> np.ndarray:
+    return np.column_stack((sum_of_squares(x), np.sum(x, axis=1)))
+
+
+def training_data(n_of_samples: int = 50) -> pd.DataFrame:
+    x = np.random.default_rng(0).random((n_of_samples, 2))
+    return pd.DataFrame(
+        np.column_stack((x, both_objectives(x))), columns=["x0", "x1", "f0", "f1"]
+    )
+
+
+def assert_model_matches_samples(model: LipschitzianRegressor, X, y):
+    np.testing.assert_array_equal(model.X, X)
+    np.testing.assert_array_equal(model.y[:, 0], y)
+    fitted = LipschitzianRegressor()
+    fitted.fit(X, y)
+    assert model.L == fitted.L
+
+
+def test_threaded_evaluations_update_model():
+    data = training_data().drop(columns="f1")
+    objective = _ScalarDataObjective("f0", data, evaluator=sum_of_squares)
+    objective.train(LipschitzianRegressor)
+    variables = VariableSet(
+        ["x0", "x1"], lower_bounds=np.zeros(2), upper_bounds=np.ones(2)
+    )
+    x = np.random.default_rng(1).random((200, 2))
+    with ThreadExecutor(n_workers=8, chunk_size=1) as executor:
+        MOProblem([objective], variables, executor=executor).evaluate(x)
+    assert len(objective.samples) == 250
+    assert_model_matches_samples(objective._model, objective.X, objective.y)
+
+
+def test_concurrent_evaluations_of_data_objectives():
+    scalar = _ScalarDataObjective(
+        "f0", training_data().drop(columns="f1"), evaluator=sum_of_squares
+    )
+    scalar.train(LipschitzianRegressor)
+    vector = VectorDataObjective(
+        ["f0", "f1"], training_data(), evaluator=both_objectives
+    )
+    vector.train(LipschitzianRegressor)
+    rows = np.random.default_rng(1).random((200, 1, 2))
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(scalar.evaluate, rows))
+        list(pool.map(vector.evaluate, rows))
+    for objective in (scalar, vector):
+        assert len(objective.samples) == 250
+    assert_model_matches_samples(scalar._model, scalar.X, scalar.y)
+    for column, name in enumerate(vector.name):
+        assert_model_matches_samples(vector._model[name], vector.X, vector.y[:, column])
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from desdeo_problem.testproblems.ParetoFront import (
+    _zdt3_intervals,
+    ideal_and_nadir,
+    pareto_front,
+)
+
+PROBLEMS = (
+    [(f"ZDT{i}", 2) for i in range(1, 7)]
+    + [(f"DTLZ{i}", m) for i in range(1, 8) for m in (2, 3, 5)]
+    + [(f"WFG{i}", m) for i in range(3, 10) for m in (2, 3)]
+    + [(f"LSMOP{i}", m) for i in range(1, 10) for m in (2, 3)]
+)
+
+
+def dominated(front: np.ndarray) -> np.ndarray:
+    """Whether each point is dominated by another point of the front."""
+    no_worse = np.all(front[:, None, :] <= front[None, :, :], axis=2)
+    better = np.any(front[:, None, :] < front[None, :, :], axis=2)
+    return np.any(no_worse & better, axis=0)
+
+
+def phi(position: np.ndarray) -> np.ndarray:
+    return np.sum(position * (1.0 + np.sin(3.0 * np.pi * position)), axis=1)
+
+
+@pytest.mark.parametrize("name, n_of_objectives", PROBLEMS)
+def test_front_is_non_dominated(name, n_of_objectives):
+    front = pareto_front(name, 60, n_of_objectives, cache_directory=None)
+    assert front.shape[1] == n_of_objectives
+    assert len(front) > 1
+    assert not np.any(dominated(front))
+
+
+@pytest.mark.parametrize("name, n_of_objectives", PROBLEMS)
+def test_ideal_and_nadir_bound_front(name, n_of_objectives):
+    front = pareto_front(name, 60, n_of_objectives, cache_directory=None)
+    ideal, nadir = ideal_and_nadir(name, n_of_objectives)
+    assert np.all(ideal <= front.min(axis=0) + 1e-9)
+    assert np.all(front.max(axis=0) <= nadir + 1e-9)
+
+
+@pytest.mark.parametrize("name, n_of_objectives", PROBLEMS)
+def test_front_lies_on_closed_form(name, n_of_objectives):
+    m = n_of_objectives
+    front = pareto_front(name, 60, m, cache_directory=None)
+    f1, f_last = front[:, 0], front[:, -1]
+    if name in ("ZDT1", "ZDT4"):
+        np.testing.assert_allclose(f_last, 1.0 - np.sqrt(f1))
+    elif name == "ZDT2":
+        np.testing.assert_allclose(f_last, 1.0 - f1 ** 2)
+    elif name == "ZDT3":
+        in_interval = (f1[:, None] >= _zdt3_intervals[:, 0]) & (
+            f1[:, None] <= _zdt3_intervals[:, 1]
+        )
+        assert np.all(np.any(in_interval, axis=1))
+        np.testing.assert_allclose(
+            f_last, 1.0 - np.sqrt(f1) - f1 * np.sin(10.0 * np.pi * f1)
+        )
+    elif name == "ZDT5":
+        np.testing.assert_allclose(f1 * f_last, 10.0)
+    elif name == "ZDT6":
+        np.testing.assert_allclose(f_last, 1.0 - f1 ** 2)
+    elif name == "DTLZ1":
+        np.testing.assert_allclose(np.sum(front, axis=1), 0.5)
+    elif name in ("DTLZ7", "LSMOP9"):
+        np.testing.assert_allclose(f_last, 2.0 * m - phi(front[:, :-1]))
+    elif name == "WFG3":
+        # A line from the last extreme point, (0, ..., 0, 2M), to the point where
+        # the first M - 1 objectives are at their maxima
+        nadir = ideal_and_nadir(name, m)[1]
+        t = front[:, 0] / nadir[0]
+        np.testing.assert_allclose(front[:, :-1], t[:, None] * nadir[:-1])
+        np.testing.assert_allclose(f_last, (1.0 - t) * nadir[-1])
+    elif name.startswith("WFG"):
+        scaled = front / (2.0 * np.arange(1, m + 1))
+        np.testing.assert_allclose(np.sum(scaled ** 2, axis=1), 1.0)
+    elif name in ("LSMOP1", "LSMOP2", "LSMOP3", "LSMOP4"):
+        np.testing.assert_allclose(np.sum(front, axis=1), 1.0)
+    else:
+        # DTLZ2-6 and LSMOP5-8
+        np.testing.assert_allclose(np.sum(front ** 2, axis=1), 1.0)
+
+
+def test_front_cache_round_trip(tmp_path):
+    front = pareto_front("DTLZ2", 30, 3, cache_directory=str(tmp_path))
+    assert [cached.name for cached in tmp_path.iterdir()] == ["DTLZ2_3_30.npy"]
+    np.testing.assert_array_equal(np.load(tmp_path / "DTLZ2_3_30.npy"), front)
+    np.testing.assert_array_equal(
+        pareto_front("DTLZ2", 30, 3, cache_directory=str(tmp_path)), front
+    )
+
+    # The cached front is returned instead of sampled again
+    np.save(tmp_path / "DTLZ2_3_30.npy", np.zeros((2, 3)))
+    np.testing.assert_array_equal(
+        pareto_front("DTLZ2", 30, 3, cache_directory=str(tmp_path)), np.zeros((2, 3))
+    )
+
+
+def test_front_cache_directory_is_created(tmp_path):
+    cache_directory = tmp_path / "fronts"
+    front = pareto_front("ZDT1", 10, cache_directory=str(cache_directory))
+    np.testing.assert_array_equal(np.load(cache_directory / "ZDT1_2_10.npy"), front)
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from desdeo_problem.surrogatemodels.sparse_gp import SparseGaussianProcessRegressor
+
+pytestmark = pytest.mark.filterwarnings("ignore::sklearn.exceptions.ConvergenceWarning")
+
+
+def test_fit_noise_free_data():
+    rng = np.random.default_rng(0)
+    X = rng.random((2000, 5))
+    model = SparseGaussianProcessRegressor(
+        n_inducing=200, n_hyperparameter_samples=300, random_state=0
+    )
+    model.fit(X, np.sum(np.sin(3 * X), axis=1))
+    X_new = rng.random((200, 5))
+    mean, std = model.predict(X_new)
+    np.testing.assert_allclose(mean, np.sum(np.sin(3 * X_new), axis=1), atol=0.05)
+    assert np.all(np.isfinite(std))
+
+
+def test_fit_smooth_data_with_little_noise():
+    rng = np.random.default_rng(0)
+    X = rng.random((200, 3))
+    y = np.sum(X ** 2, axis=1)
+    y += 0.01 * y.std() * rng.standard_normal(200)
+    model = SparseGaussianProcessRegressor(n_inducing=50, random_state=0)
+    model.fit(X, y)
+    X_new = rng.random((100, 3))
+    mean, _ = model.predict(X_new)
+    np.testing.assert_allclose(mean, np.sum(X_new ** 2, axis=1), atol=0.05)
@@ -0,0 +1,214 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from desdeo_problem.Constraint import ScalarConstraint, constraint_function_factory
+from desdeo_problem.Executor import SerialExecutor, ThreadExecutor
+from desdeo_problem.Objective import VectorObjective, _ScalarObjective
+from desdeo_problem.Problem import MOProblem
+from desdeo_problem.Stats import EvaluationStats, StatsError, StatsEvent
+from desdeo_problem.Variable import VariableSet
+
+
+def sum_of_variables(x: np.ndarray) -> np.ndarray:
+    return np.sum(x, axis=1)
+
+
+def sum_of_squares(x: np.ndarray) -> np.ndarray:
+    return np.sum(x ** 2, axis=1)
+
+
+def first_and_last(x: np.ndarray) -> np.ndarray:
+    return np.column_stack((x[:, 0], x[:, -1]))
+
+
+def first_objective(x: np.ndarray, f: np.ndarray) -> np.ndarray:
+    return f[:, 0]
+
+
+def last_objective_minus_variable(x: np.ndarray, f: np.ndarray) -> np.ndarray:
+    return f[:, -1] - x[:, 0]
+
+
+N_OF_VARIABLES = 3
+OBJECTIVE_NAMES = ["f1", "f2", "f3, f4"]
+CONSTRAINT_NAMES = ["f1 < 2", "f1 > 0.5", "f4 - x0"]
+
+
+def problem(executor=None, stats=None) -> MOProblem:
+    objectives = [
+        _ScalarObjective("f1", sum_of_variables),
+        _ScalarObjective("f2", sum_of_squares),
+        VectorObjective(["f3", "f4"], first_and_last),
+    ]
+    constraints = [
+        ScalarConstraint(
+            "f1 < 2",
+            N_OF_VARIABLES,
+            4,
+            constraint_function_factory(first_objective, 2.0, "<"),
+        ),
+        ScalarConstraint(
+            "f1 > 0.5",
+            N_OF_VARIABLES,
+            4,
+            constraint_function_factory(first_objective, 0.5, ">"),
+        ),
+        ScalarConstraint("f4 - x0", N_OF_VARIABLES, 4, last_objective_minus_variable),
+    ]
+    variables = VariableSet(
+        [f"x{i}" for i in range(N_OF_VARIABLES)],
+        lower_bounds=np.zeros(N_OF_VARIABLES),
+        upper_bounds=np.ones(N_OF_VARIABLES),
+    )
+    return MOProblem(objectives, variables, constraints, executor=executor, stats=stats)
+
+
+def population(n_rows: int) -> np.ndarray:
+    return np.random.default_rng(n_rows).random((n_rows, N_OF_VARIABLES))
+
+
+def calls_and_rows(events):
+    """Accumulate the events passed to a callback like EvaluationStats does."""
+    summary = {}
+    for event in events:
+        (calls, rows) = summary.get((event.kind, event.name), (0, 0))
+        summary[(event.kind, event.name)] = (calls + 1, rows + event.rows)
+    return summary
+
+
+@pytest.mark.parametrize(
+    ("n_workers", "chunk_size", "n_rows"), [(1, 4, 10), (3, 4, 10), (4, 1, 7)]
+)
+def test_stats_under_thread_executor(n_workers, chunk_size, n_rows):
+    events = []
+    stats = EvaluationStats(callbacks=[events.append])
+    decision_vectors = population(n_rows)
+    expected = problem().evaluate(decision_vectors)
+    n_chunks = -(-n_rows // chunk_size)
+
+    with ThreadExecutor(n_workers=n_workers, chunk_size=chunk_size) as executor:
+        results = problem(executor, stats).evaluate(decision_vectors)
+
+    np.testing.assert_array_equal(results.objectives, expected.objectives)
+    np.testing.assert_array_equal(results.fitness, expected.fitness)
+    np.testing.assert_array_equal(results.constraints, expected.constraints)
+
+    # Each objective is timed once for each chunk of the population
+    assert set(stats.of_kind("objective")) == set(OBJECTIVE_NAMES)
+    for name in OBJECTIVE_NAMES:
+        timing = stats.get("objective", name)
+        assert (timing.calls, timing.rows) == (n_chunks, n_rows)
+        assert timing.seconds >= 0.0
+    assert set(stats.of_kind("constraint")) == set(CONSTRAINT_NAMES)
+    for name in CONSTRAINT_NAMES:
+        timing = stats.get("constraint", name)
+        assert (timing.calls, timing.rows) == (1, n_rows)
+    for (kind, name) in [
+        ("evaluate", "evaluate"),
+        ("validation", "decision vectors"),
+        ("validation", "constraint shapes"),
+    ]:
+        timing = stats.get(kind, name)
+        assert (timing.calls, timing.rows) == (1, n_rows)
+    assert stats.of_kind("surrogate") == {}
+
+    # The callbacks were passed every measurement, and only those
+    assert all(isinstance(event, StatsEvent) for event in events)
+    assert {event.kind for event in events} == {
+        "evaluate",
+        "validation",
+        "objective",
+        "constraint",
+    }
+    assert calls_and_rows(events) == {
+        (kind, name): (timing["calls"], timing["rows"])
+        for (kind, timings) in stats.to_dict().items()
+        for (name, timing) in timings.items()
+    }
+    assert sum(event.seconds for event in events if event.kind == "objective") == (
+        pytest.approx(stats.total_seconds("objective"))
+    )
+
+
+def test_stats_accumulate_over_evaluations():
+    stats = EvaluationStats()
+
+    with ThreadExecutor(n_workers=2, chunk_size=3) as executor:
+        moproblem = problem(executor, stats)
+        moproblem.evaluate(population(6))
+        moproblem.evaluate(population(4))
+
+    for name in OBJECTIVE_NAMES:
+        timing = stats.get("objective", name)
+        assert (timing.calls, timing.rows) == (4, 10)
+    assert stats.get("evaluate", "evaluate").calls == 2
+
+    frame = stats.to_dataframe()
+    # The objectives, the constraints, evaluate and the two validation steps
+    assert len(frame) == len(OBJECTIVE_NAMES) + len(CONSTRAINT_NAMES) + 3
+    np.testing.assert_allclose(frame["mean_seconds"], frame["seconds"] / frame["calls"])
+
+    stats.reset()
+    assert stats.to_dict() == {}
+
+
+def test_stats_of_evaluate_async():
+    events = []
+    stats = EvaluationStats(callbacks=[events.append])
+    decision_vectors = population(5)
+    expected = problem().evaluate(decision_vectors)
+
+    results = asyncio.run(
+        problem(SerialExecutor(), stats).evaluate_async(
+            decision_vectors, max_concurrency=2
+        )
+    )
+
+    np.testing.assert_array_equal(results.objectives, expected.objectives)
+    np.testing.assert_array_equal(results.constraints, expected.constraints)
+    assert stats.get("evaluate", "evaluate_async").calls == 1
+    for name in OBJECTIVE_NAMES:
+        assert stats.get("objective", name).rows == 5
+    for name in CONSTRAINT_NAMES:
+        assert stats.get("constraint", name).rows == 5
+    assert len(events) == sum(
+        timing["calls"]
+        for timings in stats.to_dict().values()
+        for timing in timings.values()
+    )
+
+
+def test_no_stats_are_recorded_without_stats():
+    moproblem = problem()
+    moproblem.evaluate(population(3))
+
+    assert moproblem.stats is None
+
+    stats = EvaluationStats()
+    moproblem.stats = stats
+    moproblem.evaluate(population(3))
+
+    assert stats.get("evaluate", "evaluate").calls == 1
+
+
+def test_callbacks_can_be_removed():
+    events = []
+    stats = EvaluationStats()
+    stats.add_callback(events.append)
+    stats.record("objective", "f1", 0.5, 2)
+    stats.remove_callback(events.append)
+    stats.record("objective", "f1", 0.25, 3)
+
+    assert events == [StatsEvent("objective", "f1", 0.5, 2)]
+    timing = stats.get("objective", "f1")
+    assert (timing.calls, timing.rows, timing.seconds) == (2, 5, 0.75)
+    assert timing.mean_seconds == 0.375
+    with pytest.raises(StatsError):
+        stats.remove_callback(events.append)
+
+
+def test_unknown_kind_raises():
+    with pytest.raises(StatsError):
+        EvaluationStats().record("unknown", "f1", 0.1, 1)
@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+from optproblems import dtlz, wfg, zdt
+
+from desdeo_problem.testproblems import DTLZ, LSMOP, WFG, ZDT
+
+
+def reference(problem, x: np.ndarray) -> np.ndarray:
+    return np.array([problem(list(row)) for row in x])
+
+
+@pytest.mark.parametrize("name", ["zdt1", "zdt2", "zdt3", "zdt6"])
+def test_zdt_matches_optproblems(name):
+    x = np.random.default_rng(0).random((20, 10))
+    expected = reference(getattr(zdt, name.upper())(num_variables=10), x)
+    np.testing.assert_allclose(getattr(ZDT, name)(x), expected, rtol=1e-10)
+
+
+def test_zdt4_matches_optproblems():
+    x = np.random.default_rng(0).uniform(-5.0, 5.0, (20, 10))
+    x[:, 0] = np.random.default_rng(1).random(20)
+    expected = reference(zdt.ZDT4(num_variables=10), x)
+    np.testing.assert_allclose(ZDT.zdt4(x), expected, rtol=1e-10)
+
+
+def test_zdt5_matches_optproblems():
+    bits = np.random.default_rng(0).integers(0, 2, (20, 80))
+    problem = zdt.ZDT5()
+    expected = [
+        problem(
+            [list(row[:30])] + [list(row[i : i + 5]) for i in range(30, 80, 5)]
+        )
+        for row in bits
+    ]
+    np.testing.assert_allclose(ZDT.zdt5(bits.astype(float)), expected)
+
+
+@pytest.mark.parametrize("n_of_objectives", [2, 3, 5])
+@pytest.mark.parametrize("number", range(1, 8))
+def test_dtlz_matches_optproblems(number, n_of_objectives):
+    n_of_variables = n_of_objectives + 9
+    x = np.random.default_rng(number).random((20, n_of_variables))
+    problem = getattr(dtlz, f"DTLZ{number}")(n_of_objectives, n_of_variables)
+    result = getattr(DTLZ, f"dtlz{number}")(x, n_of_objectives)
+    np.testing.assert_allclose(result, reference(problem, x), rtol=1e-9, atol=1e-11)
+
+
+@pytest.mark.parametrize("n_of_objectives, k", [(2, 4), (3, 4)])
+@pytest.mark.parametrize("number", range(1, 10))
+def test_wfg_matches_optproblems(number, n_of_objectives, k):
+    n_of_variables = k + 10
+    upper_bounds = 2.0 * np.arange(1, n_of_variables + 1)
+    z = np.random.default_rng(number).random((20, n_of_variables)) * upper_bounds
+    problem = getattr(wfg, f"WFG{number}")(n_of_objectives, n_of_variables, k)
+    result = getattr(WFG, f"wfg{number}")(z, n_of_objectives, k)
+    np.testing.assert_allclose(result, reference(problem, z), rtol=1e-9, atol=1e-11)
+
+
+ROSENBROCK_ODD = {3: False, 6: True, 7: False}
+ROSENBROCK_EVEN = {3: True, 6: False, 7: True}
+
+
+def lsmop_optimum(
+    number: int, n_of_variables: int, n_of_objectives: int, nk: int = 5
+) -> np.ndarray:
+    """Pareto optimal solutions of an LSMOP problem: the linked distance variables
+    are at the minimum of the basic function of their objective, 0 or 1 for the
+    Rosenbrock function.
+
+    """
+    m = n_of_objectives
+    rng = np.random.default_rng(number)
+    x = np.zeros((20, n_of_variables))
+    # Small enough for the distance variables to stay in [0, 10]
+    x[:, : m - 1] = rng.uniform(0.0, 0.9, (20, m - 1))
+    sizes = LSMOP.subcomponent_sizes(n_of_variables, m, nk)
+    n = m - 1 + nk * np.sum(sizes)
+    index = np.arange(m, n + 1) / n
+    if number <= 4:
+        scale = 1.0 + index
+    else:
+        scale = 1.0 + np.cos(index * np.pi / 2.0)
+    target = np.zeros(n - m + 1)
+    start = 0
+    for i, size in enumerate(sizes):
+        rosenbrock = (ROSENBROCK_ODD if i % 2 == 0 else ROSENBROCK_EVEN).get(number)
+        target[start : start + nk * size] = 1.0 if rosenbrock else 0.0
+        start += nk * size
+    x[:, m - 1 : n] = (target + 10.0 * x[:, :1]) / scale
+    x[:, n:] = rng.uniform(0.0, 10.0, (20, n_of_variables - n))
+    return x
+
+
+@pytest.mark.parametrize("n_of_objectives", [2, 3, 5])
+@pytest.mark.parametrize("number", range(1, 10))
+def test_lsmop_optimum_lies_on_front(number, n_of_objectives):
+    n_of_variables = 100 * n_of_objectives + 3
+    x = lsmop_optimum(number, n_of_variables, n_of_objectives)
+    assert np.all(x >= 0.0) and np.all(x[:, n_of_objectives - 1 :] <= 10.0)
+    f = getattr(LSMOP, f"lsmop{number}")(x, n_of_objectives)
+    position = x[:, : n_of_objectives - 1]
+    if number <= 4:
+        np.testing.assert_allclose(np.sum(f, axis=1), 1.0)
+    elif number <= 8:
+        np.testing.assert_allclose(np.sum(f ** 2, axis=1), 1.0)
+    else:
+        np.testing.assert_allclose(f[:, :-1], position)
+        phi = position * (1.0 + np.sin(3.0 * np.pi * position))
+        np.testing.assert_allclose(
+            f[:, -1], 2.0 * n_of_objectives - np.sum(phi, axis=1)
+        )
+
+    # Moving the distance variables away from the optimum moves the points away
+    # from the front
+    x[:, n_of_objectives - 1] += 0.5
+    worse = getattr(LSMOP, f"lsmop{number}")(x, n_of_objectives)
+    assert np.all(worse[:, -1] > f[:, -1]) or np.all(
+        np.sum(worse, axis=1) > np.sum(f, axis=1)
+    )
+
+
+def test_lsmop_subcomponent_sizes():
+    sizes = LSMOP.subcomponent_sizes(300, 3, 5)
+    assert sizes.shape == (3,)
+    assert np.all(sizes > 0)
+    assert 3 - 1 + 5 * np.sum(sizes) <= 300